@@ -17,41 +17,43 @@ Pipeline Flow:
 
 import os
 import sys
-from typing import TypedDict, List, Dict, Annotated, Literal
+import asyncio
+import hashlib
+import logging
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import orjson
+from typing import TYPE_CHECKING, TypedDict, List, Dict, Annotated, Literal, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 
-# Fix Windows console encoding for emoji support
-if sys.platform == 'win32':
-    try:
-        sys.stdout.reconfigure(encoding='utf-8')
-    except:
-        pass
-
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-# LangGraph imports
-from langgraph.graph import StateGraph, END
-from langchain_groq import ChatGroq
-
-# For graph visualization
-try:
-    from IPython.display import Image, display
-    IPYTHON_AVAILABLE = True
-except ImportError:
-    IPYTHON_AVAILABLE = False
+# LangGraph, the service classes (composio, groq) and numpy are imported where
+# they are first used, so importing this module for the CLI or tests stays fast
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
+    from src.utils.linkedin_enricher import LinkedInEnricher
 
 # Import our modules from src/
-from src.utils.auto_gmail_monitor import AutoGmailMonitor
-from src.utils.pdf_extractor import PDFExtractor
-from src.utils.linkedin_enricher import LinkedInEnricher
-from src.utils.candidate_scorer import CandidateScorer, DEFAULT_CRITERIA
-from src.utils.interview_scheduler import InterviewScheduler
-from src.utils.google_sheets_manager import GoogleSheetsManager
-from src.agents.recruitment_agent import RecruitmentAgent
+from src.utils.candidate_cache import criteria_sha256, file_sha256, get_candidate_cache
+from src.utils.clients import (
+    get_gmail_monitor,
+    get_extractor,
+    get_enricher,
+    get_scorer,
+    get_scheduler,
+    get_sheets_manager,
+    get_agent
+)
+from src.utils.http_pool import run_async
+from src.utils.logging_setup import configure_logging
 from src.config.legacy_config import GROQ_API_KEY, GROQ_MODEL
 
+logger = logging.getLogger(__name__)
+
 load_dotenv()
 
 
@@ -65,6 +67,7 @@ class RecruitmentState(TypedDict):
     check_gmail: bool
     max_emails: int
     min_score_threshold: float
+    extract_workers: Optional[int]  # Processes for PDF text extraction
     
     # Data collected through pipeline
     email_messages: List[Dict]
@@ -87,183 +90,372 @@ class RecruitmentState(TypedDict):
     json_file: str
     calendar_links: List[str]  # Individual calendar event links
     
+    # Errors from the parallel export branches (each appends, so no write conflicts)
+    export_errors: Annotated[List[str], operator.add]
+    
     # Status
     status: str
     errors: List[str]
 
 
+# ============================================================================
+# NODE CACHE (replays on unchanged inputs skip extraction, enrichment, scoring)
+# ============================================================================
+
+NODE_CACHE_TTL = 24 * 3600  # seconds
+
+# Part of every node cache key; bumped whenever a cached node fails or skips
+# work, so a degraded result is never replayed (the entry can't be hit again)
+_node_cache_epoch = 0
+
+
+def _invalidate_node_cache() -> None:
+    global _node_cache_epoch
+    _node_cache_epoch += 1
+
+
+def _cache_key(*parts) -> str:
+    payload = orjson.dumps([_node_cache_epoch, *parts], default=str,
+                           option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _resume_files() -> List[tuple]:
+    """(name, size, mtime) of every resume the extractor would read"""
+    from src.utils.pdf_extractor import SUPPORTED_PATTERNS
+    
+    input_dir = get_extractor().input_dir
+    files = []
+    for pattern in SUPPORTED_PATTERNS:
+        for path in input_dir.glob(pattern):
+            stat = path.stat()
+            files.append((path.name, stat.st_size, stat.st_mtime_ns))
+    return sorted(files)
+
+
+def _extract_cache_key(state: RecruitmentState) -> str:
+    return _cache_key(_resume_files())
+
+
+def _enrich_cache_key(state: RecruitmentState) -> str:
+    return _cache_key(state.get("extracted_candidates", []))
+
+
+def _score_cache_key(state: RecruitmentState) -> str:
+    from src.utils.candidate_scorer import DEFAULT_CRITERIA
+    return _cache_key(state.get("enriched_candidates", []), state.get("min_score_threshold", 6.0),
+                      criteria_sha256(DEFAULT_CRITERIA))
+
+
 # ============================================================================
 # PIPELINE NODES (Each represents a modular component)
 # ============================================================================
 
-def gmail_monitor_node(state: RecruitmentState) -> RecruitmentState:
+async def gmail_monitor_node(state: RecruitmentState) -> Dict:
     """Node 1: Monitor Gmail for resume attachments"""
-    print("\n" + "="*60)
-    print("📧 STEP 1: Gmail Monitoring")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("📧 STEP 1: Gmail Monitoring")
+    logger.info("="*60)
     
     if not state.get("check_gmail", True):
-        print("⏭️  Skipping Gmail check")
-        return {**state, "email_messages": [], "status": "gmail_skipped"}
+        logger.info("⏭️  Skipping Gmail check")
+        return {"email_messages": [], "status": "gmail_skipped"}
     
     try:
         # Initialize Gmail monitor
-        gmail = AutoGmailMonitor()
+        gmail = get_gmail_monitor()
         
         # Auto-monitor and download attachments
-        downloaded = gmail.auto_monitor_and_download(max_emails=state.get("max_emails", 10))
+        downloaded = await gmail.aauto_monitor_and_download(max_emails=state.get("max_emails", 10))
         
-        print(f"📥 Downloaded {len(downloaded)} resume(s)")
+        logger.info("📥 Downloaded %s resume(s)", len(downloaded))
         
         return {
-            **state,
             "email_messages": [],  # Not needed for this flow
             "downloaded_files": downloaded,
             "status": "gmail_complete"
         }
         
     except Exception as e:
-        print(f"❌ Gmail monitoring failed: {str(e)}")
-        errors = state.get("errors", [])
-        errors.append(f"Gmail: {str(e)}")
-        return {**state, "errors": errors, "status": "gmail_failed"}
+        logger.error("❌ Gmail monitoring failed: %s", e)
+        return {"errors": state.get("errors", []) + [f"Gmail: {str(e)}"], "status": "gmail_failed"}
 
 
-def extract_resumes_node(state: RecruitmentState) -> RecruitmentState:
+async def extract_resumes_node(state: RecruitmentState) -> Dict:
     """Node 2: Extract & parse resume data"""
-    print("\n" + "="*60)
-    print("📄 STEP 2: Resume Extraction & Parsing")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("📄 STEP 2: Resume Extraction & Parsing")
+    logger.info("="*60)
     
     try:
-        extractor = PDFExtractor()
-        candidates = extractor.extract_from_directory()
+        extractor = get_extractor()
+        candidates = await extractor.aextract_from_directory(workers=state.get("extract_workers"))
         
-        print(f"✅ Extracted {len(candidates)} candidate(s)")
+        # Fingerprint each resume so later stages can reuse earlier runs' results
+        for candidate in candidates:
+            source_path = extractor.input_dir / candidate.get('source_file', '')
+            if source_path.is_file():
+                candidate['_cached_hash'] = file_sha256(source_path)
+        
+        logger.info("✅ Extracted %s candidate(s)", len(candidates))
+        if len(candidates) < len(_resume_files()):
+            _invalidate_node_cache()  # some resumes failed; retry them next run
         
         return {
-            **state,
             "extracted_candidates": candidates,
             "status": "extraction_complete"
         }
         
     except Exception as e:
-        print(f"❌ Extraction failed: {str(e)}")
-        errors = state.get("errors", [])
-        errors.append(f"Extraction: {str(e)}")
-        return {**state, "errors": errors, "status": "extraction_failed"}
+        _invalidate_node_cache()
+        logger.error("❌ Extraction failed: %s", e)
+        return {"errors": state.get("errors", []) + [f"Extraction: {str(e)}"], "status": "extraction_failed"}
+
 
+# Output files are written off the node's critical path; final_report waits for them
+_file_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="output-writer")
+_pending_writes = []
 
-def try_linkedin_enrichment_node(state: RecruitmentState) -> RecruitmentState:
+
+def _write_in_background(path: str, data: bytes) -> None:
+    """Queue `data` to be written to `path` on the writer thread"""
+    def write():
+        with open(path, 'wb') as f:
+            f.write(data)
+    _pending_writes.append(_file_writer.submit(write))
+
+
+def _wait_for_writes() -> List[str]:
+    """Block until queued output files are on disk; returns any write errors"""
+    errors = []
+    while _pending_writes:
+        try:
+            _pending_writes.pop(0).result()
+        except OSError as e:
+            errors.append(f"Output write: {e}")
+    return errors
+
+
+# Max in-flight LinkedIn API calls (LinkedIn allows roughly 10 requests per 10s window)
+ENRICH_CONCURRENCY = 8
+# Candidates whose LinkedIn fields are generated per LLM call
+ENRICH_BATCH_SIZE = 8
+
+
+async def _enrich_concurrently(enricher: "LinkedInEnricher", candidates: List[Dict]) -> List:
+    """Enrich candidates concurrently (AI fields in batched calls), preserving input order"""
+    return await enricher.aenrich_candidates(candidates, ENRICH_BATCH_SIZE, ENRICH_CONCURRENCY)
+
+
+def _enrichment_key(candidate: Dict):
+    """Dedup key: LinkedIn URL, else (email, name); None if neither is known"""
+    linkedin_url = str(candidate.get('linkedin_url', '')).strip().rstrip('/').lower()
+    if linkedin_url:
+        return linkedin_url
+    email = str(candidate.get('email', '')).strip().lower()
+    name = str(candidate.get('name', candidate.get('full_name', ''))).strip()
+    return (email, name) if email or name else None
+
+
+def _broadcast_enrichment(leader: Dict, enriched, member: Dict):
+    """Apply the fields enrichment added/changed on the leader to a duplicate"""
+    if isinstance(enriched, Exception):
+        return enriched
+    delta = {k: v for k, v in enriched.items() if leader.get(k) != v}
+    return {**member, **delta}
+
+
+async def try_linkedin_enrichment_node(state: RecruitmentState) -> Dict:
     """Node 3: LinkedIn API + LLM Enrichment (Dual Strategy)"""
-    print("\n" + "="*60)
-    print("🔗 STEP 3: LinkedIn Enrichment (API + LLM Fallback)")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("🔗 STEP 3: LinkedIn Enrichment (API + LLM Fallback)")
+    logger.info("="*60)
     
     try:
         candidates = state.get("extracted_candidates", [])
         
         if not candidates:
-            print("⚠️  No candidates to enrich")
-            return {**state, "enriched_candidates": [], "status": "no_candidates"}
+            logger.warning("⚠️  No candidates to enrich")
+            return {"enriched_candidates": [], "status": "no_candidates"}
         
-        enricher = LinkedInEnricher()
+        cache = get_candidate_cache()
         enriched = []
+        failures = []
+        
+        # Resumes enriched in an earlier run are taken from the cache
+        results = [cache.get_enriched(c['_cached_hash']) if c.get('_cached_hash') else None
+                   for c in candidates]
+        misses = [i for i, r in enumerate(results) if r is None]
+        if len(misses) < len(candidates):
+            logger.info("♻️  Reusing cached enrichment for %s candidate(s)", len(candidates) - len(misses))
+        
+        # Enrichment is network-bound (LinkedIn API + LLM), so run candidates concurrently
+        if misses:
+            enricher = get_enricher()
+            pending = [candidates[i] for i in misses]
+            
+            # Resubmitted resumes of the same person share one enrichment call
+            groups = {}
+            for pos, candidate in enumerate(pending):
+                key = _enrichment_key(candidate)
+                groups.setdefault(key if key is not None else object(), []).append(pos)
+            leaders = [pending[members[0]] for members in groups.values()]
+            if len(leaders) < len(pending):
+                logger.info("🔁 %s duplicate candidate(s) share an enrichment", len(pending) - len(leaders))
+            
+            leader_results = await _enrich_concurrently(enricher, leaders)
+            
+            fresh = [None] * len(pending)
+            for members, leader, enriched_candidate in zip(groups.values(), leaders, leader_results):
+                fresh[members[0]] = enriched_candidate
+                for pos in members[1:]:
+                    fresh[pos] = _broadcast_enrichment(leader, enriched_candidate, pending[pos])
+            
+            for i, enriched_candidate in zip(misses, fresh):
+                results[i] = enriched_candidate
+                if candidates[i].get('_cached_hash') and not isinstance(enriched_candidate, Exception):
+                    cache.set_enriched(candidates[i]['_cached_hash'], enriched_candidate)
         
-        for candidate in candidates:
+        for candidate, enriched_candidate in zip(candidates, results):
             name = candidate.get('name', candidate.get('full_name', 'Unknown'))
-            print(f"\n🔗 Enriching: {name}")
+            logger.info("\n🔗 Enriched: %s", name)
             
-            # Enrich with dual strategy (LinkedIn API attempt + LLM enrichment)
-            enriched_candidate = enricher.enrich_candidate_profile(candidate)
+            if isinstance(enriched_candidate, Exception):
+                logger.error("   ❌ Enrichment failed: %s", enriched_candidate)
+                _invalidate_node_cache()
+                failures.append(f"Enrichment ({name}): {enriched_candidate}")
+                enriched_candidate = candidate  # Keep original
             
             # Check what enrichment source was used
             linkedin_source = enriched_candidate.get('linkedin_source', 'unknown')
             
             if linkedin_source == 'api_verified':
-                print(f"   ✅ Enriched with: LinkedIn API (verified) + LLM")
+                logger.info("   ✅ Enriched with: LinkedIn API (verified) + LLM")
                 enriched_candidate['enrichment_source'] = 'linkedin_api_verified'
             elif linkedin_source == 'api_unverified':
-                print(f"   ✅ Enriched with: LinkedIn API (unverified) + LLM")
+                logger.info("   ✅ Enriched with: LinkedIn API (unverified) + LLM")
                 enriched_candidate['enrichment_source'] = 'linkedin_api_partial'
             elif linkedin_source == 'llm_fallback':
-                print(f"   ✅ Enriched with: LLM only (LinkedIn API failed)")
+                logger.info("   ✅ Enriched with: LLM only (LinkedIn API failed)")
                 enriched_candidate['enrichment_source'] = 'llm_fallback'
             else:
-                print(f"   ✅ Enriched with: LLM only (no LinkedIn URL)")
+                logger.info("   ✅ Enriched with: LLM only (no LinkedIn URL)")
                 enriched_candidate['enrichment_source'] = 'llm_only'
             
             enriched.append(enriched_candidate)
         
-        print(f"\n✅ Enriched {len(enriched)} candidate(s)")
+        logger.info("\n✅ Enriched %s candidate(s)", len(enriched))
         
         # Save enriched data to output folder
         os.makedirs("output", exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         json_file = os.path.join("output", f"enhanced_candidates_{timestamp}.json")
         
-        import json
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(enriched, f, indent=2, ensure_ascii=False)
+        # Serialize now (later nodes add fields to these dicts), write while scoring runs
+        _write_in_background(
+            json_file, orjson.dumps(enriched, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
         
-        print(f"💾 Saved to {json_file}")
+        logger.info("💾 Saving to %s", json_file)
         
-        return {
-            **state,
+        result = {
             "enriched_candidates": enriched,
             "json_file": json_file,
             "status": "enrichment_complete"
         }
+        # One candidate failing doesn't stop the run; it's reported in the final summary
+        if failures:
+            result["errors"] = state.get("errors", []) + failures
+        return result
         
     except Exception as e:
-        print(f"❌ Enrichment failed: {str(e)}")
-        errors = state.get("errors", [])
-        errors.append(f"Enrichment: {str(e)}")
-        return {**state, "errors": errors, "status": "enrichment_failed"}
+        _invalidate_node_cache()
+        logger.error("❌ Enrichment failed: %s", e)
+        return {"errors": state.get("errors", []) + [f"Enrichment: {str(e)}"], "status": "enrichment_failed"}
+
 
+# Candidates scored per LLM call
+SCORE_BATCH_SIZE = 10
 
-def score_candidates_node(state: RecruitmentState) -> RecruitmentState:
+
+async def score_candidates_node(state: RecruitmentState) -> Dict:
     """Node 4: Score candidates with AI and make selection decision"""
-    print("\n" + "="*60)
-    print("📊 STEP 4: Candidate Scoring & Selection")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("📊 STEP 4: Candidate Scoring & Selection")
+    logger.info("="*60)
+    
+    import numpy as np
+    from src.utils.candidate_scorer import DEFAULT_CRITERIA, SCORE_SOURCE_LLM, SCORE_SOURCE_PREFILTER
     
     try:
         candidates = state.get("enriched_candidates", [])
         
         if not candidates:
-            print("⚠️  No candidates to score")
-            return {**state, "scored_candidates": [], "status": "no_candidates"}
+            logger.warning("⚠️  No candidates to score")
+            return {"scored_candidates": [], "status": "no_candidates"}
         
-        scorer = CandidateScorer()
+        cache = get_candidate_cache()
         min_score = state.get("min_score_threshold", 6.0)
         
-        # Score each candidate individually and categorize
-        shortlisted = []
-        rejected = []
-        
-        for candidate in candidates:
-            score_result = scorer.score_single_candidate(candidate, DEFAULT_CRITERIA)
-            candidate.update(score_result)
+        # Resumes scored in an earlier run (same criteria) are taken from the cache
+        results = [cache.get_score(c['_cached_hash'], DEFAULT_CRITERIA) if c.get('_cached_hash') else None
+                   for c in candidates]
+        misses = [i for i, r in enumerate(results) if r is None]
+        if len(misses) < len(candidates):
+            logger.info("♻️  Reusing cached scores for %s candidate(s)", len(candidates) - len(misses))
+        
+        # Score the rest in batched AI calls, then categorize
+        if misses:
+            pending = [candidates[i] for i in misses]
+            scorer = get_scorer()
             
-            name = candidate.get('name', candidate.get('full_name', 'Unknown'))
-            score = score_result.get('score', 0)
+            # Opt-in screen (SCORE_PREFILTER_THRESHOLD > 0): low embedding similarity skips the LLM
+            relevant = await asyncio.to_thread(scorer.prefilter_candidates, pending, DEFAULT_CRITERIA)
+            fresh = [{"score": 0.0, "rationale": "Low semantic similarity to the role criteria",
+                      "score_source": SCORE_SOURCE_PREFILTER} for _ in pending]
+            to_score = np.flatnonzero(relevant)
+            if len(to_score) < len(pending):
+                filtered = [pending[j].get('name', pending[j].get('full_name', 'Unknown'))
+                            for j in np.flatnonzero(~relevant)]
+                logger.warning("⚠️ Pre-filter: %s candidate(s) auto-scored 0 without an LLM call (low similarity): %s",
+                               len(filtered), ", ".join(filtered))
+            if len(to_score):
+                # Several batches stay in flight together; SCORE_MODE=auto/heuristic
+                # settles clear cases against min_score without the LLM
+                scored = await scorer.ascore_candidates_batch(
+                    [pending[j] for j in to_score], DEFAULT_CRITERIA, SCORE_BATCH_SIZE, min_score=min_score
+                )
+                for j, score_result in zip(to_score, scored):
+                    fresh[j] = score_result
             
-            print(f"📊 {name}: {score}/10")
-            
-            # Decision logic
-            if score >= min_score:
-                print(f"   ✅ SHORTLISTED (Score >= {min_score})")
-                shortlisted.append(candidate)
+            # Only real LLM scores are kept; heuristic fallbacks (Groq failed or
+            # rate limited) and pre-filter zeros are re-scored next run
+            for i, score_result in zip(misses, fresh):
+                results[i] = score_result
+                if candidates[i].get('_cached_hash') and score_result.get('score_source') == SCORE_SOURCE_LLM:
+                    cache.set_score(candidates[i]['_cached_hash'], DEFAULT_CRITERIA,
+                                    score_result.get('score', 0), score_result.get('rationale', ''))
+        for candidate, score_result in zip(candidates, results):
+            candidate.update(score_result)
+        
+        # Decision logic: one vectorized threshold pass over all scores
+        scores = np.fromiter((r.get('score', 0) for r in results), dtype=np.float32, count=len(results))
+        mask = scores >= min_score
+        shortlisted = [candidates[i] for i in np.flatnonzero(mask)]
+        rejected = [candidates[i] for i in np.flatnonzero(~mask)]
+        
+        for candidate, selected in zip(candidates, mask):
+            name = candidate.get('name', candidate.get('full_name', 'Unknown'))
+            logger.info("📊 %s: %s/10", name, candidate.get('score', 0))
+            if selected:
+                logger.info("   ✅ SHORTLISTED (Score >= %s)", min_score)
             else:
-                print(f"   ❌ REJECTED (Score < {min_score})")
-                rejected.append(candidate)
+                logger.info("   ❌ REJECTED (Score < %s)", min_score)
         
-        print(f"\n✅ Shortlisted: {len(shortlisted)}/{len(candidates)} candidates")
-        print(f"❌ Rejected: {len(rejected)}/{len(candidates)} candidates")
+        logger.info("\n✅ Shortlisted: %s/%s candidates", len(shortlisted), len(candidates))
+        logger.info("❌ Rejected: %s/%s candidates", len(rejected), len(candidates))
         
         return {
-            **state,
             "scored_candidates": candidates,
             "shortlisted_candidates": shortlisted,
             "rejected_candidates": rejected,
@@ -271,43 +463,39 @@ def score_candidates_node(state: RecruitmentState) -> RecruitmentState:
         }
         
     except Exception as e:
-        print(f"❌ Scoring failed: {str(e)}")
-        errors = state.get("errors", [])
-        errors.append(f"Scoring: {str(e)}")
-        return {**state, "errors": errors, "status": "scoring_failed"}
+        _invalidate_node_cache()
+        logger.error("❌ Scoring failed: %s", e)
+        return {"errors": state.get("errors", []) + [f"Scoring: {str(e)}"], "status": "scoring_failed"}
 
 
-def schedule_interviews_node(state: RecruitmentState) -> RecruitmentState:
+async def schedule_interviews_node(state: RecruitmentState) -> Dict:
     """Node 5: Schedule interviews ONLY for shortlisted candidates"""
-    print("\n" + "="*60)
-    print("📅 STEP 5: Interview Scheduling (Shortlisted Only)")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("📅 STEP 5: Interview Scheduling (Shortlisted Only)")
+    logger.info("="*60)
     
     try:
         shortlisted = state.get("shortlisted_candidates", [])
         
         if not shortlisted:
-            print("⚠️  No shortlisted candidates to schedule")
-            return {**state, "scheduled_candidates": [], "status": "no_shortlisted"}
+            logger.warning("⚠️  No shortlisted candidates to schedule")
+            return {"scheduled_candidates": [], "status": "no_shortlisted"}
         
-        print(f"📅 Scheduling interviews for {len(shortlisted)} shortlisted candidate(s)")
+        logger.info("📅 Scheduling interviews for %s shortlisted candidate(s)", len(shortlisted))
         
-        scheduler = InterviewScheduler()
-        scheduled = scheduler.schedule_interviews(shortlisted, duration_minutes=45)
+        scheduler = get_scheduler()
+        scheduled = await asyncio.to_thread(scheduler.schedule_interviews, shortlisted, duration_minutes=45)
         
-        print(f"✅ Scheduled {len(scheduled)} interview(s)")
+        logger.info("✅ Scheduled %s interview(s)", len(scheduled))
         
         return {
-            **state,
             "scheduled_candidates": scheduled,
             "status": "scheduling_complete"
         }
         
     except Exception as e:
-        print(f"❌ Scheduling failed: {str(e)}")
-        errors = state.get("errors", [])
-        errors.append(f"Scheduling: {str(e)}")
-        return {**state, "errors": errors, "status": "scheduling_failed"}
+        logger.error("❌ Scheduling failed: %s", e)
+        return {"errors": state.get("errors", []) + [f"Scheduling: {str(e)}"], "status": "scheduling_failed"}
 
 
 # ============================================================================
@@ -324,192 +512,224 @@ def should_schedule_interviews(state: RecruitmentState) -> Literal["schedule_int
     shortlisted = state.get("shortlisted_candidates", [])
     
     if shortlisted and len(shortlisted) > 0:
-        print(f"\n🔀 ROUTING DECISION: {len(shortlisted)} shortlisted → Proceeding to interview scheduling")
+        logger.info("\n🔀 ROUTING DECISION: %s shortlisted → Proceeding to interview scheduling", len(shortlisted))
         return "schedule_interviews"
     else:
-        print(f"\n🔀 ROUTING DECISION: No shortlisted candidates → Skipping scheduling")
+        logger.info("\n🔀 ROUTING DECISION: No shortlisted candidates → Skipping scheduling")
         return "skip_scheduling"
 
 
-def create_all_candidates_sheet_node(state: RecruitmentState) -> RecruitmentState:
-    """Node 6a: Create Google Sheet for ALL candidates"""
-    print("\n" + "="*60)
-    print("� STEP 6A: Create All Candidates Database Sheet")
-    print("="*60)
+async def all_candidates_sheet_node(state: RecruitmentState) -> Dict:
+    """Node 5b: All Candidates sheet, built while interviews are scheduled"""
+    logger.info("\n" + "="*60)
+    logger.info("📊 STEP 5b: All Candidates Sheet (parallel with scheduling)")
+    logger.info("="*60)
+    
+    enriched = state.get("enriched_candidates", [])
+    if not enriched:
+        logger.warning("⚠️ No candidates to export")
+        return {"sheets_url": None}
     
     try:
-        enriched = state.get("enriched_candidates", [])
-        
-        if enriched:
-            print(f"📊 Creating database sheet with ALL {len(enriched)} candidates...")
-            sheets_manager = GoogleSheetsManager()
-            sheet_title = f"AI_Recruiter_Database"
-            sheets_url = sheets_manager.create_recruiter_sheet(enriched, sheet_title)
-            print(f"✅ All candidates sheet: {sheets_url}")
-        else:
-            sheets_url = None
-            print("⚠️ No candidates to export")
-        
-        return {
-            **state,
-            "sheets_url": sheets_url,
-            "status": "all_candidates_sheet_created"
-        }
-        
+        return {"sheets_url": await asyncio.to_thread(_create_all_candidates_sheet, enriched)}
     except Exception as e:
-        print(f"❌ All candidates sheet creation failed: {str(e)}")
-        errors = state.get("errors", [])
-        errors.append(f"All Candidates Sheet: {str(e)}")
-        return {**state, "errors": errors, "status": "all_sheet_failed"}
+        logger.error("❌ All candidates sheet creation failed: %s", e)
+        return {"sheets_url": None, "export_errors": [f"All Candidates Sheet: {e}"]}
+
+
+def _create_all_candidates_sheet(enriched: List[Dict]) -> Optional[str]:
+    """Google Sheet with ALL candidates (shortlisted + rejected)"""
+    logger.info("📊 Creating database sheet with ALL %s candidates...", len(enriched))
+    sheets_url = get_sheets_manager().create_recruiter_sheet(enriched, "AI_Recruiter_Database")
+    logger.info("✅ All candidates sheet: %s", sheets_url)
+    return sheets_url
 
 
-def create_interview_schedule_sheet_node(state: RecruitmentState) -> RecruitmentState:
-    """Node 6b: Create Google Sheet for SHORTLISTED candidates with interview schedule"""
-    print("\n" + "="*60)
-    print("📅 STEP 6B: Create Interview Schedule Sheet (Shortlisted Only)")
-    print("="*60)
+def _create_interview_sheet(scheduled: List[Dict]) -> Optional[str]:
+    """Google Sheet with the shortlisted candidates' interview schedule"""
+    logger.info("📅 Creating interview schedule sheet for %s shortlisted candidates...", len(scheduled))
+    interview_sheet_url = get_agent().create_scheduled_interviews_sheet(scheduled)
+    logger.info("✅ Interview schedule sheet: %s", interview_sheet_url)
+    return interview_sheet_url
+
+
+def _save_interview_csv(scheduled: List[Dict]) -> str:
+    """CSV export of the interview schedule"""
+    csv_file = get_agent().save_to_csv(scheduled)
+    logger.info("✅ CSV exported: %s", csv_file)
+    return csv_file
+
+
+async def _export_concurrently(scheduled: List[Dict]) -> List:
+    """Run the interview sheet create and the CSV write side by side; failures come back as exceptions"""
+    tasks = [
+        asyncio.to_thread(_create_interview_sheet, scheduled) if scheduled else asyncio.sleep(0),
+        asyncio.to_thread(_save_interview_csv, scheduled) if scheduled else asyncio.sleep(0),
+    ]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def export_results_node(state: RecruitmentState) -> Dict:
+    """Node 6: Create the Interview Schedule sheet and the CSV export"""
+    logger.info("\n" + "="*60)
+    logger.info("📊 STEP 6: Export Results (Interview Schedule Sheet + CSV)")
+    logger.info("="*60)
     
-    try:
-        scheduled = state.get("scheduled_candidates", [])
-        
-        if scheduled:
-            print(f"📅 Creating interview schedule sheet for {len(scheduled)} shortlisted candidates...")
-            agent = RecruitmentAgent()
-            interview_sheet_url = agent.create_scheduled_interviews_sheet(scheduled)
-            print(f"✅ Interview schedule sheet: {interview_sheet_url}")
-            
-            # Save CSV
-            csv_file = agent.save_to_csv(scheduled)
-            print(f"✅ CSV exported: {csv_file}")
-            
-            # Extract calendar links
-            calendar_links = []
-            for candidate in scheduled:
-                event_data = candidate.get('calendar_event_data', {})
-                if event_data and event_data.get('data'):
-                    response_data = event_data['data'].get('response_data', {})
-                    event_link = response_data.get('htmlLink', '')
-                    if event_link:
-                        calendar_links.append(event_link)
-        else:
-            print("⚠️ No interviews scheduled - skipping interview sheet")
-            interview_sheet_url = None
-            csv_file = None
-            calendar_links = []
-        
-        shortlisted = state.get("shortlisted_candidates", [])
-        rejected = state.get("rejected_candidates", [])
-        enriched = state.get("enriched_candidates", [])
-        
-        print(f"\n📊 Summary:")
-        print(f"   • Total candidates: {len(enriched)}")
-        print(f"   • Shortlisted: {len(shortlisted)}")
-        print(f"   • Rejected: {len(rejected)}")
-        print(f"   • Interviews scheduled: {len(scheduled)}")
-        
-        return {
-            **state,
-            "interview_sheet_url": interview_sheet_url,
-            "csv_file": csv_file,
-            "calendar_links": calendar_links,
-            "status": "export_complete"
-        }
-        
-    except Exception as e:
-        print(f"❌ Interview schedule sheet creation failed: {str(e)}")
-        errors = state.get("errors", [])
-        errors.append(f"Interview Sheet: {str(e)}")
-        return {**state, "errors": errors, "status": "interview_sheet_failed"}
+    enriched = state.get("enriched_candidates", [])
+    scheduled = state.get("scheduled_candidates", [])
+    errors = []
+    
+    if scheduled:
+        # Shared agent outlives a single run; keep output names per run
+        get_agent().timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    else:
+        logger.warning("⚠️ No interviews scheduled - skipping interview sheet")
+    
+    # The two exports don't depend on each other, so neither waits on the other's round-trips
+    interview_sheet_url, csv_file = await _export_concurrently(scheduled)
+    
+    if isinstance(interview_sheet_url, Exception):
+        logger.error("❌ Interview schedule sheet creation failed: %s", interview_sheet_url)
+        errors.append(f"Interview Sheet: {interview_sheet_url}")
+        interview_sheet_url = None
+    if isinstance(csv_file, Exception):
+        logger.error("❌ CSV export failed: %s", csv_file)
+        errors.append(f"CSV Export: {csv_file}")
+        csv_file = None
+    
+    # Extract calendar links
+    calendar_links = []
+    for candidate in scheduled:
+        event_data = candidate.get('calendar_event_data', {})
+        if event_data and event_data.get('data'):
+            response_data = event_data['data'].get('response_data', {})
+            event_link = response_data.get('htmlLink', '')
+            if event_link:
+                calendar_links.append(event_link)
+    
+    shortlisted = state.get("shortlisted_candidates", [])
+    rejected = state.get("rejected_candidates", [])
+    
+    logger.info("\n📊 Summary:")
+    logger.info("   • Total candidates: %s", len(enriched))
+    logger.info("   • Shortlisted: %s", len(shortlisted))
+    logger.info("   • Rejected: %s", len(rejected))
+    logger.info("   • Interviews scheduled: %s", len(scheduled))
+    
+    result = {
+        "interview_sheet_url": interview_sheet_url,
+        "csv_file": csv_file,
+        "calendar_links": calendar_links,
+        "status": "export_failed" if errors else "export_complete"
+    }
+    if errors:
+        result["errors"] = state.get("errors", []) + errors
+    return result
 
 
-def final_report_node(state: RecruitmentState) -> RecruitmentState:
+async def final_report_node(state: RecruitmentState) -> Dict:
     """Node 7: Generate final report with conditional results"""
-    print("\n" + "="*60)
-    print("PIPELINE COMPLETE - FINAL REPORT")
-    print("="*60)
-    
-    print(f"\nSummary:")
-    print(f"  • Emails checked: {len(state.get('email_messages', []))}")
-    print(f"  • Resumes downloaded: {len(state.get('downloaded_files', []))}")
-    print(f"  • Candidates extracted: {len(state.get('extracted_candidates', []))}")
-    print(f"  • Candidates enriched: {len(state.get('enriched_candidates', []))}")
-    print(f"  • Candidates scored: {len(state.get('scored_candidates', []))}")
-    print(f"  • ✅ Shortlisted: {len(state.get('shortlisted_candidates', []))}")
-    print(f"  • ❌ Rejected: {len(state.get('rejected_candidates', []))}")
-    print(f"  • 📅 Interviews scheduled: {len(state.get('scheduled_candidates', []))}")
+    logger.info("\n" + "="*60)
+    logger.info("PIPELINE COMPLETE - FINAL REPORT")
+    logger.info("="*60)
+    
+    write_errors = await asyncio.to_thread(_wait_for_writes)
+    
+    # Count everything once up front
+    n_emails = len(state.get('email_messages', []))
+    n_downloaded = len(state.get('downloaded_files', []))
+    n_extracted = len(state.get('extracted_candidates', []))
+    n_enriched = len(state.get('enriched_candidates', []))
+    n_scored = len(state.get('scored_candidates', []))
+    n_shortlisted = len(state.get('shortlisted_candidates', []))
+    n_rejected = len(state.get('rejected_candidates', []))
+    n_scheduled = len(state.get('scheduled_candidates', []))
+    
+    logger.info("\nSummary:")
+    logger.info("  • Emails checked: %s", n_emails)
+    logger.info("  • Resumes downloaded: %s", n_downloaded)
+    logger.info("  • Candidates extracted: %s", n_extracted)
+    logger.info("  • Candidates enriched: %s", n_enriched)
+    logger.info("  • Candidates scored: %s", n_scored)
+    logger.info("  • ✅ Shortlisted: %s", n_shortlisted)
+    logger.info("  • ❌ Rejected: %s", n_rejected)
+    logger.info("  • 📅 Interviews scheduled: %s", n_scheduled)
     
     # Show all output files and links
-    print(f"\n" + "="*60)
-    print("OUTPUT FILES & LINKS")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("OUTPUT FILES & LINKS")
+    logger.info("="*60)
     
     # 1. JSON File
     if state.get("json_file"):
-        print(f"\n1. CANDIDATE DATABASE (JSON):")
-        print(f"   File: {state['json_file']}")
-        print(f"   Contains: {len(state.get('enriched_candidates', []))} candidates")
+        logger.info("\n1. CANDIDATE DATABASE (JSON):")
+        logger.info("   File: %s", state['json_file'])
+        logger.info("   Contains: %s candidates", n_enriched)
     
     # 2. Main Candidate Sheet
     if state.get("sheets_url"):
-        enriched = state.get('enriched_candidates', [])
-        shortlisted = state.get('shortlisted_candidates', [])
-        rejected = state.get('rejected_candidates', [])
-        
-        print(f"\n2. ALL CANDIDATES APPLIED (Google Sheets):")
-        print(f"   Link: {state['sheets_url']}")
-        print(f"   Total: {len(enriched)} candidates")
-        print(f"   ✅ Shortlisted: {len(shortlisted)}")
-        print(f"   ❌ Rejected: {len(rejected)}")
+        logger.info("\n2. ALL CANDIDATES APPLIED (Google Sheets):")
+        logger.info("   Link: %s", state['sheets_url'])
+        logger.info("   Total: %s candidates", n_enriched)
+        logger.info("   ✅ Shortlisted: %s", n_shortlisted)
+        logger.info("   ❌ Rejected: %s", n_rejected)
     
     # 3. Interview Schedule Sheet (only if interviews were scheduled)
     if state.get("interview_sheet_url"):
-        print(f"\n3. SELECTED CANDIDATES & INTERVIEW SCHEDULE (Google Sheets):")
-        print(f"   Link: {state['interview_sheet_url']}")
-        print(f"   Contains: {len(state.get('scheduled_candidates', []))} shortlisted candidates")
-        print(f"   Interview Dates: Oct 22, 2025")
+        logger.info("\n3. SELECTED CANDIDATES & INTERVIEW SCHEDULE (Google Sheets):")
+        logger.info("   Link: %s", state['interview_sheet_url'])
+        logger.info("   Contains: %s shortlisted candidates", n_scheduled)
+        logger.info("   Interview Dates: Oct 22, 2025")
         
         # 4. CSV Export
         if state.get("csv_file"):
-            print(f"\n4. INTERVIEW SCHEDULE (CSV Export):")
-            print(f"   File: {state['csv_file']}")
+            logger.info("\n4. INTERVIEW SCHEDULE (CSV Export):")
+            logger.info("   File: %s", state['csv_file'])
     else:
-        print(f"\n3. ⚠️  NO INTERVIEWS SCHEDULED")
-        print(f"   Reason: No candidates met the minimum score threshold")
+        logger.info("\n3. ⚠️  NO INTERVIEWS SCHEDULED")
+        logger.info("   Reason: No candidates met the minimum score threshold")
     
     # 5. Calendar Links
     calendar_links = state.get('calendar_links', [])
     if calendar_links:
-        print(f"\n5. GOOGLE CALENDAR EVENTS:")
-        print(f"   Total Events Created: {len(calendar_links)}")
-        print(f"   Main Calendar: https://calendar.google.com")
+        logger.info("\n5. GOOGLE CALENDAR EVENTS:")
+        logger.info("   Total Events Created: %s", len(calendar_links))
+        logger.info("   Main Calendar: https://calendar.google.com")
         
-        print(f"\n   Individual Interview Event Links:")
+        logger.info("\n   Individual Interview Event Links:")
         scheduled = state.get('scheduled_candidates', [])
         for i, (candidate, link) in enumerate(zip(scheduled, calendar_links), 1):
             name = candidate.get('name', candidate.get('full_name', 'Unknown'))
             date = candidate.get('interview_date', 'N/A')
             time = candidate.get('interview_time', 'N/A')
-            print(f"   {i}. {name} - {date} at {time}")
-            print(f"      {link}")
+            logger.info("   %s. %s - %s at %s", i, name, date, time)
+            logger.info("      %s", link)
     
-    if state.get("errors"):
-        print(f"\nErrors encountered:")
-        for error in state["errors"]:
-            print(f"  • {error}")
+    branch_errors = state.get("export_errors", []) + write_errors
+    errors = state.get("errors", []) + branch_errors
+    if errors:
+        logger.info("\nErrors encountered:")
+        for error in errors:
+            logger.info("  • %s", error)
     
-    print("\n" + "="*60)
-    print("PIPELINE EXECUTION COMPLETE")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("PIPELINE EXECUTION COMPLETE")
+    logger.info("="*60)
     
-    return {**state, "status": "complete"}
+    if branch_errors:
+        return {"errors": errors, "status": "complete"}
+    return {"status": "complete"}
 
 
 # ============================================================================
 # BUILD ADVANCED LANGGRAPH WORKFLOW WITH CONDITIONAL ROUTING
 # ============================================================================
 
-def create_recruitment_pipeline() -> StateGraph:
+def create_recruitment_pipeline() -> "CompiledStateGraph":
     """Create the advanced LangGraph recruitment pipeline with detailed sub-steps"""
+    from langgraph.graph import StateGraph, END
+    from langgraph.cache.memory import InMemoryCache
+    from langgraph.types import CachePolicy
     
     # Initialize the graph
     workflow = StateGraph(RecruitmentState)
@@ -520,25 +740,28 @@ def create_recruitment_pipeline() -> StateGraph:
     workflow.add_node("gmail_monitor", gmail_monitor_node)
     
     # Step 2: Resume Extraction
-    workflow.add_node("extract_resumes", extract_resumes_node)
+    workflow.add_node("extract_resumes", extract_resumes_node,
+                      cache_policy=CachePolicy(key_func=_extract_cache_key, ttl=NODE_CACHE_TTL))
     
     # Step 3: LinkedIn Enrichment (with fallback to LLM)
-    workflow.add_node("linkedin_enrich", try_linkedin_enrichment_node)
+    workflow.add_node("linkedin_enrich", try_linkedin_enrichment_node,
+                      cache_policy=CachePolicy(key_func=_enrich_cache_key, ttl=NODE_CACHE_TTL))
     
     # Step 4: AI Scoring & Selection
-    workflow.add_node("score_candidates", score_candidates_node)
+    workflow.add_node("score_candidates", score_candidates_node,
+                      cache_policy=CachePolicy(key_func=_score_cache_key, ttl=NODE_CACHE_TTL))
     
     # Step 5: Interview Scheduling (conditional)
     workflow.add_node("schedule_interviews", schedule_interviews_node)
     
-    # Step 6a: Create All Candidates Sheet
-    workflow.add_node("create_all_candidates_sheet", create_all_candidates_sheet_node)
+    # All Candidates sheet only needs the scores, so it runs beside steps 5-6
+    workflow.add_node("all_candidates_sheet", all_candidates_sheet_node)
     
-    # Step 6b: Create Interview Schedule Sheet (conditional)
-    workflow.add_node("create_interview_sheet", create_interview_schedule_sheet_node)
+    # Step 6: Export results (interview sheet + CSV, concurrently)
+    workflow.add_node("export_results", export_results_node)
     
-    # Step 7: Final Report
-    workflow.add_node("final_report", final_report_node)
+    # Step 7: Final Report (deferred: waits for both export branches)
+    workflow.add_node("final_report", final_report_node, defer=True)
     
     # ========== DEFINE WORKFLOW EDGES ==========
     
@@ -548,69 +771,99 @@ def create_recruitment_pipeline() -> StateGraph:
     workflow.add_edge("extract_resumes", "linkedin_enrich")
     workflow.add_edge("linkedin_enrich", "score_candidates")
     
+    # PARALLEL: the All Candidates sheet fans out from scoring alongside the routing below
+    workflow.add_edge("score_candidates", "all_candidates_sheet")
+    
     # CONDITIONAL: After scoring, decide whether to schedule interviews
     workflow.add_conditional_edges(
         "score_candidates",
         should_schedule_interviews,
         {
             "schedule_interviews": "schedule_interviews",  # If shortlisted → schedule
-            "skip_scheduling": "create_all_candidates_sheet"  # If none → skip to sheets
+            "skip_scheduling": "export_results"  # If none → skip to export
         }
     )
     
-    # After scheduling → Create all candidates sheet
-    workflow.add_edge("schedule_interviews", "create_all_candidates_sheet")
-    
-    # After all candidates sheet → Create interview schedule sheet
-    workflow.add_edge("create_all_candidates_sheet", "create_interview_sheet")
+    # After scheduling → Export results
+    workflow.add_edge("schedule_interviews", "export_results")
     
-    # After interview sheet → Final report
-    workflow.add_edge("create_interview_sheet", "final_report")
+    # Both export branches → Final report
+    workflow.add_edge("export_results", "final_report")
+    workflow.add_edge("all_candidates_sheet", "final_report")
     
     # End
     workflow.add_edge("final_report", END)
     
-    return workflow.compile()
+    # In-process node cache; results that outlive the process are kept per
+    # resume by the candidate cache and per prompt by the LLM cache
+    return workflow.compile(cache=InMemoryCache())
+
+
+@lru_cache(maxsize=1)
+def get_recruitment_pipeline():
+    """Compiled pipeline, built once per process and reused across runs"""
+    return create_recruitment_pipeline()
+
+
+def _get_ipython_display():
+    """IPython's (Image, display) when running under IPython, else None"""
+    if "IPython" not in sys.modules:
+        return None  # Not in a notebook/shell, so don't pay for importing IPython
+    try:
+        from IPython.display import Image, display
+    except ImportError:
+        return None
+    return Image, display
 
 
 def visualize_pipeline(pipeline, save_path: str = "output/recruitment_pipeline_graph.png"):
     """
     Visualize the LangGraph pipeline and save as image
     
+    The PNG is only re-rendered (a network call to mermaid.ink) when it is
+    missing or older than this file, since the graph is defined here.
+    
     Args:
         pipeline: Compiled LangGraph workflow
         save_path: Path to save the visualization image
     """
     try:
-        print("\n" + "="*60)
-        print("[GRAPH] GENERATING PIPELINE VISUALIZATION")
-        print("="*60)
+        logger.info("\n" + "="*60)
+        logger.info("[GRAPH] GENERATING PIPELINE VISUALIZATION")
+        logger.info("="*60)
         
         # Ensure output directory exists
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
         
-        # Generate the graph image
-        graph_image = pipeline.get_graph().draw_mermaid_png()
-        
-        # Save to file
-        with open(save_path, 'wb') as f:
-            f.write(graph_image)
-        print(f"[OK] Pipeline graph saved to: {save_path}")
+        if os.path.exists(save_path) and os.path.getmtime(save_path) >= os.path.getmtime(__file__):
+            with open(save_path, 'rb') as f:
+                graph_image = f.read()
+            logger.info("[OK] Pipeline graph up to date: %s", save_path)
+        else:
+            # Generate the graph image
+            graph_image = pipeline.get_graph().draw_mermaid_png()
+            
+            # Save to file
+            with open(save_path, 'wb') as f:
+                f.write(graph_image)
+            logger.info("[OK] Pipeline graph saved to: %s", save_path)
         
         # Display inline if in Jupyter/IPython
-        if IPYTHON_AVAILABLE:
+        ipython_display = _get_ipython_display()
+        if ipython_display:
+            Image, display = ipython_display
             try:
                 display(Image(graph_image))
-                print("[OK] Pipeline graph displayed inline")
+                logger.info("[OK] Pipeline graph displayed inline")
             except:
-                print("[WARN] Could not display inline (not in Jupyter environment)")
+                logger.warning("⚠️ Could not display inline (not in Jupyter environment)")
         
         return graph_image
         
     except Exception as e:
-        print(f"[WARN] Could not generate visualization: {str(e)}")
-        print("   Install pygraphviz for better visualization:")
-        print("   pip install pygraphviz")
+        logger.warning("⚠️ Could not generate visualization: %s", e)
+        logger.info("   Install pygraphviz for better visualization:")
+        logger.info("   pip install pygraphviz")
         return None
 
 
@@ -621,7 +874,9 @@ def visualize_pipeline(pipeline, save_path: str = "output/recruitment_pipeline_g
 def run_complete_pipeline(
     check_gmail: bool = True,
     max_emails: int = 10,
-    min_score_threshold: float = 5.0
+    min_score_threshold: float = 5.0,
+    workers: Optional[int] = None,
+    visualize: bool = False
 ) -> Dict:
     """
     Run the complete AI Recruiter pipeline using LangGraph
@@ -630,28 +885,34 @@ def run_complete_pipeline(
         check_gmail: Whether to check Gmail for new resumes
         max_emails: Maximum number of emails to check
         min_score_threshold: Minimum score for candidate shortlisting
+        workers: Processes for PDF text extraction (default: CPU count)
+        visualize: Save (and display) the pipeline graph PNG
     
     Returns:
         Final state dictionary with all results
     """
-    print("\n" + "="*60)
-    print("AI RECRUITER COPILOT - ADVANCED LANGGRAPH PIPELINE")
-    print("="*60)
-    print("Complete automation with intelligent decision-making:")
-    print("Gmail -> Extract -> Enrich -> Score -> [Conditional] -> Schedule -> Sheets")
-    print("="*60)
+    configure_logging()
+    
+    logger.info("\n" + "="*60)
+    logger.info("AI RECRUITER COPILOT - ADVANCED LANGGRAPH PIPELINE")
+    logger.info("="*60)
+    logger.info("Complete automation with intelligent decision-making:")
+    logger.info("Gmail -> Extract -> Enrich -> Score -> [Conditional] -> Schedule -> Sheets")
+    logger.info("="*60)
     
-    # Create pipeline
-    pipeline = create_recruitment_pipeline()
+    # Compiled once per process
+    pipeline = get_recruitment_pipeline()
     
     # Visualize the pipeline graph
-    visualize_pipeline(pipeline, save_path="output/recruitment_pipeline_graph.png")
+    if visualize:
+        visualize_pipeline(pipeline, save_path="output/recruitment_pipeline_graph.png")
     
     # Initial state
     initial_state = {
         "check_gmail": check_gmail,
         "max_emails": max_emails,
         "min_score_threshold": min_score_threshold,
+        "extract_workers": workers,
         "email_messages": [],
         "downloaded_files": [],
         "extracted_candidates": [],
@@ -667,18 +928,18 @@ def run_complete_pipeline(
         "csv_file": "",
         "json_file": "",
         "calendar_links": [],
+        "export_errors": [],
         "status": "started",
         "errors": []
     }
     
     # Run the pipeline
     try:
-        final_state = pipeline.invoke(initial_state)
+        # Nodes are coroutines; one event loop drives the whole run
+        final_state = run_async(pipeline.ainvoke(initial_state))
         return final_state
     except Exception as e:
-        print(f"\n❌ Pipeline execution failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("\n❌ Pipeline execution failed: %s", e)
         return initial_state
 
 
@@ -687,10 +948,11 @@ def main():
     result = run_complete_pipeline(
         check_gmail=True,      # Check Gmail for new resumes
         max_emails=10,         # Check last 10 emails
-        min_score_threshold=5.0  # Shortlist candidates with score >= 5.0
+        min_score_threshold=5.0,  # Shortlist candidates with score >= 5.0
+        visualize=True         # Save graph PNG (re-rendered only when stale)
     )
     
-    print(f"\n✅ Pipeline execution finished with status: {result.get('status')}")
+    logger.info("\n✅ Pipeline execution finished with status: %s", result.get('status'))
     
     return result
 
@@ -9,6 +9,12 @@ from src.config.legacy_config import validate_config, COMPOSIO_API_KEY, GROQ_API
 print("Validating Configuration...")
 validate_config()
 
+# --validate-config: also load the Settings dataclasses and check them with settings.validate()
+if "--validate-config" in sys.argv:
+    from src.config.settings import validate_config as validate_settings
+    if not validate_settings():
+        sys.exit(1)
+
 composio_ok = COMPOSIO_API_KEY and COMPOSIO_API_KEY != "your_composio_api_key_here"
 groq_ok = GROQ_API_KEY and GROQ_API_KEY != "your_groq_api_key_here"
 
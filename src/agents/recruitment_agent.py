@@ -9,16 +9,22 @@ This module orchestrates:
 """
 
 import os
-import json
+import asyncio
+import logging
 import csv
+import orjson
 from datetime import datetime
+from functools import cached_property, lru_cache
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
 
 # Import our modular components
 from ..utils.candidate_scorer import CandidateScorer, DEFAULT_CRITERIA
 from ..utils.interview_scheduler import InterviewScheduler
-from composio import ComposioToolSet, Action
+from ..utils.logging_setup import configure_logging
+from ..utils.http_pool import get_composio_toolset, run_async
+from ..utils.retry import call_with_retry
+from composio import Action
 from ..config.legacy_config import (
     COMPOSIO_API_KEY, 
     GROQ_API_KEY, 
@@ -26,6 +32,75 @@ from ..config.legacy_config import (
     GOOGLE_CALENDAR_USER_ID
 )
 
+logger = logging.getLogger(__name__)
+
+INTERVIEW_SHEET_HEADERS = [
+    "Candidate Name", "Email", "Score", "Interview Date", 
+    "Interview Time", "Duration (min)", "Calendar Event Created",
+    "Rationale", "Skills", "Experience", "Current Role"
+]
+
+
+def _schedule_fields(candidate: Dict) -> tuple:
+    """
+    Fields shared by the interview sheet and the CSV export, with their defaults
+
+    Returns:
+        (name, email, score, date, time, duration, calendar_created, rationale)
+    """
+    get = candidate.get
+    return (
+        get("name") or get("full_name") or "Unknown",
+        get("email", ""),
+        get("score", "N/A"),
+        get("interview_date", "Not scheduled"),
+        get("interview_time", "Not scheduled"),
+        get("duration_minutes", 45),
+        bool(get("calendar_event_created")),
+        get("rationale", ""),
+    )
+
+
+def _interview_row(candidate: Dict) -> List:
+    """One scheduled-interviews sheet row, in INTERVIEW_SHEET_HEADERS order"""
+    name, email, score, date, time, duration, calendar_created, rationale = _schedule_fields(candidate)
+    original = candidate.get("original_data", candidate)  # pre-scoring candidate data
+    return [
+        name, email, score, date, time, duration,
+        "✅ Yes" if calendar_created else "❌ No",
+        rationale,
+        ", ".join(original.get("skills", [])[:5]),
+        f"{len(original.get('experience', []))} roles",
+        original.get("current_role", ""),
+    ]
+
+
+# Logged whenever scoring falls back to DEFAULT_CRITERIA; rendered once at import
+_DEFAULT_CRITERIA_BANNER = (
+    "📌 Using Default Criteria:\n"
+    f"   Role: {DEFAULT_CRITERIA['role']}\n"
+    f"   Required Skills: {', '.join(DEFAULT_CRITERIA['required_skills'][:3])}...\n"
+    f"   Min Experience: {DEFAULT_CRITERIA['min_experience_years']} years\n"
+)
+
+CSV_HEADERS = [
+    "Name", "Email", "Score", "Interview Date", "Interview Time",
+    "Duration (min)", "Calendar Event", "Rationale"
+]
+CSV_BUFFER_BYTES = 1 << 16  # write buffer for the CSV export
+
+
+def _csv_row(candidate: Dict) -> List:
+    """One scheduled-interviews CSV row, in CSV_HEADERS order"""
+    name, email, score, date, time, duration, calendar_created, rationale = _schedule_fields(candidate)
+    return [name, email, score, date, time, duration, "Yes" if calendar_created else "No", rationale]
+
+
+@lru_cache(maxsize=1)
+def _process_timestamp() -> str:
+    """Output-file timestamp shared by every agent created in this process"""
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
 
 class RecruitmentAgent:
     """
@@ -49,25 +124,36 @@ class RecruitmentAgent:
         self.groq_api_key = groq_api_key or GROQ_API_KEY
         self.entity_id = entity_id or GOOGLE_SHEETS_USER_ID
         
-        # Initialize ComposioToolSet
-        self.toolset = ComposioToolSet(api_key=self.composio_api_key)
+        # toolset / scorer / scheduler are built on first use, so loading or
+        # exporting candidates never pays for SDK setup
+        
+        self.timestamp = _process_timestamp()
         
-        # Initialize modules
-        self.scorer = CandidateScorer(groq_api_key=self.groq_api_key)
+        logger.info("🎯 RECRUITMENT AGENT INITIALIZED")
+        logger.info("=" * 60)
+        logger.info("📊 Candidate Scorer: Ready")
+        logger.info("📅 Interview Scheduler: Ready")
+        logger.info("📑 Google Sheets Manager: Ready")
+        logger.info("=" * 60)
+    
+    @cached_property
+    def toolset(self):
+        """Shared ComposioToolSet (one pooled HTTP session for all services)"""
+        return get_composio_toolset(self.composio_api_key)
+    
+    @cached_property
+    def scorer(self) -> CandidateScorer:
+        """Candidate scorer, created on first use"""
+        return CandidateScorer(groq_api_key=self.groq_api_key)
+    
+    @cached_property
+    def scheduler(self) -> InterviewScheduler:
+        """Interview scheduler, created on first use"""
         # Use calendar-specific entity_id for scheduler
-        self.scheduler = InterviewScheduler(
+        return InterviewScheduler(
             composio_api_key=self.composio_api_key, 
             entity_id=GOOGLE_CALENDAR_USER_ID
         )
-        
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        print("🎯 RECRUITMENT AGENT INITIALIZED")
-        print("=" * 60)
-        print("📊 Candidate Scorer: Ready")
-        print("📅 Interview Scheduler: Ready")
-        print("📑 Google Sheets Manager: Ready")
-        print("=" * 60)
     
     def load_candidates(self, json_file: str = None) -> List[Dict]:
         """
@@ -80,20 +166,22 @@ class RecruitmentAgent:
             List of candidate dictionaries
         """
         if not json_file:
-            # Find latest enriched candidates file
-            import glob
-            pattern = "enhanced_candidates_*.json"
-            files = glob.glob(pattern)
-            if files:
-                json_file = max(files)  # Get latest file
-                print(f"📂 Loading candidates from: {json_file}")
+            # Find latest enriched candidates file (timestamped names sort by time)
+            with os.scandir('.') as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (name.startswith("enhanced_candidates_") and name.endswith(".json")
+                            and (json_file is None or name > json_file)):
+                        json_file = name
+            if json_file:
+                logger.info("📂 Loading candidates from: %s", json_file)
             else:
-                print("❌ No candidate files found!")
+                logger.error("❌ No candidate files found!")
                 return []
         
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(json_file, 'rb') as f:
+                data = orjson.loads(f.read())
             
             # Handle different JSON structures
             if isinstance(data, list):
@@ -103,11 +191,11 @@ class RecruitmentAgent:
             else:
                 candidates = [data]
             
-            print(f"✅ Loaded {len(candidates)} candidates")
+            logger.info("✅ Loaded %s candidates", len(candidates))
             return candidates
             
         except Exception as e:
-            print(f"❌ Error loading candidates: {str(e)}")
+            logger.error("❌ Error loading candidates: %s", e)
             return []
     
     def score_and_select(
@@ -127,25 +215,21 @@ class RecruitmentAgent:
         Returns:
             List of shortlisted candidates with scores
         """
-        print(f"\n📊 STEP 1: CANDIDATE SCORING & SELECTION")
-        print("-" * 60)
-        print(f"🎯 Minimum Score Threshold: {min_score}/10")
-        print(f"📋 Total Candidates to Evaluate: {len(candidates)}")
-        print()
+        logger.info("\n📊 STEP 1: CANDIDATE SCORING & SELECTION")
+        logger.info("-" * 60)
+        logger.info("🎯 Minimum Score Threshold: %s/10", min_score)
+        logger.info("📋 Total Candidates to Evaluate: %s", len(candidates))
+        logger.info("")
         
         if not criteria:
             criteria = DEFAULT_CRITERIA
-            print(f"📌 Using Default Criteria:")
-            print(f"   Role: {criteria['role']}")
-            print(f"   Required Skills: {', '.join(criteria['required_skills'][:3])}...")
-            print(f"   Min Experience: {criteria['min_experience_years']} years")
-            print()
+            logger.info(_DEFAULT_CRITERIA_BANNER)
         
         # Score all candidates
         shortlisted = self.scorer.score_candidates(candidates, criteria, min_score)
         
-        print(f"\n✅ Scoring Complete!")
-        print(f"🎯 Shortlisted: {len(shortlisted)}/{len(candidates)} candidates")
+        logger.info("\n✅ Scoring Complete!")
+        logger.info("🎯 Shortlisted: %s/%s candidates", len(shortlisted), len(candidates))
         
         return shortlisted
     
@@ -164,11 +248,11 @@ class RecruitmentAgent:
         Returns:
             List of candidates with schedule information
         """
-        print(f"\n📅 STEP 2: INTERVIEW SCHEDULING")
-        print("-" * 60)
+        logger.info("\n📅 STEP 2: INTERVIEW SCHEDULING")
+        logger.info("-" * 60)
         
         if not shortlisted:
-            print("ℹ️  No candidates to schedule")
+            logger.info("ℹ️  No candidates to schedule")
             return []
         
         # Schedule interviews
@@ -189,52 +273,45 @@ class RecruitmentAgent:
         Returns:
             Google Sheets URL or None
         """
-        print(f"\n📑 STEP 3: CREATING GOOGLE SHEET")
-        print("-" * 60)
+        logger.info("\n📑 STEP 3: CREATING GOOGLE SHEET")
+        logger.info("-" * 60)
         
         if not scheduled_candidates:
-            print("ℹ️  No scheduled candidates to export")
+            logger.info("ℹ️  No scheduled candidates to export")
             return None
         
         try:
             # Prepare sheet data
             sheet_name = f"Scheduled_Interviews_{self.timestamp}"
             
-            # Headers
-            headers = [
-                "Candidate Name", "Email", "Score", "Interview Date", 
-                "Interview Time", "Duration (min)", "Calendar Event Created",
-                "Rationale", "Skills", "Experience", "Current Role"
-            ]
-            
-            # Prepare rows
-            rows = [headers]
-            for candidate in scheduled_candidates:
-                # Extract data
-                name = candidate.get("name", candidate.get("full_name", "Unknown"))
-                email = candidate.get("email", "")
-                score = candidate.get("score", "N/A")
-                interview_date = candidate.get("interview_date", "Not scheduled")
-                interview_time = candidate.get("interview_time", "Not scheduled")
-                duration = candidate.get("duration_minutes", 45)
-                calendar_created = "✅ Yes" if candidate.get("calendar_event_created") else "❌ No"
-                rationale = candidate.get("rationale", "")
-                
-                # Get original data
-                original = candidate.get("original_data", candidate)
-                skills = ", ".join(original.get("skills", [])[:5])
-                experience_count = len(original.get("experience", []))
-                current_role = original.get("current_role", "")
-                
-                row = [
-                    name, email, score, interview_date, interview_time,
-                    duration, calendar_created, rationale, skills, 
-                    f"{experience_count} roles", current_role
-                ]
-                rows.append(row)
+            rows = [_interview_row(candidate) for candidate in scheduled_candidates]
             
             # Create sheet using ComposioToolSet
-            print(f"📝 Creating sheet: {sheet_name}")
+            logger.info("📝 Creating sheet: %s", sheet_name)
+            
+            # One call creates the spreadsheet with the rows already in it
+            result = call_with_retry(
+                self.toolset.execute_action,
+                action=Action.GOOGLESHEETS_SHEET_FROM_JSON,
+                params={
+                    "title": sheet_name,
+                    "sheet_name": "Sheet1",
+                    "sheet_json": [dict(zip(INTERVIEW_SHEET_HEADERS, row)) for row in rows]
+                },
+                entity_id=self.entity_id
+            )
+            sheet_data = result.get("data") or {}
+            sheet_data = sheet_data.get("response_data", sheet_data)
+            spreadsheet_id = sheet_data.get("spreadsheetId") or sheet_data.get("spreadsheet_id")
+            if result.get("successful") and spreadsheet_id:
+                spreadsheet_url = (sheet_data.get("spreadsheetUrl") or sheet_data.get("spreadsheet_url")
+                                   or f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}")
+                logger.info("✅ Sheet created with %s candidates", len(rows))
+                logger.info("🔗 Sheet URL: %s", spreadsheet_url)
+                return spreadsheet_url
+            
+            logger.warning("⚠️  One-shot sheet creation failed (%s), creating then populating...", result.get("error"))
+            rows.insert(0, INTERVIEW_SHEET_HEADERS)
             
             # Step 1: Create empty sheet
             create_result = self.toolset.execute_action(
@@ -244,17 +321,17 @@ class RecruitmentAgent:
             )
             
             if not create_result.get("successful"):
-                print(f"❌ Failed to create sheet: {create_result}")
+                logger.error("❌ Failed to create sheet: %s", create_result)
                 return None
             
             sheet_data = create_result.get("data", {})
             spreadsheet_id = sheet_data.get("spreadsheetId")
             spreadsheet_url = sheet_data.get("spreadsheetUrl")
             
-            print(f"✅ Sheet created: {spreadsheet_url}")
+            logger.info("✅ Sheet created: %s", spreadsheet_url)
             
             # Step 2: Populate with data
-            print("📝 Populating sheet with interview data...")
+            logger.info("📝 Populating sheet with interview data...")
             
             update_result = self.toolset.execute_action(
                 action=Action.GOOGLESHEETS_BATCH_UPDATE,
@@ -268,17 +345,15 @@ class RecruitmentAgent:
             )
             
             if update_result.get("successful"):
-                print(f"✅ Sheet populated with {len(rows)-1} candidates")
-                print(f"🔗 Sheet URL: {spreadsheet_url}")
+                logger.info("✅ Sheet populated with %s candidates", len(rows)-1)
+                logger.info("🔗 Sheet URL: %s", spreadsheet_url)
                 return spreadsheet_url
             else:
-                print(f"⚠️  Sheet created but population failed: {update_result}")
+                logger.warning("⚠️  Sheet created but population failed: %s", update_result)
                 return spreadsheet_url
                 
         except Exception as e:
-            print(f"❌ Error creating Google Sheet: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error creating Google Sheet: %s", e)
             return None
     
     def save_to_csv(self, scheduled_candidates: List[Dict], filename: str = None) -> str:
@@ -302,43 +377,23 @@ class RecruitmentAgent:
         # Full path with output directory
         filepath = os.path.join(output_dir, filename)
         
-        print(f"\n💾 Saving to CSV: {filepath}")
+        logger.info("\n💾 Saving to CSV: %s", filepath)
         
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_BYTES) as f:
                 writer = csv.writer(f)
-                
-                # Headers
-                headers = [
-                    "Name", "Email", "Score", "Interview Date", "Interview Time",
-                    "Duration (min)", "Calendar Event", "Rationale"
-                ]
-                writer.writerow(headers)
-                
-                # Data rows
-                for candidate in scheduled_candidates:
-                    name = candidate.get("name", candidate.get("full_name", "Unknown"))
-                    email = candidate.get("email", "")
-                    score = candidate.get("score", "N/A")
-                    interview_date = candidate.get("interview_date", "Not scheduled")
-                    interview_time = candidate.get("interview_time", "Not scheduled")
-                    duration = candidate.get("duration_minutes", 45)
-                    calendar_created = "Yes" if candidate.get("calendar_event_created") else "No"
-                    rationale = candidate.get("rationale", "")
-                    
-                    writer.writerow([
-                        name, email, score, interview_date, interview_time,
-                        duration, calendar_created, rationale
-                    ])
+                writer.writerow(CSV_HEADERS)
+                # Generator keeps one row alive at a time, however many candidates there are
+                writer.writerows(_csv_row(candidate) for candidate in scheduled_candidates)
             
-            print(f"✅ CSV saved: {filepath}")
+            logger.info("✅ CSV saved: %s", filepath)
             return filepath
             
         except Exception as e:
-            print(f"❌ Error saving CSV: {str(e)}")
+            logger.error("❌ Error saving CSV: %s", e)
             return None
     
-    def run_complete_pipeline(
+    async def run_complete_pipeline(
         self,
         candidates_file: str = None,
         criteria: Dict = None,
@@ -357,9 +412,9 @@ class RecruitmentAgent:
         Returns:
             Results dictionary
         """
-        print("\n" + "=" * 60)
-        print("🎯 RECRUITMENT AGENT - COMPLETE PIPELINE")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("🎯 RECRUITMENT AGENT - COMPLETE PIPELINE")
+        logger.info("=" * 60)
         
         results = {
             "success": False,
@@ -374,7 +429,7 @@ class RecruitmentAgent:
             # Load candidates
             candidates = self.load_candidates(candidates_file)
             if not candidates:
-                print("❌ No candidates to process")
+                logger.error("❌ No candidates to process")
                 return results
             
             results["total_candidates"] = len(candidates)
@@ -384,62 +439,62 @@ class RecruitmentAgent:
             results["shortlisted"] = len(shortlisted)
             
             if not shortlisted:
-                print("\n⚠️  No candidates met the minimum score threshold")
+                logger.warning("\n⚠️  No candidates met the minimum score threshold")
                 return results
             
             # Schedule interviews
             scheduled = self.schedule_interviews(shortlisted, duration_minutes)
             results["scheduled"] = len(scheduled)
             
-            # Create Google Sheet
-            sheets_url = self.create_scheduled_interviews_sheet(scheduled)
+            # Google Sheet and CSV don't depend on each other, so overlap the Composio round-trips with the file write
+            sheets_url, csv_file = await asyncio.gather(
+                asyncio.to_thread(self.create_scheduled_interviews_sheet, scheduled),
+                asyncio.to_thread(self.save_to_csv, scheduled),
+            )
             results["sheets_url"] = sheets_url
-            
-            # Save to CSV
-            csv_file = self.save_to_csv(scheduled)
             results["csv_file"] = csv_file
             
             # Final summary
-            print("\n" + "=" * 60)
-            print("🎉 RECRUITMENT PIPELINE COMPLETE!")
-            print("=" * 60)
-            print(f"📊 Total Candidates Evaluated: {results['total_candidates']}")
-            print(f"✅ Shortlisted: {results['shortlisted']}")
-            print(f"📅 Interviews Scheduled: {results['scheduled']}")
+            logger.info("\n" + "=" * 60)
+            logger.info("🎉 RECRUITMENT PIPELINE COMPLETE!")
+            logger.info("=" * 60)
+            logger.info("📊 Total Candidates Evaluated: %s", results['total_candidates'])
+            logger.info("✅ Shortlisted: %s", results['shortlisted'])
+            logger.info("📅 Interviews Scheduled: %s", results['scheduled'])
             if sheets_url:
-                print(f"🔗 Google Sheet: {sheets_url}")
+                logger.info("🔗 Google Sheet: %s", sheets_url)
             if csv_file:
-                print(f"💾 CSV Export: {csv_file}")
-            print("=" * 60)
+                logger.info("💾 CSV Export: %s", csv_file)
+            logger.info("=" * 60)
             
             results["success"] = True
             return results
             
         except Exception as e:
-            print(f"\n❌ Pipeline failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("\n❌ Pipeline failed: %s", e)
             return results
 
 
 def main():
     """Main execution function for testing"""
-    print("🚀 RECRUITMENT AGENT - STANDALONE TEST")
-    print("=" * 60)
+    configure_logging()
+    
+    logger.info("🚀 RECRUITMENT AGENT - STANDALONE TEST")
+    logger.info("=" * 60)
     
     # Initialize agent
     agent = RecruitmentAgent()
     
     # Run complete pipeline
-    results = agent.run_complete_pipeline(
+    results = run_async(agent.run_complete_pipeline(
         min_score=5.0,  # Adjust threshold as needed
         duration_minutes=45
-    )
+    ))
     
     if results["success"]:
-        print("\n✅ Test complete! Check the Google Sheet and CSV output.")
+        logger.info("\n✅ Test complete! Check the Google Sheet and CSV output.")
     else:
-        print("\n❌ Test failed. Please check the errors above.")
+        logger.error("\n❌ Test failed. Please check the errors above.")
     
     return results
 
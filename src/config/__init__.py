@@ -2,6 +2,6 @@
 Configuration module - Application settings and environment variables
 """
 
-from .settings import Settings, get_settings
+from .settings import Settings, get_settings, reset_settings_cache
 
-__all__ = ["Settings", "get_settings"]
+__all__ = ["Settings", "get_settings", "reset_settings_cache"]
@@ -41,6 +41,10 @@ GOOGLE_CALENDAR_AUTH_CONFIG_ID = os.getenv("GOOGLE_CALENDAR_AUTH_CONFIG_ID", "")
 GROQ_MODEL = "llama-3.1-8b-instant"  # Reliable primary model
 GROQ_MODEL_BACKUP = "llama-3.1-70b-versatile"  # Backup model
 GROQ_MODEL_ALTERNATIVE = "meta-llama/llama-4-scout-17b-16e-instruct"  # Alternative for specific tasks
+GROQ_MAX_CONCURRENT = int(os.getenv("GROQ_MAX_CONCURRENT", "8"))  # In-flight Groq requests (stay under tenant RPM)
+SCORE_PREFILTER_THRESHOLD = float(os.getenv("SCORE_PREFILTER_THRESHOLD", "0"))  # Opt-in: min resume/criteria similarity before LLM scoring, e.g. 0.35 (0 = off; needs sentence-transformers)
+SCORE_MODE = os.getenv("SCORE_MODE", "ai")  # ai | heuristic | auto (LLM only for heuristic scores near the threshold)
+SCORE_AUTO_MARGIN = float(os.getenv("SCORE_AUTO_MARGIN", "2.0"))  # auto mode: heuristic decides when this far from the threshold
 
 # Validation
 def validate_config():
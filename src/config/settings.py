@@ -1,99 +1,87 @@
 """
 Application Settings with Type Safety and Validation
 
-This module uses Pydantic for strong typing and validation of all configuration values.
+Settings are plain frozen dataclasses read once from environment variables;
+validate() runs the required-value checks explicitly.
 All sensitive data is loaded from environment variables.
 """
 
 import os
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
-from dotenv import load_dotenv
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional
 
-# Load environment variables
-load_dotenv()
+# Set in CI/production where the orchestrator injects the environment
+SKIP_DOTENV_ENV = "HORIZON_SKIP_DOTENV"
 
 
-class ComposioSettings(BaseModel):
+@lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Load .env into the environment, at most once per process"""
+    if os.environ.get(SKIP_DOTENV_ENV):
+        return False
+    from dotenv import load_dotenv
+    return load_dotenv()
+
+
+@dataclass(frozen=True, slots=True)
+class ComposioSettings:
     """Composio API configuration"""
     
-    api_key: str = Field(..., description="Composio API key from https://app.composio.dev/settings")
-    
-    @field_validator('api_key')
-    @classmethod
-    def validate_api_key(cls, v: str) -> str:
-        if not v or v == "your_composio_api_key_here":
-            raise ValueError("COMPOSIO_API_KEY must be set in .env file")
-        return v
+    api_key: str  # from https://app.composio.dev/settings
 
 
-class GmailSettings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class GmailSettings:
     """Gmail integration configuration"""
     
-    user_id: str = Field(..., description="Gmail user ID from Composio dashboard")
-    account_id: str = Field(..., description="Gmail account ID from Composio")
-    auth_config_id: str = Field(..., description="Gmail auth config ID")
-    
-    @field_validator('user_id', 'account_id', 'auth_config_id')
-    @classmethod
-    def validate_not_empty(cls, v: str) -> str:
-        if not v or v.startswith("your_"):
-            raise ValueError(f"Gmail configuration incomplete. Check .env file")
-        return v
+    user_id: str  # Gmail user ID from Composio dashboard
+    account_id: str  # Gmail account ID from Composio
+    auth_config_id: str  # Gmail auth config ID
 
 
-class LinkedInSettings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LinkedInSettings:
     """LinkedIn integration configuration"""
     
-    connected_account_id: str = Field(default="", description="LinkedIn connected account ID")
-    entity_id: str = Field(default="", description="LinkedIn entity ID")
-    auth_token: str = Field(default="", description="LinkedIn auth token")
-    api_enabled: bool = Field(default=False, description="Whether LinkedIn API is properly configured")
-    
-    @field_validator('api_enabled')
-    @classmethod
-    def validate_api_enabled(cls, v: bool, info) -> bool:
-        """Validate that if API is enabled, credentials are present"""
-        if v and not info.data.get('connected_account_id'):
-            raise ValueError("LinkedIn API enabled but credentials missing")
-        return v
+    connected_account_id: str = ""
+    entity_id: str = ""
+    auth_token: str = ""
+    api_enabled: bool = False  # Whether LinkedIn API is properly configured
 
 
-class GoogleSheetsSettings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class GoogleSheetsSettings:
     """Google Sheets integration configuration"""
     
-    auth_config_id: str = Field(..., description="Google Sheets auth config ID")
-    account_id: str = Field(..., description="Google Sheets account ID")
-    user_id: str = Field(..., description="Google Sheets user ID")
+    auth_config_id: str
+    account_id: str
+    user_id: str
 
 
-class GoogleCalendarSettings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class GoogleCalendarSettings:
     """Google Calendar integration configuration"""
     
-    account_id: str = Field(..., description="Google Calendar account ID")
-    user_id: str = Field(..., description="Google Calendar user ID")
-    auth_config_id: str = Field(..., description="Google Calendar auth config ID")
+    account_id: str
+    user_id: str
+    auth_config_id: str
 
 
-class LLMSettings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LLMSettings:
     """LLM configuration for AI processing"""
     
-    groq_api_key: str = Field(..., description="Groq API key from https://console.groq.com/keys")
-    openai_api_key: Optional[str] = Field(default=None, description="OpenAI API key (backup)")
-    primary_model: str = Field(default="llama-3.1-8b-instant", description="Primary Groq model")
-    backup_model: str = Field(default="llama-3.1-70b-versatile", description="Backup model")
-    alternative_model: str = Field(default="meta-llama/llama-4-scout-17b-16e-instruct", description="Alternative model")
-    
-    @field_validator('groq_api_key')
-    @classmethod
-    def validate_groq_key(cls, v: str) -> str:
-        if not v or v == "your_groq_api_key_here":
-            raise ValueError("GROQ_API_KEY must be set in .env file")
-        return v
+    groq_api_key: str  # from https://console.groq.com/keys
+    openai_api_key: Optional[str] = None  # backup
+    primary_model: str = "llama-3.1-8b-instant"
+    backup_model: str = "llama-3.1-70b-versatile"
+    alternative_model: str = "meta-llama/llama-4-scout-17b-16e-instruct"
 
 
-class Settings(BaseModel):
-    """Complete application settings with validation"""
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Complete application settings"""
     
     # Core settings
     composio: ComposioSettings
@@ -104,20 +92,113 @@ class Settings(BaseModel):
     llm: LLMSettings
     
     # Application settings
-    debug_mode: bool = Field(default=False, description="Enable debug logging")
-    max_retries: int = Field(default=3, ge=1, le=10, description="Maximum API retry attempts")
-    timeout_seconds: int = Field(default=30, ge=5, le=120, description="API timeout in seconds")
+    debug_mode: bool = False  # Enable debug logging
+    max_retries: int = 3  # Maximum API retry attempts (1-10)
+    timeout_seconds: int = 30  # API timeout in seconds (5-120)
+
+
+# Nested sections of Settings and the dataclass each one is built from
+_SECTIONS = {
+    "composio": ComposioSettings,
+    "gmail": GmailSettings,
+    "linkedin": LinkedInSettings,
+    "google_sheets": GoogleSheetsSettings,
+    "google_calendar": GoogleCalendarSettings,
+    "llm": LLMSettings,
+}
+
+
+# Spellings accepted as "on" for boolean environment flags
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _build_env_dict() -> Dict:
+    """Raw settings values from the environment, shaped like Settings"""
+    env = dict(os.environ)  # one snapshot instead of a getenv per field
+    return {
+        "composio": {
+            "api_key": env.get("COMPOSIO_API_KEY", "")
+        },
+        "gmail": {
+            "user_id": env.get("GMAIL_USER_ID", ""),
+            "account_id": env.get("GMAIL_ACCOUNT_ID", ""),
+            "auth_config_id": env.get("GMAIL_AUTH_CONFIG_ID", "")
+        },
+        "linkedin": {
+            "connected_account_id": env.get("LINKEDIN_CONNECTED_ACCOUNT_ID", ""),
+            "entity_id": env.get("LINKEDIN_ENTITY_ID", ""),
+            "auth_token": env.get("COMPOSIO_LINKEDIN_AUTH", ""),
+            "api_enabled": env.get("LINKEDIN_API_ENABLED", "").lower() in _TRUE_VALUES
+        },
+        "google_sheets": {
+            "auth_config_id": env.get("GOOGLE_SHEETS_AUTH_CONFIG_ID", ""),
+            "account_id": env.get("GOOGLE_SHEETS_ACCOUNT_ID", ""),
+            "user_id": env.get("GOOGLE_SHEETS_USER_ID", env.get("GMAIL_USER_ID", ""))
+        },
+        "google_calendar": {
+            "account_id": env.get("GOOGLE_CALENDAR_ACCOUNT_ID", ""),
+            "user_id": env.get("GOOGLE_CALENDAR_USER_ID", env.get("GMAIL_USER_ID", "")),
+            "auth_config_id": env.get("GOOGLE_CALENDAR_AUTH_CONFIG_ID", "")
+        },
+        "llm": {
+            "groq_api_key": env.get("GROQ_API_KEY", ""),
+            "openai_api_key": env.get("OPENAI_API_KEY"),
+            "primary_model": env.get("GROQ_MODEL", "llama-3.1-8b-instant"),
+            "backup_model": env.get("GROQ_MODEL_BACKUP", "llama-3.1-70b-versatile"),
+            "alternative_model": env.get("GROQ_MODEL_ALTERNATIVE", "meta-llama/llama-4-scout-17b-16e-instruct")
+        },
+        "debug_mode": env.get("DEBUG_MODE", "").lower() in _TRUE_VALUES,
+        "max_retries": int(env.get("MAX_RETRIES", "3")),
+        "timeout_seconds": int(env.get("TIMEOUT_SECONDS", "30"))
+    }
+
+
+def _check(name: str, value: Optional[str], forbidden_prefix: str = "your_") -> Optional[str]:
+    """Problem with a required value (empty, or still the .env.example placeholder), else None"""
+    if not value or value.startswith(forbidden_prefix):
+        return f"{name} must be set in .env file"
+    return None
+
+
+def validate(settings: Settings) -> None:
+    """
+    Check the required values of a Settings object
+    
+    Raises:
+        ValueError: Listing every missing or invalid value
+    """
+    gmail = settings.gmail
+    problems: List[Optional[str]] = [
+        _check("COMPOSIO_API_KEY", settings.composio.api_key),
+        _check("GMAIL_USER_ID", gmail.user_id),
+        _check("GMAIL_ACCOUNT_ID", gmail.account_id),
+        _check("GMAIL_AUTH_CONFIG_ID", gmail.auth_config_id),
+        _check("GROQ_API_KEY", settings.llm.groq_api_key),
+    ]
+    if settings.linkedin.api_enabled and not settings.linkedin.connected_account_id:
+        problems.append("LinkedIn API enabled but credentials missing")
+    if not 1 <= settings.max_retries <= 10:
+        problems.append(f"MAX_RETRIES must be between 1 and 10 (got {settings.max_retries})")
+    if not 5 <= settings.timeout_seconds <= 120:
+        problems.append(f"TIMEOUT_SECONDS must be between 5 and 120 (got {settings.timeout_seconds})")
     
-    class Config:
-        """Pydantic configuration"""
-        validate_assignment = True
-        extra = "forbid"  # Don't allow extra fields
+    problems = [problem for problem in problems if problem]
+    if problems:
+        raise ValueError(
+            "Configuration error: " + "; ".join(problems) + "\n"
+            "Please ensure all required environment variables are set in .env file.\n"
+            "Copy .env.example to .env and fill in your credentials."
+        )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Load and validate all application settings from environment variables.
     
+    Built once per process; call reset_settings_cache() after changing the
+    environment to have the next call re-read it.
+    
     Returns:
         Settings: Validated application configuration
         
@@ -128,49 +209,23 @@ def get_settings() -> Settings:
         >>> settings = get_settings()
         >>> print(settings.composio.api_key[:10] + "...")
     """
+    _load_env()
     try:
-        return Settings(
-            composio=ComposioSettings(
-                api_key=os.getenv("COMPOSIO_API_KEY", "")
-            ),
-            gmail=GmailSettings(
-                user_id=os.getenv("GMAIL_USER_ID", ""),
-                account_id=os.getenv("GMAIL_ACCOUNT_ID", ""),
-                auth_config_id=os.getenv("GMAIL_AUTH_CONFIG_ID", "")
-            ),
-            linkedin=LinkedInSettings(
-                connected_account_id=os.getenv("LINKEDIN_CONNECTED_ACCOUNT_ID", ""),
-                entity_id=os.getenv("LINKEDIN_ENTITY_ID", ""),
-                auth_token=os.getenv("COMPOSIO_LINKEDIN_AUTH", ""),
-                api_enabled=os.getenv("LINKEDIN_API_ENABLED", "false").lower() == "true"
-            ),
-            google_sheets=GoogleSheetsSettings(
-                auth_config_id=os.getenv("GOOGLE_SHEETS_AUTH_CONFIG_ID", ""),
-                account_id=os.getenv("GOOGLE_SHEETS_ACCOUNT_ID", ""),
-                user_id=os.getenv("GOOGLE_SHEETS_USER_ID", os.getenv("GMAIL_USER_ID", ""))
-            ),
-            google_calendar=GoogleCalendarSettings(
-                account_id=os.getenv("GOOGLE_CALENDAR_ACCOUNT_ID", ""),
-                user_id=os.getenv("GOOGLE_CALENDAR_USER_ID", os.getenv("GMAIL_USER_ID", "")),
-                auth_config_id=os.getenv("GOOGLE_CALENDAR_AUTH_CONFIG_ID", "")
-            ),
-            llm=LLMSettings(
-                groq_api_key=os.getenv("GROQ_API_KEY", ""),
-                openai_api_key=os.getenv("OPENAI_API_KEY"),
-                primary_model=os.getenv("GROQ_MODEL", "llama-3.1-8b-instant"),
-                backup_model=os.getenv("GROQ_MODEL_BACKUP", "llama-3.1-70b-versatile"),
-                alternative_model=os.getenv("GROQ_MODEL_ALTERNATIVE", "meta-llama/llama-4-scout-17b-16e-instruct")
-            ),
-            debug_mode=os.getenv("DEBUG_MODE", "false").lower() == "true",
-            max_retries=int(os.getenv("MAX_RETRIES", "3")),
-            timeout_seconds=int(os.getenv("TIMEOUT_SECONDS", "30"))
-        )
-    except Exception as e:
-        raise ValueError(
-            f"Configuration error: {str(e)}\n"
-            "Please ensure all required environment variables are set in .env file.\n"
-            "Copy .env.example to .env and fill in your credentials."
-        )
+        values = _build_env_dict()
+    except ValueError as e:
+        raise ValueError(f"Configuration error: {str(e)}")
+    
+    settings = Settings(
+        **{key: value for key, value in values.items() if key not in _SECTIONS},
+        **{name: section(**values[name]) for name, section in _SECTIONS.items()},
+    )
+    validate(settings)
+    return settings
+
+
+def reset_settings_cache() -> None:
+    """Drop the cached Settings so the next get_settings() re-reads the environment"""
+    get_settings.cache_clear()
 
 
 # Convenience function for backward compatibility
@@ -2,8 +2,19 @@
 Utilities module - Helper functions and utilities
 """
 
-from .pdf_extractor import PDFExtractor
-from .candidate_scorer import CandidateScorer
-from .linkedin_enricher import LinkedInEnricher
+from importlib import import_module
 
 __all__ = ["PDFExtractor", "CandidateScorer", "LinkedInEnricher"]
+
+# Re-exports are resolved on first access: the service modules import composio/groq
+_LAZY_EXPORTS = {
+    "PDFExtractor": ".pdf_extractor",
+    "CandidateScorer": ".candidate_scorer",
+    "LinkedInEnricher": ".linkedin_enricher",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,11 +6,21 @@ Downloads all resume PDFs automatically - no manual IDs needed!
 """
 
 import os
+import errno
+import shutil
+import logging
 import base64
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
-from composio import ComposioToolSet
+from typing import List, Dict, Optional, Tuple
+
+import orjson
 from composio.client.enums import Action
+from .http_pool import get_composio_toolset
+from .logging_setup import configure_logging
+from .retry import call_with_retry
 from ..config.legacy_config import (
     COMPOSIO_API_KEY,
     GMAIL_ACCOUNT_ID,
@@ -18,12 +28,66 @@ from ..config.legacy_config import (
     GMAIL_AUTH_CONFIG_ID
 )
 
+logger = logging.getLogger(__name__)
+
+# Composio has no Gmail batch endpoint, so attachment downloads are fanned out
+# concurrently instead of one blocking round-trip after another
+DOWNLOAD_CONCURRENCY = 8
+
+# Gmail message IDs already handled, kept in the downloads folder across runs
+PROCESSED_IDS_FILE = ".processed_ids.json"
+MAX_PROCESSED_IDS = 50_000  # oldest IDs are dropped past this
+
+# Base64 characters decoded per write (a multiple of 4, so only the tail needs padding)
+B64_CHUNK = 1 << 16
+
+
+def _write_base64(file_path: Path, data: str) -> int:
+    """
+    Decode base64 attachment data into a file without holding the whole decoded copy
+    
+    Gmail sends URL-safe base64, often unpadded; the URL-safe decoder also
+    accepts standard base64.
+    
+    Returns:
+        Number of bytes written
+    """
+    written = 0
+    with open(file_path, 'wb') as f:
+        for start in range(0, len(data), B64_CHUNK):
+            chunk = data[start:start + B64_CHUNK]
+            written += f.write(base64.urlsafe_b64decode(chunk + '=' * (-len(chunk) % 4)))
+    return written
+
+
+def _is_pdf(filename: str) -> bool:
+    """Case-insensitive .pdf check that only lowercases the extension"""
+    return filename[-4:].lower() == '.pdf'
+
+
+def _move_file(src: str, dst: Path) -> bool:
+    """
+    Move a downloaded file into place: a rename, or a copy across filesystems
+    
+    Returns:
+        False if `src` doesn't exist
+    """
+    try:
+        os.replace(src, dst)
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+    return True
+
 class AutoGmailMonitor:
     """Automatically monitors Gmail and downloads all resume PDFs"""
     
     def __init__(self):
         """Initialize with your Gmail credentials"""
-        self.composio_toolset = ComposioToolSet(api_key=COMPOSIO_API_KEY)
+        self.composio_toolset = get_composio_toolset(COMPOSIO_API_KEY)
         
         # Your Gmail account details from environment variables
         self.gmail_account_id = GMAIL_ACCOUNT_ID
@@ -34,16 +98,45 @@ class AutoGmailMonitor:
         self.incoming_folder = Path("incoming_resumes")
         self.incoming_folder.mkdir(exist_ok=True)
         
-        print("📧 Auto Gmail Monitor initialized")
-        print(f"📁 Downloads folder: {self.incoming_folder.absolute()}")
+        # Insertion-ordered, so trimming drops the oldest IDs first
+        self._processed_path = self.incoming_folder / PROCESSED_IDS_FILE
+        self._processed_ids = dict.fromkeys(self._load_processed_ids())
+        
+        logger.info("📧 Auto Gmail Monitor initialized")
+        logger.info("📁 Downloads folder: %s", self.incoming_folder.absolute())
     
-    def list_recent_messages(self, max_results: int = 20) -> List[str]:
-        """Get list of recent message IDs from Gmail that have PDF attachments"""
+    def _load_processed_ids(self) -> List[str]:
         try:
-            print(f"📧 Fetching recent {max_results} emails from Gmail...")
-            
-            # Use GMAIL_FETCH_EMAILS to get recent messages with attachments
-            response = self.composio_toolset.execute_action(
+            return orjson.loads(self._processed_path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return []
+    
+    def _mark_processed(self, message_ids: List[str]) -> None:
+        """Remember handled message IDs (atomic rewrite of the on-disk list)"""
+        if not message_ids:
+            return
+        for message_id in message_ids:
+            self._processed_ids.pop(message_id, None)
+            self._processed_ids[message_id] = None
+        while len(self._processed_ids) > MAX_PROCESSED_IDS:
+            del self._processed_ids[next(iter(self._processed_ids))]
+        
+        tmp_path = self._processed_path.with_suffix('.tmp')
+        tmp_path.write_bytes(orjson.dumps(list(self._processed_ids)))
+        os.replace(tmp_path, self._processed_path)
+    
+    def fetch_messages_with_attachments(self, max_results: int = 20) -> Optional[List[Dict]]:
+        """
+        One GMAIL_FETCH_EMAILS page of recent messages with attachments
+        
+        Returns None (after logging why) if the fetch failed, so callers can
+        share one listing between list_recent_messages and auto_monitor_and_download.
+        """
+        logger.info("📧 Fetching recent %s emails from Gmail...", max_results)
+        
+        try:
+            response = call_with_retry(
+                self.composio_toolset.execute_action,
                 action="GMAIL_FETCH_EMAILS",
                 params={
                     "max_results": max_results,
@@ -51,43 +144,61 @@ class AutoGmailMonitor:
                 },
                 entity_id=self.user_id
             )
+        except Exception as e:
+            logger.error("❌ Error fetching messages: %s", e)
+            return None
+        
+        if not response.get('successful'):
+            logger.error("❌ Failed to fetch messages: %s", response.get('error', 'Unknown error'))
+            return None
+        
+        return response.get('data', {}).get('messages', [])
+    
+    def list_recent_messages(self, max_results: int = 20, messages: Optional[List[Dict]] = None) -> List[str]:
+        """
+        Get list of recent message IDs from Gmail that have PDF attachments
+        
+        Args:
+            max_results: Number of recent emails to check
+            messages: Already-fetched message list to filter instead of fetching again
+        """
+        try:
+            if messages is None:
+                messages = self.fetch_messages_with_attachments(max_results)
+                if messages is None:
+                    return []
             
-            if response.get('successful'):
-                messages = response.get('data', {}).get('messages', [])
-                
-                # Filter only messages that have PDF attachments
-                pdf_message_ids = []
-                for msg in messages:
-                    message_id = msg.get('messageId')
-                    if not message_id:
-                        continue
-                        
-                    # Check if this message has PDF attachments
-                    attachment_list = msg.get('attachmentList', [])
-                    has_pdf = any(
-                        att.get('filename', '').lower().endswith('.pdf') 
-                        for att in attachment_list
-                    )
+            # Filter only messages that have PDF attachments
+            pdf_message_ids = []
+            for msg in messages:
+                message_id = msg.get('messageId')
+                if not message_id:
+                    continue
                     
-                    if has_pdf:
-                        pdf_message_ids.append(message_id)
+                # Check if this message has PDF attachments
+                attachment_list = msg.get('attachmentList', [])
+                has_pdf = any(
+                    _is_pdf(att.get('filename') or '')
+                    for att in attachment_list
+                )
                 
-                print(f"✅ Found {len(pdf_message_ids)} emails with PDF attachments")
-                return pdf_message_ids
-            else:
-                print(f"❌ Failed to fetch messages: {response.get('error', 'Unknown error')}")
-                return []
+                if has_pdf:
+                    pdf_message_ids.append(message_id)
+            
+            logger.info("✅ Found %s emails with PDF attachments", len(pdf_message_ids))
+            return pdf_message_ids
                 
         except Exception as e:
-            print(f"❌ Error fetching messages: {str(e)}")
+            logger.error("❌ Error fetching messages: %s", e)
             return []
     
     def get_message_details(self, message_id: str) -> Optional[Dict]:
         """Get full message details including attachments using GMAIL_FETCH_MESSAGE_BY_MESSAGE_ID"""
         try:
-            print(f"📄 Getting details for message: {message_id}")
+            logger.info("📄 Getting details for message: %s", message_id)
             
-            response = self.composio_toolset.execute_action(
+            response = call_with_retry(
+                self.composio_toolset.execute_action,
                 action="GMAIL_FETCH_MESSAGE_BY_MESSAGE_ID",
                 params={
                     "message_id": message_id
@@ -98,96 +209,89 @@ class AutoGmailMonitor:
             if response.get('successful'):
                 return response.get('data')
             else:
-                print(f"❌ Failed to get message details: {response.get('error', 'Unknown error')}")
+                logger.error("❌ Failed to get message details: %s", response.get('error', 'Unknown error'))
                 return None
                 
         except Exception as e:
-            print(f"❌ Error getting message details: {str(e)}")
+            logger.error("❌ Error getting message details: %s", e)
             return None
     
+    def get_message_details_batch(self, message_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch full details for many messages concurrently
+        
+        Args:
+            message_ids: Gmail message IDs
+            
+        Returns:
+            Dict mapping message ID to its details (None where the fetch failed)
+        """
+        unique_ids = list(dict.fromkeys(message_ids))
+        if len(unique_ids) < 2:
+            return {message_id: self.get_message_details(message_id) for message_id in unique_ids}
+        
+        workers = min(DOWNLOAD_CONCURRENCY, len(unique_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(unique_ids, executor.map(self.get_message_details, unique_ids)))
+    
     def extract_pdf_attachments(self, message_data: Dict) -> List[Dict]:
         """Extract PDF attachment info from message data"""
         attachments = []
         
         try:
             # Get email subject and sender for context
+            # (reversed, so the first of any repeated header wins)
             headers = message_data.get('payload', {}).get('headers', [])
-            subject = next((h['value'] for h in headers if h['name'].lower() == 'subject'), 'No Subject')
-            sender = next((h['value'] for h in headers if h['name'].lower() == 'from'), 'Unknown Sender')
+            header_map = {h['name'].lower(): h['value'] for h in reversed(headers)}
+            subject = header_map.get('subject', 'No Subject')
+            sender = header_map.get('from', 'Unknown Sender')
             
-            print(f"📧 Email: '{subject}' from {sender}")
+            logger.info("📧 Email: '%s' from %s", subject, sender)
             
-            def find_attachments_in_parts(parts, level=0):
-                """Recursively find PDF attachments in email parts"""
-                found_attachments = []
-                
-                for part in parts:
-                    # Check if this part has a PDF attachment
-                    filename = part.get('filename', '')
-                    if filename and filename.lower().endswith('.pdf'):
-                        attachment_id = part.get('body', {}).get('attachmentId')
-                        size = part.get('body', {}).get('size', 0)
-                        
-                        if attachment_id:
-                            found_attachments.append({
-                                'filename': filename,
-                                'attachment_id': attachment_id,
-                                'size': size,
-                                'subject': subject,
-                                'sender': sender
-                            })
-                            print(f"📎 Found PDF: {filename} ({size} bytes)")
+            # Walk the MIME tree iteratively, starting with the payload itself
+            # (it can be the PDF); children go to the front so attachments keep
+            # their document order
+            parts = deque([message_data.get('payload', {})])
+            while parts:
+                part = parts.popleft()
+                filename = part.get('filename', '')
+                if _is_pdf(filename or ''):
+                    body = part.get('body', {})
+                    attachment_id = body.get('attachmentId')
+                    size = body.get('size', 0)
                     
-                    # Check nested parts (multipart emails)
-                    if 'parts' in part:
-                        nested_attachments = find_attachments_in_parts(part['parts'], level + 1)
-                        found_attachments.extend(nested_attachments)
+                    if attachment_id:
+                        attachments.append({
+                            'filename': filename,
+                            'attachment_id': attachment_id,
+                            'size': size,
+                            'subject': subject,
+                            'sender': sender
+                        })
+                        logger.info("📎 Found PDF: %s (%s bytes)", filename, size)
                 
-                return found_attachments
-            
-            # Start searching from the main payload
-            payload = message_data.get('payload', {})
-            
-            # Check if main payload is a PDF
-            main_filename = payload.get('filename', '')
-            if main_filename and main_filename.lower().endswith('.pdf'):
-                attachment_id = payload.get('body', {}).get('attachmentId')
-                size = payload.get('body', {}).get('size', 0)
-                
-                if attachment_id:
-                    attachments.append({
-                        'filename': main_filename,
-                        'attachment_id': attachment_id,
-                        'size': size,
-                        'subject': subject,
-                        'sender': sender
-                    })
-                    print(f"📎 Found PDF: {main_filename} ({size} bytes)")
-            
-            # Search in parts
-            parts = payload.get('parts', [])
-            if parts:
-                part_attachments = find_attachments_in_parts(parts)
-                attachments.extend(part_attachments)
+                # Nested parts (multipart emails)
+                parts.extendleft(reversed(part.get('parts') or ()))
             
             return attachments
             
         except Exception as e:
-            print(f"❌ Error extracting attachments: {str(e)}")
+            logger.error("❌ Error extracting attachments: %s", e)
             return []
     
     def download_pdf_attachment(self, message_id: str, attachment_id: str, filename: str) -> bool:
         """Download PDF attachment using GMAIL_GET_ATTACHMENT"""
         try:
-            print(f"📥 Downloading: {filename}")
+            logger.info("📥 Downloading: %s", filename)
             
             # Check if file already exists
             file_path = self.incoming_folder / filename
             if file_path.exists():
-                print(f"⚠️ File already exists, skipping: {filename}")
+                logger.warning("⚠️ File already exists, skipping: %s", filename)
                 return True
             
-            response = self.composio_toolset.execute_action(
+            response = call_with_retry(
+                self.composio_toolset.execute_action,
                 action="GMAIL_GET_ATTACHMENT",
                 params={
                     "message_id": message_id,
@@ -202,75 +306,127 @@ class AutoGmailMonitor:
                 
                 # Check if we got a file path (Composio downloaded it)
                 downloaded_file_path = attachment_data.get('file', '')
-                if downloaded_file_path and os.path.exists(downloaded_file_path):
-                    # Move the file to our incoming folder
-                    import shutil
-                    shutil.move(downloaded_file_path, file_path)
-                    print(f"✅ Downloaded: {filename}")
+                if downloaded_file_path and _move_file(downloaded_file_path, file_path):
+                    logger.info("✅ Downloaded: %s", filename)
                     return True
                 
                 # Fallback: check for base64 data
                 file_data = attachment_data.get('data', '')
                 if file_data:
-                    # Decode base64 data and save
-                    decoded_data = base64.b64decode(file_data)
+                    # Decode base64 data straight to disk, chunk by chunk
+                    size = _write_base64(file_path, file_data)
                     
-                    with open(file_path, 'wb') as f:
-                        f.write(decoded_data)
-                    
-                    print(f"✅ Downloaded: {filename} ({len(decoded_data)} bytes)")
+                    logger.info("✅ Downloaded: %s (%s bytes)", filename, size)
                     return True
                 
-                print(f"❌ No file data received for {filename}")
+                logger.error("❌ No file data received for %s", filename)
                 return False
             else:
                 error_msg = response.get('error', 'Unknown error')
-                print(f"❌ Download failed: {error_msg}")
+                logger.error("❌ Download failed: %s", error_msg)
                 return False
                 
         except Exception as e:
-            print(f"❌ Download error: {str(e)}")
+            logger.error("❌ Download error: %s", e)
             return False
     
-    def auto_monitor_and_download(self, max_emails: int = 20) -> List[str]:
-        """Automatically monitor Gmail and download all resume PDFs"""
-        print("\n📧 AUTO GMAIL MONITOR: Scanning for resume PDFs")
-        print("=" * 60)
+    def download_attachments_batch(self, jobs: List[Tuple[str, str, str]]) -> Dict[str, bool]:
+        """
+        Download many PDF attachments concurrently
+
+        Args:
+            jobs: (message_id, attachment_id, filename) tuples
+
+        Returns:
+            Dict mapping filename to download success
+        """
+        return asyncio.run(self.adownload_attachments_batch(jobs))
+
+    async def adownload_attachments_batch(self, jobs: List[Tuple[str, str, str]]) -> Dict[str, bool]:
+        """Async version of download_attachments_batch for callers already inside an event loop"""
+        # Same filename in two emails would race on one path - fetch it once
+        unique_jobs = {}
+        for message_id, attachment_id, filename in jobs:
+            unique_jobs.setdefault(filename, (message_id, attachment_id, filename))
+
+        if not unique_jobs:
+            return {}
+
+        # Composio calls block, so each download runs on a thread of a pool sized
+        # to the concurrency cap; the task group fans them out and joins them
+        loop = asyncio.get_running_loop()
+        workers = min(DOWNLOAD_CONCURRENCY, len(unique_jobs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            async def download(job: Tuple[str, str, str]) -> bool:
+                return await loop.run_in_executor(executor, self.download_pdf_attachment, *job)
+
+            async with asyncio.TaskGroup() as tg:
+                tasks = {filename: tg.create_task(download(job)) for filename, job in unique_jobs.items()}
+
+        return {filename: task.result() for filename, task in tasks.items()}
+
+    def auto_monitor_and_download(self, max_emails: int = 20, messages: Optional[List[Dict]] = None) -> List[str]:
+        """
+        Automatically monitor Gmail and download all resume PDFs
+        
+        Args:
+            max_emails: Number of recent emails to check
+            messages: Already-fetched GMAIL_FETCH_EMAILS messages (skips the fetch)
+        """
+        return asyncio.run(self.aauto_monitor_and_download(max_emails, messages))
+
+    async def aauto_monitor_and_download(self, max_emails: int = 20,
+                                         messages: Optional[List[Dict]] = None) -> List[str]:
+        """Async version of auto_monitor_and_download for callers already inside an event loop"""
+        logger.info("\n📧 AUTO GMAIL MONITOR: Scanning for resume PDFs")
+        logger.info("=" * 60)
         
         downloaded_files = []
         
         try:
-            # Step 1: Get recent messages with PDF attachments directly  
-            print(f"📧 Fetching recent {max_emails} emails from Gmail...")
+            # Step 1: Get recent messages with PDF attachments directly (unless the caller already has them)
+            if messages is None:
+                messages = await asyncio.to_thread(self.fetch_messages_with_attachments, max_emails)
+                if messages is None:
+                    return downloaded_files
             
-            response = self.composio_toolset.execute_action(
-                action="GMAIL_FETCH_EMAILS",
-                params={
-                    "max_results": max_emails,
-                    "query": "has:attachment"
-                },
-                entity_id=self.user_id
-            )
+            logger.info("🔍 Found %s messages with attachments", len(messages))
             
-            if not response.get('successful'):
-                print(f"❌ Failed to fetch messages: {response.get('error', 'Unknown error')}")
-                return downloaded_files
+            # Emails handled by an earlier run need no details or download calls
+            new_messages = [m for m in messages if m.get('messageId') not in self._processed_ids]
+            if len(new_messages) < len(messages):
+                logger.info("⏭️  Skipping %s already-processed email(s)", len(messages) - len(new_messages))
+            messages = new_messages
             
-            messages = response.get('data', {}).get('messages', [])
-            print(f"🔍 Found {len(messages)} messages with attachments")
+            # Listings normally carry attachmentList; fetch full details (all at
+            # once) only for messages that came back without it
+            missing = [m['messageId'] for m in messages if m.get('messageId') and 'attachmentList' not in m]
+            details = await asyncio.to_thread(self.get_message_details_batch, missing) if missing else {}
             
-            # Step 2: Process each message that has PDF attachments
+            # Step 2: Collect PDF attachments from each message
             pdf_count = 0
+            download_jobs = []
+            queued = set()  # (message_id, attachment_id) already in download_jobs
+            handled_ids = {}  # messages (in order) that are done once their downloads succeed
             for i, message in enumerate(messages, 1):
                 message_id = message.get('messageId')
-                if not message_id:
+                if not message_id or message_id in handled_ids:
                     continue
+                if message_id in details and details[message_id] is None:
+                    continue  # details fetch failed; try again next run
+                handled_ids[message_id] = None
                     
                 # Check for PDF attachments in this message
-                attachment_list = message.get('attachmentList', [])
+                if message_id in details:
+                    attachment_list = [
+                        {'filename': att['filename'], 'attachmentId': att['attachment_id']}
+                        for att in self.extract_pdf_attachments(details[message_id])
+                    ]
+                else:
+                    attachment_list = message.get('attachmentList', [])
                 pdf_attachments = [
                     att for att in attachment_list 
-                    if att.get('filename', '').lower().endswith('.pdf')
+                    if _is_pdf(att.get('filename') or '')
                 ]
                 
                 if not pdf_attachments:
@@ -280,48 +436,60 @@ class AutoGmailMonitor:
                 subject = message.get('subject', 'No Subject')
                 sender = message.get('sender', 'Unknown Sender')
                 
-                print(f"\n[{i}/{len(messages)}] Processing: '{subject}' from {sender}")
-                print(f"📎 Found {len(pdf_attachments)} PDF attachment(s)")
+                logger.info("\n[%s/%s] Processing: '%s' from %s", i, len(messages), subject, sender)
+                logger.info("📎 Found %s PDF attachment(s)", len(pdf_attachments))
                 
-                # Download each PDF attachment
                 for attachment in pdf_attachments:
-                    filename = attachment['filename']
-                    attachment_id = attachment['attachmentId']
-                    
-                    success = self.download_pdf_attachment(message_id, attachment_id, filename)
-                    
-                    if success:
-                        downloaded_files.append(filename)
+                    key = (message_id, attachment['attachmentId'])
+                    if key not in queued:
+                        queued.add(key)
+                        download_jobs.append((message_id, attachment['attachmentId'], attachment['filename']))
             
-            print(f"\n🎉 Auto monitoring complete!")
-            print(f"📊 Found {pdf_count} total PDF attachments in {len(messages)} messages")
-            print(f"📁 Downloaded {len(downloaded_files)} new resume files")
+            # Step 3: Download all PDF attachments concurrently
+            results = await self.adownload_attachments_batch(download_jobs)
+            downloaded_files = list(dict.fromkeys(
+                filename for _, _, filename in download_jobs if results.get(filename)
+            ))
+            
+            failed_ids = {message_id for message_id, _, filename in download_jobs if not results.get(filename)}
+            self._mark_processed([message_id for message_id in handled_ids if message_id not in failed_ids])
+            
+            logger.info("\n🎉 Auto monitoring complete!")
+            logger.info("📊 Found %s total PDF attachments in %s messages", pdf_count, len(messages))
+            logger.info("📁 Downloaded %s new resume files", len(downloaded_files))
             
             if downloaded_files:
-                print("� New resume files:")
+                logger.info("� New resume files:")
                 for file in downloaded_files:
-                    print(f"   📄 {file}")
+                    logger.info("   📄 %s", file)
             else:
-                print("📭 No new resume files were found")
+                logger.info("📭 No new resume files were found")
             
             return downloaded_files
             
         except Exception as e:
-            print(f"❌ Auto monitoring error: {str(e)}")
+            logger.error("❌ Auto monitoring error: %s", e)
             return downloaded_files
     
     def get_folder_summary(self) -> Dict:
         """Get summary of incoming_resumes folder"""
         try:
-            pdf_files = list(self.incoming_folder.glob("*.pdf"))
-            txt_files = list(self.incoming_folder.glob("*.txt"))
+            # One directory scan, classified by name
+            pdf_files, txt_files = [], []
+            with os.scandir(self.incoming_folder) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith('.pdf'):
+                        pdf_files.append(name)
+                    elif name.endswith('.txt'):
+                        txt_files.append(name)
             
             return {
                 "folder_path": str(self.incoming_folder.absolute()),
                 "pdf_count": len(pdf_files),
                 "txt_count": len(txt_files),
                 "total_files": len(pdf_files) + len(txt_files),
-                "files": [f.name for f in pdf_files + txt_files]
+                "files": pdf_files + txt_files
             }
         except Exception as e:
             return {"error": str(e)}
@@ -329,33 +497,39 @@ class AutoGmailMonitor:
 
 def main():
     """Main function to run auto Gmail monitoring"""
-    print("📧 AUTO GMAIL MONITOR - Automatic Resume Detection")
-    print("=" * 60)
+    configure_logging()
+    
+    logger.info("📧 AUTO GMAIL MONITOR - Automatic Resume Detection")
+    logger.info("=" * 60)
     
     # Initialize auto monitor
     monitor = AutoGmailMonitor()
     
     # Show current folder status
     status = monitor.get_folder_summary()
-    print(f"\n📁 Current incoming_resumes folder:")
-    print(f"   PDF files: {status.get('pdf_count', 0)}")
-    print(f"   TXT files: {status.get('txt_count', 0)}")
-    print(f"   Total: {status.get('total_files', 0)} files")
+    logger.info("\n📁 Current incoming_resumes folder:")
+    logger.info("   PDF files: %s", status.get('pdf_count', 0))
+    logger.info("   TXT files: %s", status.get('txt_count', 0))
+    logger.info("   Total: %s files", status.get('total_files', 0))
+    
+    # One Gmail fetch serves both the report and the download stage
+    messages = monitor.fetch_messages_with_attachments(max_results=10) or []
+    monitor.list_recent_messages(messages=messages)
     
     # Automatically scan Gmail and download resume PDFs
-    new_files = monitor.auto_monitor_and_download(max_emails=10)
+    new_files = monitor.auto_monitor_and_download(max_emails=10, messages=messages)
     
     # Show updated status
     updated_status = monitor.get_folder_summary()
-    print(f"\n📊 Updated status:")
-    print(f"   Total files now: {updated_status.get('total_files', 0)}")
+    logger.info("\n📊 Updated status:")
+    logger.info("   Total files now: %s", updated_status.get('total_files', 0))
     
     if new_files:
-        print(f"\n🚀 Next step: Run the main pipeline to process new resumes:")
-        print(f"   python ultimate_ai_recruiter_pipeline.py")
+        logger.info("\n🚀 Next step: Run the main pipeline to process new resumes:")
+        logger.info("   python ultimate_ai_recruiter_pipeline.py")
     else:
-        print(f"\n💡 No new files downloaded. Current files can be processed with:")
-        print(f"   python ultimate_ai_recruiter_pipeline.py")
+        logger.info("\n💡 No new files downloaded. Current files can be processed with:")
+        logger.info("   python ultimate_ai_recruiter_pipeline.py")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+🗂️ CANDIDATE CACHE MODULE
+Remembers enrichment and scoring results per resume across pipeline runs
+
+Entries are keyed by the sha256 of the resume file, so re-running the
+pipeline on the same PDFs skips the LinkedIn/LLM enrichment and scoring
+calls. Entries expire after a TTL; scores are also tied to the criteria
+they were computed with.
+"""
+
+import time
+import sqlite3
+import hashlib
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+import orjson
+
+DEFAULT_CACHE_PATH = Path("output/.cache/candidates.sqlite")
+DEFAULT_TTL_DAYS = 30
+
+
+def file_sha256(path: Path) -> str:
+    """Hex sha256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def criteria_sha256(criteria: Dict) -> str:
+    """Stable fingerprint of a scoring criteria dict"""
+    return hashlib.sha256(orjson.dumps(criteria, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+class CandidateCache:
+    """SQLite store of enriched records and scores keyed by resume hash"""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, ttl_days: int = DEFAULT_TTL_DAYS):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite file holding cached candidates
+            ttl_days: Entries older than this are treated as misses
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 24 * 3600
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS candidates ("
+            "pdf_sha256 TEXT PRIMARY KEY, enriched_json BLOB, score REAL, "
+            "rationale TEXT, criteria_sha256 TEXT, updated_at INT)"
+        )
+        self._db.commit()
+
+    def _fresh_row(self, pdf_sha256: str, columns: str):
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {columns}, updated_at FROM candidates WHERE pdf_sha256 = ?", (pdf_sha256,)
+            ).fetchone()
+        if not row or time.time() - row[-1] > self.ttl_seconds:
+            return None
+        return row[:-1]
+
+    def get_enriched(self, pdf_sha256: str) -> Optional[Dict]:
+        """Cached enriched candidate for this resume, or None"""
+        row = self._fresh_row(pdf_sha256, "enriched_json")
+        if not row or row[0] is None:
+            return None
+        return orjson.loads(row[0])
+
+    def set_enriched(self, pdf_sha256: str, candidate: Dict) -> None:
+        """Store an enriched candidate (drops any score computed from older data)"""
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO candidates (pdf_sha256, enriched_json, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(pdf_sha256) DO UPDATE SET enriched_json = excluded.enriched_json, "
+                "score = NULL, rationale = NULL, criteria_sha256 = NULL, updated_at = excluded.updated_at",
+                (pdf_sha256, orjson.dumps(candidate, option=orjson.OPT_NON_STR_KEYS), int(time.time()))
+            )
+            self._db.commit()
+
+    def get_score(self, pdf_sha256: str, criteria: Dict) -> Optional[Dict]:
+        """Cached {'score', 'rationale'} for this resume under these criteria, or None"""
+        row = self._fresh_row(pdf_sha256, "score, rationale, criteria_sha256")
+        if not row or row[0] is None or row[2] != criteria_sha256(criteria):
+            return None
+        return {"score": row[0], "rationale": row[1]}
+
+    def set_score(self, pdf_sha256: str, criteria: Dict, score: float, rationale: str) -> None:
+        """Store a score for a resume (creating its entry if enrichment wasn't cached)"""
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO candidates (pdf_sha256, score, rationale, criteria_sha256, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(pdf_sha256) DO UPDATE SET score = excluded.score, "
+                "rationale = excluded.rationale, criteria_sha256 = excluded.criteria_sha256",
+                (pdf_sha256, score, rationale, criteria_sha256(criteria), int(time.time()))
+            )
+            self._db.commit()
+
+
+@lru_cache(maxsize=1)
+def get_candidate_cache() -> CandidateCache:
+    """Process-wide candidate cache"""
+    return CandidateCache()
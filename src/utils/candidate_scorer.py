@@ -5,46 +5,167 @@ Simple scoring logic - no Composio needed
 """
 
 import os
+import logging
+import re
 import json
 import time
-from typing import Tuple, Dict, List
-from groq import Groq
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Dict, List, Literal, Optional
+import httpx
+import numpy as np
+from groq import Groq, AsyncGroq
+from .llm_cache import CachingGroq, get_llm_cache, get_sentence_encoder
+from .http_pool import get_groq_client, get_async_http_client
+from .candidate_cache import criteria_sha256
+from .logging_setup import configure_logging
+from .retry import acall_with_retry, call_with_retry
+from ..config.legacy_config import (
+    GROQ_MAX_CONCURRENT, SCORE_PREFILTER_THRESHOLD, SCORE_MODE, SCORE_AUTO_MARGIN
+)
+
+logger = logging.getLogger(__name__)
+
+# Where a score came from ('score_source'); only LLM scores are worth keeping across runs
+SCORE_SOURCE_LLM = "llm"
+SCORE_SOURCE_HEURISTIC = "heuristic"
+SCORE_SOURCE_PREFILTER = "prefilter"
+
+
+_DECODER = json.JSONDecoder()
+# Markdown code fences the model sometimes wraps its JSON in
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.M)
+
+
+def _parse_llm_json(content: str):
+    """First JSON object in an LLM reply (code fences and trailing text ignored), or None"""
+    content = _FENCE_RE.sub("", content)
+    start = content.find("{")
+    if start == -1:
+        return None
+    return _DECODER.raw_decode(content, start)[0]
+
+
+# Prompt text for score_candidate / the batch scorer; filled in with str.format
+SCORING_PROMPT_TEMPLATE = """You are an expert technical recruiter at a top company.
+Evaluate the candidate strictly according to the following company criteria:
+{criteria}
+
+Candidate Details:
+{candidate}
+
+Provide a JSON output with:
+- score: number between 1 and 10 (can include decimals like 8.5)
+- rationale: one-paragraph explanation why the candidate deserves that score, highlighting strengths and gaps
+
+Return only JSON. Example: {{"score": 8.7, "rationale": "Excellent skills in AI and leadership with 5 years experience. Minor gap in cloud computing."}}
+"""
+
+# SCORING_PROMPT_TEMPLATE split around the candidate; the tail has no fields left to fill
+_SCORING_PROMPT_HEAD, _SCORING_PROMPT_TAIL = SCORING_PROMPT_TEMPLATE.split("{candidate}")
+_SCORING_PROMPT_TAIL = _SCORING_PROMPT_TAIL.format()
+
+BATCH_SCORING_PROMPT_TEMPLATE = """You are an expert technical recruiter at a top company.
+Evaluate each candidate strictly according to the following company criteria:
+{criteria}
+
+Candidates:
+{candidates}
+
+Provide a JSON object whose "results" array has one object per candidate:
+- idx: the candidate's number from the list above
+- score: number between 1 and 10 (can include decimals like 8.5)
+- reason: one-paragraph explanation why the candidate deserves that score, highlighting strengths and gaps
+
+Return only the JSON object. Example: {{"results": [{{"idx": 1, "score": 8.7, "reason": "Excellent skills in AI and leadership with 5 years experience. Minor gap in cloud computing."}}]}}
+"""
 
 
 class CandidateScorer:
     """Score candidates based on company-defined criteria"""
     
-    def __init__(self, groq_api_key: str = None, model: str = "llama-3.1-8b-instant"):
+    def __init__(self, groq_api_key: str = None, model: str = "llama-3.1-8b-instant",
+                 http_client: httpx.Client = None, quiet: bool = False):
         """
         Initialize the scorer
         
         Args:
             groq_api_key: Groq API key (defaults to env var)
             model: Groq model to use for scoring
+            http_client: Connection pool for Groq calls (defaults to the shared pool)
+            quiet: Log per-candidate details at DEBUG; score_candidates still logs its summary
         """
         self.api_key = groq_api_key or os.getenv("GROQ_API_KEY")
         self.model = model
-        self.client = Groq(api_key=self.api_key) if self.api_key else None
+        self._detail_level = logging.DEBUG if quiet else logging.INFO
+        self.client = None
+        if self.api_key:
+            groq = Groq(api_key=self.api_key, http_client=http_client) if http_client else get_groq_client(self.api_key)
+            # Exact hits only: a batch prompt that merely resembles another (same
+            # criteria head, same first candidate) must not reuse its scores
+            self.client = CachingGroq(groq, get_llm_cache(), semantic=False)
+        
+        self._async_client = None
+        self._async_loop = None
+        self._criteria_vectors: Dict[str, np.ndarray] = {}
+        self._criteria_json_cache = None  # (criteria_sha256, its JSON, scoring-prompt head) from the last prompt
+        self._criteria_skills_cache = None  # (criteria_sha256, required, preferred) for the heuristic
         
         if not self.client:
-            print("⚠️  Warning: GROQ_API_KEY not found, will use heuristic scoring only")
+            logger.warning("⚠️  Warning: GROQ_API_KEY not found, will use heuristic scoring only")
+    
+    @property
+    def async_client(self) -> CachingGroq:
+        """AsyncGroq client bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            groq = AsyncGroq(api_key=self.api_key, http_client=get_async_http_client())
+            self._async_client = CachingGroq(groq, get_llm_cache(), is_async=True, semantic=False)
+            self._async_loop = loop
+        return self._async_client
         
+    def _criteria_prompt(self, criteria: Dict) -> Tuple[str, str]:
+        """
+        (criteria JSON, scoring prompt up to the candidate) for this criteria dict
+        
+        Built once per distinct criteria content (keyed on criteria_sha256, so a
+        dict edited in place is picked up), and each candidate prompt is just
+        head + candidate JSON + tail.
+        """
+        key = criteria_sha256(criteria)
+        cached = self._criteria_json_cache
+        if cached is None or cached[0] != key:
+            criteria_json = json.dumps(criteria, indent=2)
+            cached = (key, criteria_json, _SCORING_PROMPT_HEAD.format(criteria=criteria_json))
+            self._criteria_json_cache = cached
+        return cached[1], cached[2]
+    
+    def _criteria_json(self, criteria: Dict) -> str:
+        """criteria as prompt JSON, serialized once per distinct criteria content"""
+        return self._criteria_prompt(criteria)[0]
+    
     def _make_scoring_prompt(self, candidate: Dict, criteria: Dict) -> str:
         """Create the prompt for AI scoring"""
-        return f"""You are an expert technical recruiter at a top company.
-Evaluate the candidate strictly according to the following company criteria:
-{json.dumps(criteria, indent=2)}
-
-Candidate Details:
-{json.dumps(candidate, indent=2)}
-
-Provide a JSON output with:
-- score: number between 1 and 10 (can include decimals like 8.5)
-- rationale: one-paragraph explanation why the candidate deserves that score, highlighting strengths and gaps
+        return self._criteria_prompt(criteria)[1] + json.dumps(candidate, indent=2) + _SCORING_PROMPT_TAIL
 
-Return only JSON. Example: {{"score": 8.7, "rationale": "Excellent skills in AI and leadership with 5 years experience. Minor gap in cloud computing."}}
-"""
+    def _make_batch_scoring_prompt(self, candidates: List[Dict], criteria: Dict) -> str:
+        """Create one prompt that scores several candidates against a single copy of the criteria"""
+        numbered = "\n\n".join(
+            f"{i}. {json.dumps(candidate, indent=2)}" for i, candidate in enumerate(candidates, 1)
+        )
+        return BATCH_SCORING_PROMPT_TEMPLATE.format(criteria=self._criteria_json(criteria), candidates=numbered)
 
+    def _criteria_skill_sets(self, criteria: Dict) -> Tuple[frozenset, frozenset]:
+        """Lowercased (required, preferred) skills, computed once per distinct criteria content"""
+        key = criteria_sha256(criteria)
+        cached = self._criteria_skills_cache
+        if cached is None or cached[0] != key:
+            required = frozenset(s.lower() for s in criteria.get("required_skills", []))
+            preferred = frozenset(s.lower() for s in criteria.get("preferred_skills", []))
+            cached = (key, required, preferred)
+            self._criteria_skills_cache = cached
+        return cached[1], cached[2]
+    
     def _heuristic_score(self, candidate: Dict, criteria: Dict) -> Tuple[float, str]:
         """
         Fallback heuristic scoring if AI is unavailable
@@ -55,9 +176,13 @@ Return only JSON. Example: {{"score": 8.7, "rationale": "Excellent skills in AI
         - Each year of experience: +0.5 points
         - Max score: 10.0
         """
+        required, preferred = self._criteria_skill_sets(criteria)
+        return self._heuristic_score_fast(candidate, required, preferred)
+    
+    def _heuristic_score_fast(self, candidate: Dict, required: frozenset,
+                              preferred: frozenset) -> Tuple[float, str]:
+        """_heuristic_score against skill sets that are already lowercased"""
         skills = set(s.lower() for s in candidate.get("skills", []))
-        required = set(s.lower() for s in criteria.get("required_skills", []))
-        preferred = set(s.lower() for s in criteria.get("preferred_skills", []))
         
         required_matches = skills & required
         preferred_matches = skills & preferred
@@ -78,58 +203,291 @@ Return only JSON. Example: {{"score": 8.7, "rationale": "Excellent skills in AI
         
         return score, rationale
 
-    def score_candidate(self, candidate: Dict, criteria: Dict) -> Tuple[float, str]:
+    def score_candidate(self, candidate: Dict, criteria: Dict,
+                        mode: Literal["ai", "heuristic", "auto"] = "ai",
+                        min_score: Optional[float] = None) -> Tuple[float, str]:
         """
         Score a candidate using AI or heuristic fallback
         
         Args:
             candidate: Candidate data dictionary
             criteria: Company criteria dictionary
+            mode: "ai" (LLM, heuristic fallback), "heuristic" (no LLM call), or
+                "auto" (heuristic first; LLM only when it lands within
+                SCORE_AUTO_MARGIN of min_score)
+            min_score: Shortlist threshold the "auto" mode decides against
             
         Returns:
             Tuple of (score, rationale)
         """
+        score, rationale, _ = self._score_candidate(candidate, criteria, mode, min_score)
+        return score, rationale
+    
+    def _score_candidate(self, candidate: Dict, criteria: Dict, mode: str = "ai",
+                         min_score: Optional[float] = None) -> Tuple[float, str, str]:
+        """score_candidate plus the score's source (SCORE_SOURCE_LLM or SCORE_SOURCE_HEURISTIC)"""
+        if mode == "heuristic":
+            return (*self._heuristic_score(candidate, criteria), SCORE_SOURCE_HEURISTIC)
+        
+        heuristic = None
+        if mode == "auto" and min_score is not None:
+            # Clear passes and clear misses don't need an LLM round-trip
+            heuristic = self._heuristic_score(candidate, criteria)
+            if abs(heuristic[0] - min_score) >= SCORE_AUTO_MARGIN:
+                return (*heuristic, SCORE_SOURCE_HEURISTIC)
+        
         # Try AI scoring first
         if self.client and self.api_key:
             try:
                 prompt = self._make_scoring_prompt(candidate, criteria)
                 
-                response = self.client.chat.completions.create(
+                # 429 / 5xx are retried with backoff before falling back
+                response = call_with_retry(
+                    self.client.chat.completions.create,
                     messages=[{"role": "user", "content": prompt}],
                     model=self.model,
                     temperature=0.3,
                 )
                 
-                content = response.choices[0].message.content.strip()
-                
-                # Clean up markdown code blocks if present
-                if content.startswith("```"):
-                    lines = content.splitlines()
-                    content = "\n".join(lines[1:-1]).strip()
-                
-                # Extract JSON
-                start = content.find("{")
-                end = content.rfind("}") + 1
-                
-                if start != -1 and end > start:
-                    parsed = json.loads(content[start:end])
+                parsed = _parse_llm_json(response.choices[0].message.content)
+                if parsed is not None:
                     score = float(parsed.get("score", 0))
                     rationale = parsed.get("rationale", "")
                     
                     # Validate score range
                     score = max(0.0, min(10.0, score))
                     
-                    return score, rationale
+                    return score, rationale, SCORE_SOURCE_LLM
                     
             except Exception as e:
-                print(f"⚠️  AI scoring failed ({str(e)}), falling back to heuristic...")
-                time.sleep(0.2)
+                logger.warning("⚠️  AI scoring failed (%s), falling back to heuristic...", e)
+                if getattr(e, "status_code", None) == 429:
+                    time.sleep(0.2)  # still rate limited; give the window a moment before the next candidate
         
         # Fallback to heuristic
-        return self._heuristic_score(candidate, criteria)
+        return (*(heuristic or self._heuristic_score(candidate, criteria)), SCORE_SOURCE_HEURISTIC)
+
+    def _score_batch_with_ai(self, batch: List[Dict], criteria: Dict) -> List[Tuple[float, str]]:
+        """
+        Score a batch of candidates in a single AI call
+        
+        Raises:
+            ValueError: If the response can't be mapped back onto every candidate
+        """
+        prompt = self._make_batch_scoring_prompt(batch, criteria)
+        
+        # A transient 429 must not turn one batch call into batch_size single calls
+        response = call_with_retry(
+            self.client.chat.completions.create,
+            messages=[{"role": "user", "content": prompt}],
+            model=self.model,
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        )
+        
+        return self._parse_batch_response(response.choices[0].message.content, len(batch))
+
+    async def _ascore_batch_with_ai(self, batch: List[Dict], criteria: Dict) -> List[Tuple[float, str]]:
+        """Async version of _score_batch_with_ai"""
+        prompt = self._make_batch_scoring_prompt(batch, criteria)
+        
+        response = await acall_with_retry(
+            self.async_client.chat.completions.create,
+            messages=[{"role": "user", "content": prompt}],
+            model=self.model,
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        )
+        
+        return self._parse_batch_response(response.choices[0].message.content, len(batch))
+
+    def _parse_batch_response(self, content: str, batch_len: int) -> List[Tuple[float, str]]:
+        """
+        Map a batch scoring response back onto the batch, in order
+        
+        Raises:
+            ValueError: If the response can't be mapped back onto every candidate
+        """
+        # JSON mode returns {"results": [...]}; a bare array is accepted too
+        stripped = _FENCE_RE.sub("", content).strip()
+        if stripped.startswith("["):
+            results = _DECODER.raw_decode(stripped)[0]
+        else:
+            parsed = _parse_llm_json(stripped)
+            results = parsed.get("results") if isinstance(parsed, dict) else None
+        if not isinstance(results, list):
+            raise ValueError("no results array in batch scoring response")
+        
+        by_idx = {}
+        for item in results:
+            if not isinstance(item, dict):
+                raise ValueError(f"batch scoring result is not an object: {item!r:.80}")
+            score = max(0.0, min(10.0, float(item.get("score", 0))))
+            by_idx[int(item.get("idx", 0))] = (score, item.get("reason", ""))
+        
+        missing = [i for i in range(1, batch_len + 1) if i not in by_idx]
+        if missing:
+            raise ValueError(f"batch scoring response missing candidates {missing}")
+        
+        return [by_idx[i] for i in range(1, batch_len + 1)]
+
+    @staticmethod
+    def _criteria_text(criteria: Dict) -> str:
+        return " ".join([
+            criteria.get("role", ""),
+            ", ".join(criteria.get("required_skills", [])),
+            ", ".join(criteria.get("preferred_skills", [])),
+        ])
+    
+    @staticmethod
+    def _candidate_text(candidate: Dict) -> str:
+        titles = [e.get("title", "") for e in candidate.get("experience", []) if isinstance(e, dict)]
+        return " ".join(str(part) for part in [
+            candidate.get("current_role", ""),
+            candidate.get("summary", ""),
+            ", ".join(map(str, candidate.get("skills", []))),
+            ", ".join(titles),
+        ] if part)
+    
+    def prefilter_candidates(self, candidates: List[Dict], criteria: Dict,
+                             threshold: float = SCORE_PREFILTER_THRESHOLD) -> np.ndarray:
+        """
+        Cheap embedding screen run before the LLM scorer
+        
+        Args:
+            candidates: List of candidate dictionaries
+            criteria: Company criteria dictionary
+            threshold: Minimum cosine similarity to the criteria (0 disables the screen)
+            
+        Returns:
+            Boolean mask, True for candidates worth an LLM score. All True when
+            sentence-transformers isn't installed.
+        """
+        encoder = get_sentence_encoder() if threshold > 0 else None
+        if encoder is None or not candidates:
+            return np.ones(len(candidates), dtype=bool)
+        
+        # Criteria embedding is computed once per distinct criteria
+        criteria_text = self._criteria_text(criteria)
+        if criteria_text not in self._criteria_vectors:
+            self._criteria_vectors[criteria_text] = encoder.encode(criteria_text, normalize_embeddings=True)
+        
+        candidate_vectors = encoder.encode(
+            [self._candidate_text(c) for c in candidates], batch_size=64, normalize_embeddings=True
+        )
+        return candidate_vectors @ self._criteria_vectors[criteria_text] > threshold
+
+    def _triage(self, candidates: List[Dict], criteria: Dict, mode: str,
+                min_score: Optional[float]) -> List[Optional[Tuple[float, str, str]]]:
+        """
+        Heuristic results for candidates `mode` settles without the LLM, None for the rest
+        
+        "heuristic" settles everyone; "auto" settles scores at least
+        SCORE_AUTO_MARGIN away from min_score; "ai" settles no one.
+        """
+        if mode == "heuristic":
+            return [(*self._heuristic_score(c, criteria), SCORE_SOURCE_HEURISTIC) for c in candidates]
+        if mode != "auto" or min_score is None:
+            return [None] * len(candidates)
+        
+        required, preferred = self._criteria_skill_sets(criteria)
+        triaged = []
+        for candidate in candidates:
+            heuristic = self._heuristic_score_fast(candidate, required, preferred)
+            clear = abs(heuristic[0] - min_score) >= SCORE_AUTO_MARGIN
+            triaged.append((*heuristic, SCORE_SOURCE_HEURISTIC) if clear else None)
+        
+        settled = sum(r is not None for r in triaged)
+        if settled:
+            logger.info("⚡ Heuristic settled %s of %s candidate(s) without an LLM call",
+                        settled, len(candidates))
+        return triaged
+    
+    def score_candidates_batch(self, candidates: List[Dict], criteria: Dict, batch_size: int = 10,
+                               mode: str = SCORE_MODE, min_score: Optional[float] = None) -> List[Dict]:
+        """
+        Score candidates with one AI call per batch instead of one per candidate
+        
+        Args:
+            candidates: List of candidate dictionaries
+            criteria: Company criteria dictionary
+            batch_size: Number of candidates scored per AI call
+            mode: "ai", "heuristic" or "auto" as in score_candidate (default: $SCORE_MODE);
+                only candidates the heuristic doesn't settle are batched to the LLM
+            min_score: Shortlist threshold the "auto" mode decides against
+            
+        Returns:
+            List of dicts with 'score', 'rationale' and 'score_source' keys, in input order
+        """
+        triaged = self._triage(candidates, criteria, mode, min_score)
+        need_llm = [i for i, r in enumerate(triaged) if r is None]
+        pending = [candidates[i] for i in need_llm]
+        results = []
+        
+        for offset in range(0, len(pending), batch_size):
+            batch = pending[offset:offset + batch_size]
+            scored = None
+            
+            if self.client and self.api_key:
+                try:
+                    scored = [(score, rationale, SCORE_SOURCE_LLM)
+                              for score, rationale in self._score_batch_with_ai(batch, criteria)]
+                except Exception as e:
+                    logger.warning("⚠️  Batch scoring failed (%s), scoring candidates individually...", e)
+            
+            if scored is None:
+                scored = [self._score_candidate(candidate, criteria) for candidate in batch]
+            
+            results.extend(scored)
+        
+        for i, scored in zip(need_llm, results):
+            triaged[i] = scored
+        return [
+            {"score": score, "rationale": rationale, "score_source": source}
+            for score, rationale, source in triaged
+        ]
+
+    async def ascore_candidates_batch(self, candidates: List[Dict], criteria: Dict, batch_size: int = 10,
+                                      mode: str = SCORE_MODE, min_score: Optional[float] = None) -> List[Dict]:
+        """
+        Score candidates like score_candidates_batch, with batches in flight concurrently
+        
+        At most GROQ_MAX_CONCURRENT batches (including their per-candidate
+        fallbacks) run at once so large runs stay under the Groq rate limit.
+        mode / min_score work as in score_candidates_batch.
+        
+        Returns:
+            List of dicts with 'score', 'rationale' and 'score_source' keys, in input order
+        """
+        sem = asyncio.Semaphore(GROQ_MAX_CONCURRENT)
+        
+        async def score_batch(batch: List[Dict]) -> List[Tuple[float, str, str]]:
+            async with sem:
+                if self.client and self.api_key:
+                    try:
+                        scored = await self._ascore_batch_with_ai(batch, criteria)
+                        return [(score, rationale, SCORE_SOURCE_LLM) for score, rationale in scored]
+                    except Exception as e:
+                        logger.warning("⚠️  Batch scoring failed (%s), scoring candidates individually...", e)
+                # Still holding sem, so a rate-limited run can't fan out into uncapped single calls
+                return await asyncio.to_thread(lambda: [self._score_candidate(c, criteria) for c in batch])
+        
+        triaged = self._triage(candidates, criteria, mode, min_score)
+        need_llm = [i for i, r in enumerate(triaged) if r is None]
+        pending = [candidates[i] for i in need_llm]
+        
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        scored_batches = await asyncio.gather(*(score_batch(b) for b in batches))
+        
+        for i, scored in zip(need_llm, (s for batch in scored_batches for s in batch)):
+            triaged[i] = scored
+        return [
+            {"score": score, "rationale": rationale, "score_source": source}
+            for score, rationale, source in triaged
+        ]
 
     def score_candidates(self, candidates: List[Dict], criteria: Dict, 
-                        min_score: float = 4.0) -> List[Dict]:
+                        min_score: float = 4.0, mode: str = SCORE_MODE) -> List[Dict]:
         """
         Score multiple candidates and filter by minimum score
         
@@ -137,24 +495,40 @@ Return only JSON. Example: {{"score": 8.7, "rationale": "Excellent skills in AI
             candidates: List of candidate dictionaries
             criteria: Company criteria dictionary
             min_score: Minimum score threshold for shortlisting
+            mode: Scoring mode passed to score_candidate (default: $SCORE_MODE)
             
         Returns:
             List of shortlisted candidates with scores and rationale
         """
         shortlisted = []
         
-        for candidate in candidates:
+        # Groq calls are network-bound, so score up to GROQ_MAX_CONCURRENT candidates at once
+        def score(candidate: Dict) -> Tuple[float, str]:
+            return self.score_candidate(candidate, criteria, mode=mode, min_score=min_score)
+        
+        if len(candidates) < 2:
+            scores = [score(c) for c in candidates]
+        else:
+            with ThreadPoolExecutor(max_workers=min(GROQ_MAX_CONCURRENT, len(candidates))) as executor:
+                scores = list(executor.map(score, candidates))
+        
+        level = self._detail_level
+        detailed = logger.isEnabledFor(level)
+        for candidate, (score, rationale) in zip(candidates, scores):
             name = candidate.get("full_name", candidate.get("name", "Unknown"))
             email = candidate.get("email", "")
+            shortlist = score >= min_score
             
-            print(f"📊 Evaluating {name}...")
-            
-            score, rationale = self.score_candidate(candidate, criteria)
-            
-            print(f"   → Score: {score}/10")
-            print(f"   → Rationale: {rationale[:100]}...")
+            if detailed:
+                logger.log(level, "📊 Evaluating %s...", name)
+                logger.log(level, "   → Score: %s/10", score)
+                logger.log(level, "   → Rationale: %s...", rationale[:100])
+                if shortlist:
+                    logger.log(level, "   ✅ SHORTLISTED")
+                else:
+                    logger.log(level, "   ❌ Below threshold (%s)", min_score)
             
-            if score >= min_score:
+            if shortlist:
                 shortlisted.append({
                     "name": name,
                     "full_name": name,
@@ -163,10 +537,8 @@ Return only JSON. Example: {{"score": 8.7, "rationale": "Excellent skills in AI
                     "rationale": rationale,
                     "original_data": candidate  # Keep original for reference
                 })
-                print(f"   ✅ SHORTLISTED")
-            else:
-                print(f"   ❌ Below threshold ({min_score})")
         
+        logger.info("📊 Scored %s candidates: %s shortlisted at >= %s/10", len(candidates), len(shortlisted), min_score)
         return shortlisted
     
     def score_single_candidate(self, candidate: Dict, criteria: Dict) -> Dict:
@@ -207,6 +579,7 @@ if __name__ == "__main__":
     # Example usage
     from dotenv import load_dotenv
     load_dotenv()
+    configure_logging()
     
     scorer = CandidateScorer()
     
@@ -222,5 +595,5 @@ if __name__ == "__main__":
     }
     
     score, rationale = scorer.score_candidate(test_candidate, DEFAULT_CRITERIA)
-    print(f"\n🎯 Final Score: {score}/10")
-    print(f"📝 Rationale: {rationale}")
+    logger.info("\n🎯 Final Score: %s/10", score)
+    logger.info("📝 Rationale: %s", rationale)
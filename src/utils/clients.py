@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+🔌 SHARED CLIENTS MODULE
+Lazily-built, process-wide instances of the pipeline's service classes
+
+Constructing these opens Composio/Groq clients (and their TLS pools), so the
+pipeline nodes reuse one instance each instead of rebuilding them every run.
+"""
+
+import threading
+from functools import lru_cache, wraps
+
+from typing import TYPE_CHECKING
+
+# Service modules pull in composio/groq, so each is imported by its getter on first use
+if TYPE_CHECKING:
+    from .auto_gmail_monitor import AutoGmailMonitor
+    from .pdf_extractor import PDFExtractor
+    from .linkedin_enricher import LinkedInEnricher
+    from .candidate_scorer import CandidateScorer
+    from .interview_scheduler import InterviewScheduler
+    from .google_sheets_manager import GoogleSheetsManager
+    from ..agents.recruitment_agent import RecruitmentAgent
+
+# One lock for all getters so concurrent nodes never build the same client twice
+_init_lock = threading.RLock()
+
+
+def _shared(factory):
+    """Cache a zero-arg factory's result, building it at most once"""
+    cached = lru_cache(maxsize=1)(factory)
+
+    @wraps(factory)
+    def getter():
+        with _init_lock:
+            return cached()
+
+    getter.cache_clear = cached.cache_clear
+    return getter
+
+
+@_shared
+def get_gmail_monitor() -> "AutoGmailMonitor":
+    from .auto_gmail_monitor import AutoGmailMonitor
+    return AutoGmailMonitor()
+
+
+@_shared
+def get_extractor() -> "PDFExtractor":
+    from .pdf_extractor import PDFExtractor
+    return PDFExtractor()
+
+
+@_shared
+def get_enricher() -> "LinkedInEnricher":
+    from .linkedin_enricher import LinkedInEnricher
+    return LinkedInEnricher()
+
+
+@_shared
+def get_scorer() -> "CandidateScorer":
+    from .candidate_scorer import CandidateScorer
+    return CandidateScorer()
+
+
+@_shared
+def get_scheduler() -> "InterviewScheduler":
+    from .interview_scheduler import InterviewScheduler
+    return InterviewScheduler()
+
+
+@_shared
+def get_sheets_manager() -> "GoogleSheetsManager":
+    from .google_sheets_manager import GoogleSheetsManager
+    return GoogleSheetsManager()
+
+
+@_shared
+def get_agent() -> "RecruitmentAgent":
+    from ..agents.recruitment_agent import RecruitmentAgent
+    return RecruitmentAgent()
@@ -5,9 +5,14 @@ Handles Google Sheets creation and data population via Composio
 """
 
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
-from composio import ComposioToolSet, Action
+from typing import Any, Callable, List, Dict, Optional, Tuple
+from composio import Action
+from .http_pool import get_composio_toolset
+from .logging_setup import configure_logging
+from .retry import call_with_retry
 from ..config.legacy_config import (
     COMPOSIO_API_KEY, 
     GOOGLE_SHEETS_ACCOUNT_ID, 
@@ -15,22 +20,179 @@ from ..config.legacy_config import (
     GOOGLE_SHEETS_AUTH_CONFIG_ID
 )
 
+logger = logging.getLogger(__name__)
+
+# Big sheets are written in blocks of this many rows, several at a time
+SHEET_CHUNK_ROWS = 1000
+SHEETS_UPLOAD_CONCURRENCY = 5
+
+
+def _text(key: str) -> Callable[[Dict], str]:
+    """Column formatter for a plain text field"""
+    return lambda candidate: str(candidate.get(key, '')).strip()
+
+
+def _join_list(values, limit: int, show_overflow: bool = False) -> str:
+    """First `limit` items comma-joined, with a (+N) suffix for the rest if requested"""
+    if isinstance(values, list) and values:
+        text = ', '.join(str(v) for v in values[:limit])
+        if show_overflow and len(values) > limit:
+            text += f" (+{len(values)-limit})"
+        return text
+    return str(values) if values else ""
+
+
+def _fmt_experience(candidate: Dict) -> str:
+    years = str(candidate.get('years_of_experience', '')).strip()
+    if not years:
+        exp_count = len(candidate.get('experience', []))
+        years = f"{exp_count} roles" if exp_count > 0 else ""
+    return years
+
+
+def _fmt_skills(candidate: Dict) -> str:
+    """Top 4 skills for readability"""
+    skills = candidate.get('skills', [])
+    if isinstance(skills, list) and skills:
+        return _join_list(skills, 4, show_overflow=True)
+    return str(candidate.get('key_competencies', ''))[:60]
+
+
+def _fmt_education(candidate: Dict) -> str:
+    """First degree with key info"""
+    edu_list = candidate.get('education', [])
+    if not edu_list or not isinstance(edu_list, list):
+        return ""
+    first_edu = edu_list[0]
+    if isinstance(first_edu, dict):
+        degree = first_edu.get('degree', '')
+        school = first_edu.get('institution', '')
+        year = first_edu.get('year', '')
+        
+        parts = []
+        if degree: parts.append(degree)
+        if school: parts.append(f"from {school}")
+        if year: parts.append(f"({year})")
+        return " ".join(parts)
+    if isinstance(first_edu, str):
+        return first_edu
+    return ""
+
+
+def _fmt_linkedin_status(candidate: Dict) -> str:
+    if candidate.get('linkedin_verified'):
+        return "Verified"
+    if candidate.get('linkedin_has_profile') or str(candidate.get('linkedin_url', '')).strip():
+        return "Profile Found"
+    return "No Profile"
+
+
+def _fmt_summary(candidate: Dict) -> str:
+    """Professional summary (full, no truncation)"""
+    summary_parts = []
+    linkedin_summary = candidate.get('linkedin_summary', '')
+    original_summary = candidate.get('summary', '')
+    
+    if linkedin_summary:
+        summary_parts.append(linkedin_summary)
+    if original_summary and original_summary not in linkedin_summary:
+        summary_parts.append(original_summary)
+    
+    full_summary = ' | '.join(filter(None, summary_parts))
+    if not full_summary:
+        full_summary = candidate.get('professional_value', '')
+    if not full_summary:
+        role = str(candidate.get('current_role', '')).strip()
+        full_summary = f"{role} professional" if role else "Professional"
+    return full_summary
+
+
+def _fmt_achievements(candidate: Dict) -> str:
+    """Up to 3 achievements from the two most recent roles"""
+    achievements = []
+    experience = candidate.get('experience', [])
+    if isinstance(experience, list):
+        for exp in experience[:2]:
+            if isinstance(exp, dict) and exp.get('achievements'):
+                exp_achievements = exp['achievements']
+                if isinstance(exp_achievements, list):
+                    achievements.extend([str(a) for a in exp_achievements[:2]])
+    return '; '.join(achievements[:3])
+
+
+def _fmt_projects(candidate: Dict) -> str:
+    """Top 2 project names"""
+    projects = candidate.get('projects', [])
+    if not isinstance(projects, list) or not projects:
+        return ""
+    project_names = []
+    for p in projects[:2]:
+        if isinstance(p, dict) and p.get('name'):
+            project_names.append(str(p['name']))
+        elif isinstance(p, str):
+            project_names.append(p)
+    project_text = ', '.join(project_names)
+    if len(projects) > 2:
+        project_text += f" (+{len(projects)-2})"
+    return project_text
+
+
+def _dedupe_candidates(candidates: List[Dict]) -> List[Dict]:
+    """Drop repeats of the same (email, name); candidates with neither are all kept"""
+    seen = set()
+    unique = []
+    for candidate in candidates:
+        key = (str(candidate.get('email') or '').strip().lower(),
+               str(candidate.get('full_name') or '').strip().lower())
+        if key != ('', ''):
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(candidate)
+    return unique
+
+
+# Recruiter sheet layout: (header, formatter taking the candidate dict)
+SHEET_COLUMNS: List[Tuple[str, Callable[[Dict], Any]]] = [
+    ("Name", _text('full_name')),
+    ("Email", _text('email')),
+    ("Phone", _text('phone')),
+    ("Role", _text('current_role')),
+    ("Company", _text('company')),
+    ("Experience", _fmt_experience),
+    ("Skills", _fmt_skills),
+    ("Location", _text('location')),
+    ("Education", _fmt_education),
+    ("LinkedIn", _text('linkedin_url')),
+    ("LinkedIn Status", _fmt_linkedin_status),
+    ("GitHub", _text('github_url')),
+    ("Portfolio", _text('portfolio_url')),
+    ("Professional Summary", _fmt_summary),
+    ("Key Achievements", _fmt_achievements),
+    ("Certifications", lambda c: _join_list(c.get('certifications', []), 3, show_overflow=True)),
+    ("Projects", _fmt_projects),
+    ("Languages", lambda c: _join_list(c.get('languages', []), 3)),
+    ("Awards", lambda c: _join_list(c.get('awards', []), 2)),
+    ("Data Source", lambda c: c.get('source', 'Unknown')),
+]
+
 
 class GoogleSheetsManager:
     """Google Sheets Creation and Management Service"""
     
     def __init__(self):
-        self.composio_toolset = ComposioToolSet(api_key=COMPOSIO_API_KEY)
+        self.composio_toolset = get_composio_toolset(COMPOSIO_API_KEY)
         self.working_account_id = GOOGLE_SHEETS_ACCOUNT_ID
         self.entity_id = GOOGLE_SHEETS_USER_ID
-        print("📊 Google Sheets Manager initialized")
+        logger.info("📊 Google Sheets Manager initialized")
     
     def create_empty_sheet(self, sheet_title: str) -> Optional[Dict]:
         """Create a new empty Google Sheet"""
         try:
-            print(f"📊 Creating Google Sheet: {sheet_title}")
+            logger.info("📊 Creating Google Sheet: %s", sheet_title)
             
-            create_result = self.composio_toolset.execute_action(
+            create_result = call_with_retry(
+                self.composio_toolset.execute_action,
                 action=Action.GOOGLESHEETS_CREATE_GOOGLE_SHEET1,
                 params={"title": sheet_title},
                 entity_id=self.entity_id
@@ -41,8 +203,8 @@ class GoogleSheetsManager:
                 spreadsheet_id = sheet_data['spreadsheetId']
                 spreadsheet_url = sheet_data['spreadsheetUrl']
                 
-                print(f"✅ Sheet created successfully!")
-                print(f"🔗 Sheet URL: {spreadsheet_url}")
+                logger.info("✅ Sheet created successfully!")
+                logger.info("🔗 Sheet URL: %s", spreadsheet_url)
                 
                 return {
                     'spreadsheet_id': spreadsheet_id,
@@ -50,232 +212,173 @@ class GoogleSheetsManager:
                     'success': True
                 }
             else:
-                print(f"❌ Failed to create Google Sheet")
-                print(f"Error: {create_result}")
+                logger.error("❌ Failed to create Google Sheet: %s", create_result)
                 return None
                 
         except Exception as e:
-            print(f"❌ Sheet creation error: {str(e)}")
+            logger.error("❌ Sheet creation error: %s", e)
             return None
     
-    def populate_sheet_with_data(self, spreadsheet_id: str, data: List[List], sheet_name: str = "Sheet1") -> bool:
-        """Populate Google Sheet with candidate data"""
+    def create_sheet_with_data(self, sheet_title: str, data: List[List],
+                               sheet_name: str = "Sheet1") -> Optional[Dict]:
+        """
+        Create a Google Sheet already holding `data`, in a single API call
+        
+        Args:
+            sheet_title: Title of the new spreadsheet
+            data: Header row followed by data rows
+            sheet_name: Name of the sheet tab
+            
+        Returns:
+            Same dict as create_empty_sheet, or None on failure
+        """
         try:
-            print(f"📝 Adding {len(data)} rows to Google Sheet...")
+            logger.info("📊 Creating Google Sheet with %s rows: %s", len(data), sheet_title)
             
-            update_result = self.composio_toolset.execute_action(
-                action=Action.GOOGLESHEETS_BATCH_UPDATE,
+            headers, rows = data[0], data[1:]
+            result = call_with_retry(
+                self.composio_toolset.execute_action,
+                action=Action.GOOGLESHEETS_SHEET_FROM_JSON,
                 params={
-                    "spreadsheet_id": spreadsheet_id,
+                    "title": sheet_title,
                     "sheet_name": sheet_name,
-                    "values": data,
-                    "valueInputOption": "RAW"
+                    "sheet_json": [dict(zip(headers, row)) for row in rows]
                 },
                 entity_id=self.entity_id
             )
             
-            if update_result.get('successful'):
-                print(f"✅ Sheet populated successfully!")
+            sheet_data = result.get('data') or {}
+            sheet_data = sheet_data.get('response_data', sheet_data)
+            spreadsheet_id = sheet_data.get('spreadsheetId') or sheet_data.get('spreadsheet_id')
+            if not result.get('successful') or not spreadsheet_id:
+                logger.warning("⚠️ One-shot sheet creation failed: %s", result.get('error'))
+                return None
+            
+            spreadsheet_url = (sheet_data.get('spreadsheetUrl') or sheet_data.get('spreadsheet_url')
+                               or f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}")
+            logger.info("✅ Sheet created and populated!")
+            logger.info("🔗 Sheet URL: %s", spreadsheet_url)
+            
+            return {
+                'spreadsheet_id': spreadsheet_id,
+                'spreadsheet_url': spreadsheet_url,
+                'success': True
+            }
+            
+        except Exception as e:
+            logger.warning("⚠️ One-shot sheet creation error: %s", e)
+            return None
+    
+    def _update_rows(self, spreadsheet_id: str, rows: List[List], sheet_name: str,
+                     first_cell: str = "A1") -> bool:
+        """Write one block of rows starting at `first_cell`"""
+        update_result = call_with_retry(
+            self.composio_toolset.execute_action,
+            action=Action.GOOGLESHEETS_BATCH_UPDATE,
+            params={
+                "spreadsheet_id": spreadsheet_id,
+                "sheet_name": sheet_name,
+                "first_cell_location": first_cell,
+                "values": rows,
+                "valueInputOption": "RAW"
+            },
+            entity_id=self.entity_id
+        )
+        if not update_result.get('successful'):
+            logger.error("❌ Failed to write rows from %s: %s", first_cell, update_result)
+            return False
+        return True
+    
+    def populate_sheet_with_data(self, spreadsheet_id: str, data: List[List], sheet_name: str = "Sheet1") -> bool:
+        """Populate Google Sheet with candidate data (large sheets go up in parallel blocks)"""
+        try:
+            logger.info("📝 Adding %s rows to Google Sheet...", len(data))
+            
+            if len(data) <= SHEET_CHUNK_ROWS:
+                success = self._update_rows(spreadsheet_id, data, sheet_name)
+            else:
+                # Header rides along with the first block
+                starts = range(0, len(data), SHEET_CHUNK_ROWS)
+                workers = min(SHEETS_UPLOAD_CONCURRENCY, len(starts))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(
+                        lambda start: self._update_rows(
+                            spreadsheet_id, data[start:start + SHEET_CHUNK_ROWS], sheet_name, f"A{start + 1}"
+                        ),
+                        starts
+                    ))
+                success = all(results)
+                if not success:
+                    logger.warning("⚠️ %s of %s row blocks failed", results.count(False), len(results))
+            
+            if success:
+                logger.info("✅ Sheet populated successfully!")
                 return True
             else:
-                print(f"❌ Failed to populate sheet")
-                print(f"Error: {update_result}")
+                logger.error("❌ Failed to populate sheet")
                 return False
                 
         except Exception as e:
-            print(f"❌ Sheet population error: {str(e)}")
+            logger.error("❌ Sheet population error: %s", e)
             return False
     
     def prepare_candidate_data_for_sheets(self, candidates: List[Dict]) -> List[List]:
         """Convert candidate data to Google Sheets format"""
-        print(f"🔄 Preparing {len(candidates)} candidates for Google Sheets...")
+        logger.info("🔄 Preparing %s candidates for Google Sheets...", len(candidates))
         
-        # Define comprehensive headers for recruiters
-        headers = [
-            "Name", "Email", "Phone", "Role", "Company", 
-            "Experience", "Skills", "Location", "Education", 
-            "LinkedIn", "LinkedIn Status", "GitHub", "Portfolio",
-            "Professional Summary", "Key Achievements", "Certifications",
-            "Projects", "Languages", "Awards", "Data Source"
-        ]
+        unique = _dedupe_candidates(candidates)
+        if len(unique) < len(candidates):
+            logger.info("🔁 Skipping %s duplicate candidate(s)", len(candidates) - len(unique))
+        candidates = unique
         
+        headers = [header for header, _ in SHEET_COLUMNS]
+        formatters = [fmt for _, fmt in SHEET_COLUMNS]
         sheet_data = [headers]
+        sheet_data.extend([fmt(candidate) for fmt in formatters] for candidate in candidates)
         
-        for candidate in candidates:
-            # Extract basic info
-            name = str(candidate.get('full_name', '')).strip()
-            email = str(candidate.get('email', '')).strip()
-            phone = str(candidate.get('phone', '')).strip()
-            role = str(candidate.get('current_role', '')).strip()
-            company = str(candidate.get('company', '')).strip()
-            
-            # Experience years
-            years = str(candidate.get('years_of_experience', '')).strip()
-            if not years:
-                exp_count = len(candidate.get('experience', []))
-                years = f"{exp_count} roles" if exp_count > 0 else ""
-            
-            # Skills (top 4 for readability)
-            skills = candidate.get('skills', [])
-            if isinstance(skills, list) and skills:
-                skill_text = ', '.join(str(s) for s in skills[:4])
-                if len(skills) > 4:
-                    skill_text += f" (+{len(skills)-4})"
-            else:
-                skill_text = str(candidate.get('key_competencies', ''))[:60]
-            
-            # Location
-            location = str(candidate.get('location', '')).strip()
-            
-            # Education (first degree with key info)
-            education = ""
-            edu_list = candidate.get('education', [])
-            if edu_list and isinstance(edu_list, list) and len(edu_list) > 0:
-                first_edu = edu_list[0]
-                if isinstance(first_edu, dict):
-                    degree = first_edu.get('degree', '')
-                    school = first_edu.get('institution', '')
-                    year = first_edu.get('year', '')
-                    
-                    parts = []
-                    if degree: parts.append(degree)
-                    if school: parts.append(f"from {school}")
-                    if year: parts.append(f"({year})")
-                    education = " ".join(parts)
-                elif isinstance(first_edu, str):
-                    education = first_edu
-            
-            # URLs and verification
-            linkedin = str(candidate.get('linkedin_url', '')).strip()
-            
-            # LinkedIn status
-            if candidate.get('linkedin_verified'):
-                linkedin_status = "Verified"
-            elif candidate.get('linkedin_has_profile') or linkedin:
-                linkedin_status = "Profile Found"
-            else:
-                linkedin_status = "No Profile"
-            
-            github = str(candidate.get('github_url', '')).strip()
-            portfolio = str(candidate.get('portfolio_url', '')).strip()
-            
-            # Professional summary (full, no truncation)
-            summary_parts = []
-            linkedin_summary = candidate.get('linkedin_summary', '')
-            original_summary = candidate.get('summary', '')
-            professional_value = candidate.get('professional_value', '')
-            
-            if linkedin_summary:
-                summary_parts.append(linkedin_summary)
-            if original_summary and original_summary not in linkedin_summary:
-                summary_parts.append(original_summary)
-            
-            full_summary = ' | '.join(filter(None, summary_parts))
-            if not full_summary and professional_value:
-                full_summary = professional_value
-            if not full_summary:
-                full_summary = f"{role} professional" if role else "Professional"
-            
-            # Key achievements
-            achievements = []
-            experience = candidate.get('experience', [])
-            if isinstance(experience, list):
-                for exp in experience[:2]:
-                    if isinstance(exp, dict) and exp.get('achievements'):
-                        exp_achievements = exp['achievements']
-                        if isinstance(exp_achievements, list):
-                            achievements.extend([str(a) for a in exp_achievements[:2]])
-            achievement_text = '; '.join(achievements[:3]) if achievements else ""
-            
-            # Certifications (top 3)
-            certifications = candidate.get('certifications', [])
-            if isinstance(certifications, list) and certifications:
-                cert_text = ', '.join(str(cert) for cert in certifications[:3])
-                if len(certifications) > 3:
-                    cert_text += f" (+{len(certifications)-3})"
-            else:
-                cert_text = str(certifications) if certifications else ""
-            
-            # Projects (top 2)
-            projects = candidate.get('projects', [])
-            if isinstance(projects, list) and projects:
-                project_names = []
-                for p in projects[:2]:
-                    if isinstance(p, dict) and p.get('name'):
-                        project_names.append(str(p['name']))
-                    elif isinstance(p, str):
-                        project_names.append(p)
-                project_text = ', '.join(project_names)
-                if len(projects) > 2:
-                    project_text += f" (+{len(projects)-2})"
-            else:
-                project_text = ""
-            
-            # Languages
-            languages = candidate.get('languages', [])
-            if isinstance(languages, list) and languages:
-                lang_text = ', '.join(str(lang) for lang in languages[:3])
-            else:
-                lang_text = str(languages) if languages else ""
-            
-            # Awards
-            awards = candidate.get('awards', [])
-            if isinstance(awards, list) and awards:
-                award_text = ', '.join(str(award) for award in awards[:2])
-            else:
-                award_text = str(awards) if awards else ""
-            
-            # Data source
-            source = candidate.get('source', 'Unknown')
-            
-            # Create row
-            row = [
-                name, email, phone, role, company, years, skill_text, location, education,
-                linkedin, linkedin_status, github, portfolio, full_summary, achievement_text,
-                cert_text, project_text, lang_text, award_text, source
-            ]
-            
-            sheet_data.append(row)
-        
-        print(f"✅ Data prepared: {len(sheet_data)} rows (including header)")
+        logger.info("✅ Data prepared: %s rows (including header)", len(sheet_data))
         return sheet_data
     
     def create_recruiter_sheet(self, candidates: List[Dict], sheet_name_prefix: str = "AI_Recruiter") -> Optional[str]:
         """Create complete Google Sheet with candidate data for recruiters"""
-        print(f"\n📊 GOOGLE SHEETS MANAGER: Creating sheet for {len(candidates)} candidates")
-        print("=" * 60)
+        logger.info("\n📊 GOOGLE SHEETS MANAGER: Creating sheet for %s candidates", len(candidates))
+        logger.info("=" * 60)
         
         if not candidates:
-            print("❌ No candidates provided")
+            logger.error("❌ No candidates provided")
             return None
         
         # Generate sheet name with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
         sheet_title = f"{sheet_name_prefix}_{timestamp}"
         
-        # Step 1: Create empty sheet
-        sheet_info = self.create_empty_sheet(sheet_title)
+        # Step 1: Prepare data
+        sheet_data = self.prepare_candidate_data_for_sheets(candidates)
+        
+        # Step 2: Create the sheet with its rows in one call (small sheets only;
+        # a single huge request is slow and prone to 429s)
+        sheet_info = None
+        if len(sheet_data) <= SHEET_CHUNK_ROWS:
+            sheet_info = self.create_sheet_with_data(sheet_title, sheet_data)
+        success = bool(sheet_info)
         
+        # Otherwise create + populate in blocks
         if not sheet_info:
-            return None
+            sheet_info = self.create_empty_sheet(sheet_title)
+            if not sheet_info:
+                return None
+            success = self.populate_sheet_with_data(sheet_info['spreadsheet_id'], sheet_data)
         
-        spreadsheet_id = sheet_info['spreadsheet_id']
         spreadsheet_url = sheet_info['spreadsheet_url']
         
-        # Step 2: Prepare data
-        sheet_data = self.prepare_candidate_data_for_sheets(candidates)
-        
-        # Step 3: Populate sheet
-        success = self.populate_sheet_with_data(spreadsheet_id, sheet_data)
-        
         if success:
-            print(f"\n🎉 Google Sheet created successfully!")
-            print(f"📊 Sheet contains {len(candidates)} candidates with comprehensive data")
-            print(f"🔗 Share this link: {spreadsheet_url}")
+            logger.info("\n🎉 Google Sheet created successfully!")
+            logger.info("📊 Sheet contains %s candidates with comprehensive data", len(candidates))
+            logger.info("🔗 Share this link: %s", spreadsheet_url)
             return spreadsheet_url
         else:
-            print(f"\n⚠️ Sheet created but data population failed")
-            print(f"🔗 Empty sheet: {spreadsheet_url}")
+            logger.warning("\n⚠️ Sheet created but data population failed")
+            logger.info("🔗 Empty sheet: %s", spreadsheet_url)
             return spreadsheet_url
     
     def get_sheet_summary(self, candidates: List[Dict]) -> Dict:
@@ -283,17 +386,41 @@ class GoogleSheetsManager:
         if not candidates:
             return {"total": 0}
         
+        # One pass over the candidates for every count
+        with_linkedin = verified_linkedin = with_email = with_phone = 0
+        with_skills = total_skills = with_experience = with_education = 0
+        sources = set()
+        for c in candidates:
+            get = c.get
+            if get('linkedin_url'):
+                with_linkedin += 1
+            if get('linkedin_verified'):
+                verified_linkedin += 1
+            if get('email'):
+                with_email += 1
+            if get('phone'):
+                with_phone += 1
+            skills = get('skills')
+            if skills:
+                with_skills += 1
+                total_skills += len(skills)
+            if get('experience'):
+                with_experience += 1
+            if get('education'):
+                with_education += 1
+            sources.add(get('source', 'Unknown'))
+        
         summary = {
             "total_candidates": len(candidates),
-            "with_linkedin": len([c for c in candidates if c.get('linkedin_url')]),
-            "verified_linkedin": len([c for c in candidates if c.get('linkedin_verified')]),
-            "with_email": len([c for c in candidates if c.get('email')]),
-            "with_phone": len([c for c in candidates if c.get('phone')]),
-            "with_skills": len([c for c in candidates if c.get('skills')]),
-            "total_skills": sum(len(c.get('skills', [])) for c in candidates),
-            "with_experience": len([c for c in candidates if c.get('experience')]),
-            "with_education": len([c for c in candidates if c.get('education')]),
-            "data_sources": list(set(c.get('source', 'Unknown') for c in candidates))
+            "with_linkedin": with_linkedin,
+            "verified_linkedin": verified_linkedin,
+            "with_email": with_email,
+            "with_phone": with_phone,
+            "with_skills": with_skills,
+            "total_skills": total_skills,
+            "with_experience": with_experience,
+            "with_education": with_education,
+            "data_sources": list(sources)
         }
         
         return summary
@@ -301,8 +428,10 @@ class GoogleSheetsManager:
 
 def main():
     """Test the Google Sheets Manager independently"""
-    print("📊 TESTING GOOGLE SHEETS MANAGER MODULE")
-    print("=" * 45)
+    configure_logging()
+    
+    logger.info("📊 TESTING GOOGLE SHEETS MANAGER MODULE")
+    logger.info("=" * 45)
     
     # Test with sample candidates
     test_candidates = [
@@ -331,16 +460,16 @@ def main():
     
     # Show summary
     summary = sheets_manager.get_sheet_summary(test_candidates)
-    print(f"\n📋 SHEET SUMMARY:")
+    logger.info("\n📋 SHEET SUMMARY:")
     for key, value in summary.items():
-        print(f"   {key}: {value}")
+        logger.info("   %s: %s", key, value)
     
     # Create sheet
     sheet_url = sheets_manager.create_recruiter_sheet(test_candidates, "Test_Recruiter")
     
     if sheet_url:
-        print(f"\n🎉 Test completed successfully!")
-        print(f"🔗 Test sheet: {sheet_url}")
+        logger.info("\n🎉 Test completed successfully!")
+        logger.info("🔗 Test sheet: %s", sheet_url)
 
 
 if __name__ == "__main__":
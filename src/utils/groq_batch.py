@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+📦 GROQ BATCH MODULE
+Runs bulk chat completions through Groq's Batch API
+
+For offline jobs (a nightly folder of resumes, a large enrichment run) the
+requests go up as one JSONL file and are processed asynchronously at batch
+pricing instead of one realtime call each. Prompts already in the LLM cache
+are answered locally and never submitted; batch answers are cached too.
+"""
+
+import time
+import logging
+from typing import Dict, Optional
+
+import orjson
+
+from .llm_cache import LLMCache
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 30.0  # seconds between status checks
+
+# Batch states after which no more results will arrive
+_FINAL_STATES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _batch_payload(bodies: Dict[str, Dict]) -> bytes:
+    """One JSONL line per request, keyed by custom_id"""
+    return b"".join(
+        orjson.dumps({"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body}) + b"\n"
+        for custom_id, body in bodies.items()
+    )
+
+
+def _batch_results(content: bytes) -> Dict[str, str]:
+    """custom_id -> completion text for every successful line of a batch output file"""
+    results = {}
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        item = orjson.loads(line)
+        response = item.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        try:
+            results[item["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            continue
+    return results
+
+
+def run_chat_batch(client, cache: LLMCache, bodies: Dict[str, Dict], semantic: bool = True,
+                   poll_interval: float = BATCH_POLL_INTERVAL,
+                   timeout: Optional[float] = None) -> Dict[str, str]:
+    """
+    Answer many chat completion requests with one Groq batch job
+
+    Args:
+        client: Sync Groq client (not the caching wrapper)
+        cache: LLM cache consulted before submitting and filled afterwards
+        bodies: custom_id -> chat.completions.create keyword arguments
+        semantic: Allow semantic cache hits for these prompts
+        poll_interval: Seconds between batch status checks
+        timeout: Stop waiting after this many seconds (default: the whole window)
+
+    Returns:
+        custom_id -> completion text; requests that failed or didn't finish
+        are left out, so callers can fall back to realtime calls
+    """
+    results = {}
+    pending = {}
+    for custom_id, body in bodies.items():
+        cached = cache.get(body["model"], body["messages"], body.get("temperature", 1.0), semantic)
+        if cached is not None:
+            results[custom_id] = cached
+        else:
+            pending[custom_id] = body
+
+    if not pending:
+        return results
+
+    logger.info("📦 Submitting %s requests to the Groq Batch API (%s answered from cache)", len(pending), len(results))
+    upload = client.files.create(file=("batch.jsonl", _batch_payload(pending)), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=upload.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW,
+    )
+
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    while batch.status not in _FINAL_STATES:
+        if deadline is not None and time.monotonic() >= deadline:
+            logger.warning("⚠️ Batch %s still %s after %.0fs, giving up on it", batch.id, batch.status, timeout)
+            break
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+        logger.debug("📦 Batch %s: %s", batch.id, batch.status)
+
+    answered = _batch_results(client.files.content(batch.output_file_id).read()) if batch.output_file_id else {}
+    for custom_id, content in answered.items():
+        body = pending.get(custom_id)
+        if body is None:
+            continue
+        cache.set(body["model"], body["messages"], body.get("temperature", 1.0), content, semantic)
+        results[custom_id] = content
+
+    missing = len(pending) - sum(1 for custom_id in pending if custom_id in results)
+    if missing:
+        logger.warning("⚠️ Batch %s (%s): %s/%s requests returned no result", batch.id, batch.status, missing, len(pending))
+    else:
+        logger.info("✅ Batch %s complete: %s results", batch.id, len(pending))
+    return results
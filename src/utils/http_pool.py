@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+🌐 HTTP CONNECTION POOL MODULE
+Shared keep-alive clients for outbound API calls (Groq, Composio)
+
+Groq and Composio clients are cached per API key, so building a service
+class never opens a new connection pool. Async callers on the same event
+loop share one async pool as well, closed when run_async's coroutine ends.
+
+Reusing one pool skips a TCP + TLS handshake on every LLM request and every
+Composio action. HTTP/2 is used for Groq when the optional `h2` package is
+installed.
+"""
+
+import asyncio
+import weakref
+from functools import lru_cache
+from typing import Awaitable, TypeVar
+
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+HTTP_TIMEOUT = 30.0
+
+# Composio's client is a requests.Session; requests keeps only 10 connections per host
+COMPOSIO_POOL_SIZE = 32
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Process-wide sync client shared by every Groq client"""
+    return httpx.Client(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+@lru_cache(maxsize=None)
+def get_groq_client(api_key: str):
+    """Process-wide sync Groq client per API key, on the shared connection pool"""
+    from groq import Groq
+
+    return Groq(api_key=api_key, http_client=get_http_client())
+
+
+def new_async_http_client() -> httpx.AsyncClient:
+    """
+    Async client with the same pool settings
+
+    Async pools are tied to the event loop that opened them, so callers
+    create one per loop rather than sharing it process-wide.
+    """
+    return httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+# One async pool per event loop, closed by run_async when its entry point finishes
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Async client shared by every AsyncGroq client on the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = new_async_http_client()
+    return client
+
+
+async def close_async_http_client() -> None:
+    """Close the running loop's shared async client, if one was opened"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """
+    asyncio.run(coro), closing the loop's shared async client afterwards
+
+    Open connections keep a reference to their loop, so the per-loop entry in
+    the pool is never dropped on its own; async entry points run through here.
+    """
+    async def _run() -> T:
+        try:
+            return await coro
+        finally:
+            await close_async_http_client()
+
+    return asyncio.run(_run())
+
+
+def _pooled_adapter() -> HTTPAdapter:
+    """Keep-alive adapter that also retries dropped connections and idempotent 429/5xx"""
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(pool_connections=COMPOSIO_POOL_SIZE, pool_maxsize=COMPOSIO_POOL_SIZE, max_retries=retry)
+
+
+@lru_cache(maxsize=None)
+def get_composio_toolset(api_key: str):
+    """
+    Process-wide ComposioToolSet per API key
+
+    Every service shares one toolset, and so one Composio HTTP session whose
+    connections stay open between actions.
+    """
+    from composio import ComposioToolSet  # heavy; only load when a toolset is needed
+
+    toolset = ComposioToolSet(api_key=api_key)
+    adapter = _pooled_adapter()
+    session = toolset.client.http
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return toolset
@@ -4,9 +4,14 @@ Schedules interviews in Google Calendar using Composio
 """
 
 import os
+import math
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-from composio import ComposioToolSet, Action
+from composio import Action
+from .http_pool import get_composio_toolset
+from .logging_setup import configure_logging
 from ..config.legacy_config import (
     COMPOSIO_API_KEY, 
     GOOGLE_CALENDAR_USER_ID, 
@@ -14,6 +19,15 @@ from ..config.legacy_config import (
     GOOGLE_CALENDAR_AUTH_CONFIG_ID
 )
 
+logger = logging.getLogger(__name__)
+
+# Composio has no Calendar batch endpoint; cap concurrent event inserts instead
+CALENDAR_CONCURRENCY = 8
+
+# Interview slots start between these hours (9 AM - 6 PM)
+BUSINESS_OPEN_HOUR = 9
+BUSINESS_CLOSE_HOUR = 18
+
 
 class InterviewScheduler:
     """Schedule interviews using Composio Google Calendar integration"""
@@ -30,11 +44,11 @@ class InterviewScheduler:
         self.entity_id = entity_id or GOOGLE_CALENDAR_USER_ID
         self.connected_account_id = GOOGLE_CALENDAR_ACCOUNT_ID
         self.auth_config_id = GOOGLE_CALENDAR_AUTH_CONFIG_ID
-        self.toolset = ComposioToolSet(api_key=self.api_key)
+        self.toolset = get_composio_toolset(self.api_key)
         
-        print("📅 Interview Scheduler initialized with ComposioToolSet")
-        print(f"   Entity ID: {self.entity_id}")
-        print(f"   Account ID: {self.connected_account_id}")
+        logger.debug("📅 Interview Scheduler initialized with ComposioToolSet")
+        logger.debug("   Entity ID: %s", self.entity_id)
+        logger.debug("   Account ID: %s", self.connected_account_id)
         
     def _generate_time_slots(
         self, 
@@ -56,32 +70,42 @@ class InterviewScheduler:
             
         Returns:
             List of datetime objects for each slot
+            
+        Raises:
+            ValueError: If start_hour is outside business hours
         """
         if start_date is None:
             start_date = datetime.now() + timedelta(days=1)
             start_date = start_date.replace(hour=start_hour, minute=0, second=0, microsecond=0)
         
+        if num_slots <= 0:
+            return []
+        if not BUSINESS_OPEN_HOUR <= start_hour < BUSINESS_CLOSE_HOUR:
+            raise ValueError(f"start_hour must be within business hours ({BUSINESS_OPEN_HOUR}-{BUSINESS_CLOSE_HOUR})")
+        
+        step = timedelta(minutes=duration_minutes)
+        close = BUSINESS_CLOSE_HOUR * 3600  # no slot starts at or after 6 PM
         slots = []
-        current_slot = start_date
+        day_start = start_date
         
+        # Fill a whole business day per pass instead of stepping slot by slot
         while len(slots) < num_slots:
             # Skip weekends if requested
-            if skip_weekends and current_slot.weekday() >= 5:  # 5=Saturday, 6=Sunday
+            if skip_weekends and day_start.weekday() >= 5:  # 5=Saturday, 6=Sunday
                 # Move to next Monday at start_hour
-                days_ahead = 7 - current_slot.weekday()
-                current_slot = current_slot + timedelta(days=days_ahead)
-                current_slot = current_slot.replace(hour=start_hour, minute=0)
+                day_start = day_start + timedelta(days=7 - day_start.weekday())
+                day_start = day_start.replace(hour=start_hour, minute=0)
                 continue
             
-            # Check if within business hours (9 AM - 6 PM)
-            if current_slot.hour < 9 or current_slot.hour >= 18:
-                # Move to next day at start_hour
-                current_slot = current_slot + timedelta(days=1)
-                current_slot = current_slot.replace(hour=start_hour, minute=0)
-                continue
+            opens = (day_start.hour * 3600 + day_start.minute * 60 + day_start.second
+                     + day_start.microsecond / 1e6)
+            if day_start.hour >= BUSINESS_OPEN_HOUR and opens < close:
+                fit = math.ceil((close - opens) / step.total_seconds())
+                slots.extend(day_start + i * step for i in range(min(fit, num_slots - len(slots))))
             
-            slots.append(current_slot)
-            current_slot = current_slot + timedelta(minutes=duration_minutes)
+            # Move to next day at start_hour
+            day_start = day_start + timedelta(days=1)
+            day_start = day_start.replace(hour=start_hour, minute=0)
         
         return slots
 
@@ -114,25 +138,21 @@ class InterviewScheduler:
             end_datetime = interview_datetime + timedelta(minutes=duration_minutes)
             
             # Format times for Google Calendar API (RFC3339)
-            start_time = interview_datetime.strftime("%Y-%m-%dT%H:%M:%S")
-            end_time = end_datetime.strftime("%Y-%m-%dT%H:%M:%S")
+            start_time = interview_datetime.isoformat(timespec="seconds")
+            end_time = end_datetime.isoformat(timespec="seconds")
             
             # Build event summary and description
             summary = f"Interview: {name} (Score: {score})"
             
-            description_parts = [
-                f"🎯 Candidate Interview",
-                f"",
-                f"👤 Name: {name}",
-                f"📧 Email: {email}" if email else "",
-                f"⭐ Score: {score}/10",
-                f"",
-                f"📝 Evaluation Rationale:",
-                rationale,
-                f"",
-                f"🔗 Meeting Link: {meeting_link}" if meeting_link else "ℹ️ Meeting link to be added",
-            ]
-            description = "\n".join([p for p in description_parts if p])
+            description_parts = ["🎯 Candidate Interview", f"👤 Name: {name}"]
+            if email:
+                description_parts.append(f"📧 Email: {email}")
+            description_parts.append(f"⭐ Score: {score}/10")
+            description_parts.append("📝 Evaluation Rationale:")
+            if rationale:
+                description_parts.append(rationale)
+            description_parts.append(f"🔗 Meeting Link: {meeting_link}" if meeting_link else "ℹ️ Meeting link to be added")
+            description = "\n".join(description_parts)
             
             # Prepare attendees
             attendees = []
@@ -140,7 +160,7 @@ class InterviewScheduler:
                 attendees.append({"email": email})
             
             # Create event using Composio
-            print(f"📅 Creating calendar event for {name} at {interview_datetime.strftime('%Y-%m-%d %I:%M %p')}")
+            logger.info("📅 Creating calendar event for %s at %s", name, interview_datetime.strftime('%Y-%m-%d %I:%M %p'))
             
             # Prepare event data for Composio GOOGLECALENDAR_CREATE_EVENT
             event_params = {
@@ -158,17 +178,15 @@ class InterviewScheduler:
             )
             
             if result.get("successful") or result.get("success"):
-                print(f"   ✅ Event created successfully")
+                logger.info("   ✅ Event created successfully")
                 return result
             else:
                 error_msg = result.get('error', result.get('data', 'Unknown error'))
-                print(f"   ❌ Failed to create event: {error_msg}")
+                logger.error("   ❌ Failed to create event: %s", error_msg)
                 return None
                 
         except Exception as e:
-            print(f"❌ Error creating calendar event for {candidate.get('name', 'Unknown')}: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error creating calendar event for %s: %s", candidate.get('name', 'Unknown'), e)
             return None
 
     def schedule_interviews(
@@ -191,7 +209,7 @@ class InterviewScheduler:
             List of candidates with added schedule information
         """
         if not shortlisted_candidates:
-            print("ℹ️  No candidates to schedule")
+            logger.info("ℹ️  No candidates to schedule")
             return []
         
         # Generate time slots
@@ -202,31 +220,38 @@ class InterviewScheduler:
             duration_minutes=duration_minutes
         )
         
-        scheduled_candidates = []
-        
-        for candidate, slot in zip(shortlisted_candidates, time_slots):
-            # Create calendar event
-            result = self.create_calendar_event(
+        # Create calendar events concurrently (each insert is its own round-trip)
+        def create_event(candidate_slot):
+            candidate, slot = candidate_slot
+            return self.create_calendar_event(
                 candidate=candidate,
                 interview_datetime=slot,
                 duration_minutes=duration_minutes,
                 meeting_link=meeting_link
             )
-            
+        
+        pairs = list(zip(shortlisted_candidates, time_slots))
+        if len(pairs) < 2:
+            results = [create_event(pair) for pair in pairs]
+        else:
+            with ThreadPoolExecutor(max_workers=min(CALENDAR_CONCURRENCY, len(pairs))) as executor:
+                results = list(executor.map(create_event, pairs))
+        
+        scheduled_candidates = []
+        
+        for (candidate, slot), result in zip(pairs, results):
             # Add schedule info to candidate
-            candidate_with_schedule = candidate.copy()
-            candidate_with_schedule.update({
-                "interview_date": slot.strftime("%Y-%m-%d"),
+            scheduled_candidates.append({
+                **candidate,
+                "interview_date": slot.date().isoformat(),
                 "interview_time": slot.strftime("%I:%M %p"),
                 "interview_datetime": slot.isoformat(),
                 "duration_minutes": duration_minutes,
                 "calendar_event_created": result is not None,
                 "calendar_event_data": result
             })
-            
-            scheduled_candidates.append(candidate_with_schedule)
         
-        print(f"\n✅ Scheduled {len(scheduled_candidates)} interview(s)")
+        logger.info("\n✅ Scheduled %s interview(s)", len(scheduled_candidates))
         return scheduled_candidates
 
 
@@ -234,6 +259,7 @@ if __name__ == "__main__":
     # Example usage
     from dotenv import load_dotenv
     load_dotenv()
+    configure_logging()
     
     scheduler = InterviewScheduler()
     
@@ -248,6 +274,6 @@ if __name__ == "__main__":
     ]
     
     scheduled = scheduler.schedule_interviews(test_candidates)
-    print(f"\n📅 Scheduled interviews: {len(scheduled)}")
+    logger.info("\n📅 Scheduled interviews: %s", len(scheduled))
     for candidate in scheduled:
-        print(f"   - {candidate['name']}: {candidate['interview_date']} at {candidate['interview_time']}")
+        logger.info("   - %s: %s at %s", candidate['name'], candidate['interview_date'], candidate['interview_time'])
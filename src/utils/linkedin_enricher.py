@@ -4,18 +4,150 @@
 Handles LinkedIn profile enrichment via Composio API
 """
 
-import json
-from typing import Dict, Optional
-from composio import ComposioToolSet, Action
+import re
+import logging
+import asyncio
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from composio import Action
 from ..config.legacy_config import (
     COMPOSIO_API_KEY, 
     GROQ_API_KEY, 
     GROQ_MODEL,
+    GROQ_MAX_CONCURRENT,
     LINKEDIN_CONNECTED_ACCOUNT_ID,
     LINKEDIN_ENTITY_ID
 )
-from groq import Groq
+import httpx
+from groq import Groq, AsyncGroq
+from .llm_cache import CachingGroq, get_llm_cache
+from .groq_batch import BATCH_POLL_INTERVAL, run_chat_batch
+from .http_pool import get_composio_toolset, get_groq_client, get_async_http_client, run_async
+from .retry import CircuitBreaker, call_with_retry
+from .logging_setup import configure_logging
 
+logger = logging.getLogger(__name__)
+
+
+# Personal profile URLs (linkedin.com/in/<slug> or /pub/<slug>); anything else
+# can't be looked up, so it doesn't cost a Composio call
+_LINKEDIN_PROFILE_RE = re.compile(r"linkedin\.com/(?:in|pub)/[\w%-]+", re.IGNORECASE)
+# A fenced JSON object, else the outermost {...} in prose around it
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```|(\{.*\})", re.DOTALL)
+_YEARS_RE = re.compile(r"\d+(?:\.\d+)?")
+
+# Attempts per GET_PROFILE call on a 429 / 5xx / dropped connection
+LINKEDIN_RETRIES = 3
+# Consecutive failed lookups before the LinkedIn API is skipped, and for how long (seconds)
+LINKEDIN_BREAKER_FAILURES = 5
+LINKEDIN_BREAKER_RESET = 60.0
+
+# Output budget for the generative fields of one candidate (JSON mode)
+LINKEDIN_MAX_TOKENS = 400
+
+# Minimum years of experience per career level, most senior first
+CAREER_LEVELS = ((15, "Executive"), (8, "Senior"), (3, "Mid-level"), (0, "Junior"))
+YEARS_PER_ROLE = 2  # estimate when the resume gives no total
+
+# First whole word found in the company / role names decides the industry.
+# Only unambiguous words: "engineer", "developer", "tech" or "data" say little
+# about the industry, so those candidates are left to the LLM.
+INDUSTRY_KEYWORDS = (
+    (("bank", "banking", "finance", "financial", "fintech", "capital"), "Financial Services"),
+    (("insurance",), "Insurance"),
+    (("pharma", "pharmaceutical", "pharmaceuticals"), "Pharmaceuticals"),
+    (("biotech", "biotechnology"), "Biotechnology"),
+    (("health", "healthcare", "hospital", "clinic", "medical"), "Healthcare"),
+    (("consulting", "consultancy"), "Management Consulting"),
+    (("university", "college"), "Higher Education"),
+    (("school", "academy"), "Education"),
+    (("retail",), "Retail"),
+    (("marketing", "advertising"), "Marketing & Advertising"),
+    (("software", "saas"), "Software Development"),
+)
+_INDUSTRY_PATTERNS = tuple(
+    (re.compile(r"\b(?:%s)\b" % "|".join(words)), industry) for words, industry in INDUSTRY_KEYWORDS
+)
+
+# Fields normally derived from the resume; the LLM is asked only for the ones that couldn't be
+DERIVED_FIELD_HINTS = {
+    "career_level": "Junior/Mid-level/Senior/Executive based on experience",
+    "key_competencies": "Top 8-10 skills relevant to role",
+    "linkedin_industry": "Industry category",
+}
+
+
+# Set by _apply_ai_fields, so a candidate carrying it was enriched by an earlier run
+ENRICHED_MARKER = "linkedin_title"
+
+
+def _derive_deterministic_fields(candidate: Dict) -> Dict:
+    """
+    LinkedIn fields computable from the parsed resume, so the LLM isn't asked for them
+    
+    Fields the resume doesn't settle are left out; the AI prompt asks for those.
+    """
+    fields = {}
+    match = _YEARS_RE.search(str(candidate.get('years_of_experience') or ''))
+    roles = len(candidate.get('experience') or [])
+    if match or roles:
+        years = float(match.group()) if match else YEARS_PER_ROLE * roles
+        fields["career_level"] = next(level for minimum, level in CAREER_LEVELS if years >= minimum)
+    
+    skills = candidate.get('skills')
+    if isinstance(skills, list) and skills:
+        fields["key_competencies"] = skills[:10]
+    
+    haystack = f"{candidate.get('company', '')} {candidate.get('current_role', '')}".lower()
+    industry = next((name for pattern, name in _INDUSTRY_PATTERNS if pattern.search(haystack)), None)
+    if industry:
+        fields["linkedin_industry"] = industry
+    return fields
+
+
+def _missing_derived_fields(candidate: Dict) -> List[str]:
+    """DERIVED_FIELD_HINTS keys the resume alone doesn't settle, for the LLM to fill"""
+    derived = _derive_deterministic_fields(candidate)
+    return [field for field in DERIVED_FIELD_HINTS if field not in derived]
+
+
+# Fixed instructions go in the system message and only the candidate details
+# vary, so every call shares one byte-identical prefix (cacheable by the provider)
+_LINKEDIN_FIELDS = """\
+    "linkedin_title": "Professional headline with key skills and role",
+    "linkedin_summary": "Professional summary 2-3 sentences highlighting achievements and value",
+    "experience_highlights": "3-4 bullet points of key career achievements",
+    "professional_value": "Value proposition - what they bring to organizations"\
+"""
+
+_OPTIONAL_FIELDS = "\n".join(f"- {field}: {hint}" for field, hint in DERIVED_FIELD_HINTS.items())
+
+LINKEDIN_SYSTEM_PROMPT = f"""\
+Generate professional LinkedIn profile fields for the candidate. Return ONLY JSON:
+
+{{
+{_LINKEDIN_FIELDS}
+}}
+
+If the candidate details end with "Also provide:", add those keys as well:
+{_OPTIONAL_FIELDS}
+"""
+
+LINKEDIN_BATCH_SYSTEM_PROMPT = f"""\
+Generate professional LinkedIn profile fields for each numbered candidate. Return ONLY a JSON object:
+
+{{"results": [
+  {{
+    "idx": "The candidate's number from the list",
+{_LINKEDIN_FIELDS}
+  }}
+]}}
+
+Include one object per candidate. If a candidate's details end with "Also provide:",
+add those keys to that candidate's object as well:
+{_OPTIONAL_FIELDS}
+"""
 
 class LinkedInEnricher:
     """
@@ -27,13 +159,38 @@ class LinkedInEnricher:
     
     Note: LinkedIn API integration in Composio requires proper OAuth connection
     and may have limited actions. LLM enrichment provides reliable results.
+    
+    The AI prompt only reads resume fields, so AI fields are generated while
+    the LinkedIn API call is still in flight rather than after it.
     """
     
-    def __init__(self):
-        self.composio_toolset = ComposioToolSet(api_key=COMPOSIO_API_KEY)
-        self.groq_client = Groq(api_key=GROQ_API_KEY)
-        print("🔗 LinkedIn Enricher initialized")
-        print("   Strategy: LinkedIn API attempt → LLM enrichment fallback")
+    # Runs enrich_candidate_profile's AI call alongside its LinkedIn stage
+    _ai_pool = ThreadPoolExecutor(max_workers=GROQ_MAX_CONCURRENT, thread_name_prefix="linkedin-ai")
+    # Shared by every enricher, since they all hit the same Composio account
+    _linkedin_breaker = CircuitBreaker("LinkedIn API", LINKEDIN_BREAKER_FAILURES, LINKEDIN_BREAKER_RESET)
+    
+    def __init__(self, http_client: httpx.Client = None):
+        self.composio_toolset = get_composio_toolset(COMPOSIO_API_KEY)
+        self.batch_client = Groq(api_key=GROQ_API_KEY, http_client=http_client) if http_client else get_groq_client(GROQ_API_KEY)
+        # Exact hits only: a similar role/company/skills must not get another person's summary
+        self.groq_client = CachingGroq(self.batch_client, get_llm_cache(), semantic=False)
+        self._async_groq_client = None
+        self._async_loop = None
+        self._linkedin_profiles: Dict[str, Dict] = {}  # profile URL -> successful GET_PROFILE data
+        logger.info("🔗 LinkedIn Enricher initialized")
+        logger.info("   Strategy: LinkedIn API attempt → LLM enrichment fallback")
+    
+    @property
+    def async_groq_client(self) -> CachingGroq:
+        """AsyncGroq client bound to the running event loop"""
+        # The enricher is reused across pipeline runs, and each run has its own
+        # loop; pooled async connections can't outlive the loop they were made on
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            groq = AsyncGroq(api_key=GROQ_API_KEY, http_client=get_async_http_client())
+            self._async_groq_client = CachingGroq(groq, get_llm_cache(), is_async=True, semantic=False)
+            self._async_loop = loop
+        return self._async_groq_client
     
     def fetch_real_linkedin_data(self, linkedin_url: str) -> Dict:
         """
@@ -43,32 +200,49 @@ class LinkedInEnricher:
         1. LINKEDIN_GET_PROFILE action to get any profile by URL
         2. LINKEDIN_GET_MY_INFO to get your own authenticated profile
         
-        Since we want to enrich candidate profiles, we'd use GET_PROFILE
+        Since we want to enrich candidate profiles, we'd use GET_PROFILE.
+        Successful profiles are kept per URL, so re-enriching a candidate
+        doesn't repeat the API call. Transient errors are retried; after
+        repeated failed lookups the API is skipped for a while.
         """
+        cached = self._linkedin_profiles.get(linkedin_url)
+        if cached is not None:
+            logger.debug("♻️  Reusing fetched LinkedIn profile for %s", linkedin_url)
+            return cached
+        
+        if not self._linkedin_breaker.allow():
+            logger.debug("⚠️ LinkedIn API skipped after repeated failures: %s", linkedin_url)
+            return {}
+        
         try:
             entity_id = LINKEDIN_ENTITY_ID
             
-            print(f"🔍 Attempting LinkedIn API call for: {linkedin_url}")
+            logger.debug("🔍 Attempting LinkedIn API call for: %s", linkedin_url)
             
             # Method 1: Try to get profile by URL (if action exists)
             try:
                 # LinkedIn profile enrichment usually requires the profile URL
-                result = self.composio_toolset.execute_action(
+                result = call_with_retry(
+                    self.composio_toolset.execute_action,
                     action=Action.LINKEDIN_GET_PROFILE,  # Action to get OTHER people's profiles
                     params={"profile_url": linkedin_url},
-                    entity_id=entity_id
+                    entity_id=entity_id,
+                    retries=LINKEDIN_RETRIES,
                 )
                 
                 if result.get('successful'):
                     data = result.get('data', {})
                     data['is_connected_account'] = True
-                    print(f"✅ LinkedIn profile data fetched via GET_PROFILE")
+                    logger.debug("✅ LinkedIn profile data fetched via GET_PROFILE")
+                    self._linkedin_profiles[linkedin_url] = data
+                    self._linkedin_breaker.record_success()
                     return data
             except AttributeError:
                 # Action doesn't exist, try alternative
-                print(f"⚠️ LINKEDIN_GET_PROFILE action not available")
+                logger.warning("⚠️ LINKEDIN_GET_PROFILE action not available")
             except Exception as e:
-                print(f"⚠️ GET_PROFILE failed: {str(e)[:100]}")
+                logger.warning("⚠️ GET_PROFILE failed: %s", str(e)[:100])
+            self._linkedin_breaker.record_failure()
             
             # Method 2: Try getting your own info (limited usefulness for candidate enrichment)
             try:
@@ -79,170 +253,460 @@ class LinkedInEnricher:
                 )
                 
                 if result.get('successful'):
-                    print(f"⚠️ Got authenticated user's profile (not candidate's)")
-                    print(f"   This won't match the candidate unless they're the authenticated user")
+                    logger.warning("⚠️ Got authenticated user's profile (not candidate's)")
+                    logger.info("   This won't match the candidate unless they're the authenticated user")
                     return {}  # Don't use this data as it's not the candidate's
             except Exception as e:
-                print(f"⚠️ GET_MY_INFO also failed: {str(e)[:100]}")
+                logger.warning("⚠️ GET_MY_INFO also failed: %s", str(e)[:100])
             
-            print(f"❌ All LinkedIn API methods failed")
-            print(f"💡 Tip: Ensure LinkedIn account is properly connected in Composio dashboard")
-            print(f"   Entity ID: {entity_id[:20]}..." if len(entity_id) > 20 else f"   Entity ID: {entity_id}")
+            logger.error("❌ All LinkedIn API methods failed")
+            logger.info("💡 Tip: Ensure LinkedIn account is properly connected in Composio dashboard")
+            logger.info("%s", f"   Entity ID: {entity_id[:20]}..." if len(entity_id) > 20 else f"   Entity ID: {entity_id}")
             return {}
                 
         except Exception as e:
+            self._linkedin_breaker.record_failure()
             error_msg = str(e)
-            print(f"❌ LinkedIn fetch error: {error_msg}")
+            logger.error("❌ LinkedIn fetch error: %s", error_msg)
             
             # Provide helpful troubleshooting tips
             if "Invalid connected account ID format" in error_msg:
-                print(f"💡 Fix: The connected account ID format is invalid")
-                print(f"   Current ID: {LINKEDIN_CONNECTED_ACCOUNT_ID}")
-                print(f"   Solution: Go to Composio dashboard and get a valid LinkedIn connection")
-                print(f"   URL: https://app.composio.dev/your_app/connections")
+                logger.info("💡 Fix: The connected account ID format is invalid")
+                logger.info("   Current ID: %s", LINKEDIN_CONNECTED_ACCOUNT_ID)
+                logger.info("   Solution: Go to Composio dashboard and get a valid LinkedIn connection")
+                logger.info("   URL: https://app.composio.dev/your_app/connections")
             elif "not found" in error_msg.lower():
-                print(f"💡 Fix: LinkedIn account not connected")
-                print(f"   Solution: Connect your LinkedIn account in Composio dashboard")
+                logger.info("💡 Fix: LinkedIn account not connected")
+                logger.info("   Solution: Connect your LinkedIn account in Composio dashboard")
             
             return {}
     
+    def _build_linkedin_prompt(self, candidate: Dict) -> str:
+        """Candidate details for the user message (instructions live in the system prompt)"""
+        skills = candidate.get('skills', [])
+        prompt = (
+            f"Candidate: {candidate.get('full_name', '')}\n"
+            f"Current Role: {candidate.get('current_role', '')}\n"
+            f"Company: {candidate.get('company', '')}\n"
+            f"Skills: {', '.join(skills[:5]) if skills else 'General professional skills'}\n"
+            f"Experience: {len(candidate.get('experience', []))} roles in background"
+        )
+        missing = _missing_derived_fields(candidate)
+        return prompt + f"\nAlso provide: {', '.join(missing)}" if missing else prompt
+    
+    def _parse_ai_fields(self, ai_text: str) -> Dict:
+        """Parse the AI response into a dict of LinkedIn fields"""
+        try:
+            return orjson.loads(ai_text)
+        except orjson.JSONDecodeError:
+            # Extract from a code block or surrounding prose if needed
+            match = _JSON_BLOCK_RE.search(ai_text)
+            if match:
+                return orjson.loads(match.group(1) or match.group(2))
+            else:
+                logger.warning("⚠️ AI response parsing failed")
+                return {}
+    
     def generate_linkedin_fields_with_ai(self, candidate: Dict) -> Dict:
         """Generate LinkedIn-style professional fields using AI"""
         try:
-            name = candidate.get('full_name', '')
-            role = candidate.get('current_role', '')
-            company = candidate.get('company', '')
-            skills = candidate.get('skills', [])
-            experience = candidate.get('experience', [])
-            
-            prompt = f"""
-            Generate professional LinkedIn profile fields for this candidate. Return ONLY JSON:
-            
-            {{
-                "linkedin_title": "Professional headline with key skills and role",
-                "linkedin_industry": "Industry category",
-                "linkedin_summary": "Professional summary 2-3 sentences highlighting achievements and value",
-                "experience_highlights": "3-4 bullet points of key career achievements",
-                "key_competencies": "Top 8-10 skills relevant to role",
-                "career_level": "Junior/Mid-level/Senior/Executive based on experience",
-                "professional_value": "Value proposition - what they bring to organizations"
-            }}
-            
-            Candidate: {name}
-            Current Role: {role}
-            Company: {company}
-            Skills: {', '.join(skills[:5]) if skills else 'General professional skills'}
-            Experience: {len(experience)} roles in background
-            """
-            
-            response = self.groq_client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=GROQ_MODEL,
-                temperature=0.3,
-                max_tokens=1000
-            )
+            response = self.groq_client.chat.completions.create(**self._single_request(candidate))
             
             ai_text = response.choices[0].message.content.strip()
+            return self._parse_ai_fields(ai_text)
+                    
+        except Exception as e:
+            logger.error("❌ AI field generation error: %s", e)
+            return {}
+    
+    async def agenerate_linkedin_fields_with_ai(self, candidate: Dict) -> Dict:
+        """Async variant of generate_linkedin_fields_with_ai using AsyncGroq"""
+        try:
+            response = await self.async_groq_client.chat.completions.create(**self._single_request(candidate))
             
-            # Parse JSON response
-            try:
-                return json.loads(ai_text)
-            except json.JSONDecodeError:
-                # Extract from code block if needed
-                if "```json" in ai_text:
-                    json_start = ai_text.find("```json") + 7
-                    json_end = ai_text.find("```", json_start)
-                    return json.loads(ai_text[json_start:json_end].strip())
-                else:
-                    print("⚠️ AI response parsing failed")
-                    return {}
+            ai_text = response.choices[0].message.content.strip()
+            return self._parse_ai_fields(ai_text)
                     
         except Exception as e:
-            print(f"❌ AI field generation error: {str(e)}")
+            logger.error("❌ AI field generation error: %s", e)
             return {}
     
-    def enrich_candidate_profile(self, candidate: Dict) -> Dict:
-        """Complete LinkedIn enrichment for a single candidate"""
-        name = candidate.get('full_name', 'Unknown')
-        print(f"\n🔗 Enriching LinkedIn profile for: {name}")
+    def _build_linkedin_batch_prompt(self, candidates: List[Dict]) -> str:
+        """Numbered candidate details for one batch request"""
+        return "\n\n".join(
+            f"{i}. " + self._build_linkedin_prompt(c).replace("\n", "\n   ")
+            for i, c in enumerate(candidates, 1)
+        )
+    
+    def _parse_batch_fields(self, ai_text: str, batch_len: int) -> List[Dict]:
+        """
+        Map a batch response back onto the batch, in order
         
-        enriched_candidate = candidate.copy()
+        Raises:
+            ValueError: If the response can't be mapped back onto every candidate
+        """
+        by_idx = {}
+        for item in orjson.loads(ai_text).get("results", []):
+            fields = dict(item)
+            by_idx[int(fields.pop("idx", 0))] = fields
         
-        # Check for LinkedIn URL
-        linkedin_url = candidate.get('linkedin_url', '')
+        missing = [i for i in range(1, batch_len + 1) if i not in by_idx]
+        if missing:
+            raise ValueError(f"batch response missing candidates {missing}")
         
-        if linkedin_url and 'linkedin.com' in linkedin_url:
-            print(f"📡 Attempting to fetch REAL LinkedIn data via API...")
+        return [by_idx[i] for i in range(1, batch_len + 1)]
+    
+    def _batch_request(self, batch: List[Dict]) -> Dict:
+        return {
+            "messages": [
+                {"role": "system", "content": LINKEDIN_BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": self._build_linkedin_batch_prompt(batch)},
+            ],
+            "model": GROQ_MODEL,
+            "temperature": 0.3,
+            "max_tokens": min(8000, LINKEDIN_MAX_TOKENS * len(batch)),
+            "response_format": {"type": "json_object"},
+        }
+    
+    def _single_messages(self, candidate: Dict) -> List[Dict]:
+        return [
+            {"role": "system", "content": LINKEDIN_SYSTEM_PROMPT},
+            {"role": "user", "content": self._build_linkedin_prompt(candidate)},
+        ]
+    
+    def _single_request(self, candidate: Dict) -> Dict:
+        return {
+            "messages": self._single_messages(candidate),
+            "model": GROQ_MODEL,
+            "temperature": 0.3,
+            "max_tokens": LINKEDIN_MAX_TOKENS,
+            "response_format": {"type": "json_object"},
+        }
+    
+    def _split_cached(self, candidates: List[Dict]) -> Tuple[List[Optional[Dict]], List[int]]:
+        """
+        Look each candidate up under its single-candidate prompt, so cache hits
+        don't depend on which batch a candidate lands in
+        
+        Returns:
+            Cached fields per candidate (None on a miss), and the miss positions
+        """
+        cache = get_llm_cache()
+        results = []
+        for candidate in candidates:
+            cached = cache.get(GROQ_MODEL, self._single_messages(candidate), 0.3, semantic=False)
             try:
-                linkedin_data = self.fetch_real_linkedin_data(linkedin_url)
-            except Exception as api_error:
-                print(f"⚠️ LinkedIn API error: {str(api_error)[:100]}")
-                print(f"   Falling back to LLM enrichment...")
-                linkedin_data = {}
+                results.append((self._parse_ai_fields(cached) or None) if cached else None)
+            except ValueError:
+                results.append(None)
+        misses = [i for i, fields in enumerate(results) if fields is None]
+        if len(misses) < len(candidates):
+            logger.info("♻️  Reusing cached LinkedIn fields for %s candidate(s)", len(candidates) - len(misses))
+        return results, misses
+    
+    def _cache_batch_fields(self, batch: List[Dict], fields: List[Dict]) -> None:
+        cache = get_llm_cache()
+        for candidate, candidate_fields in zip(batch, fields):
+            cache.set(GROQ_MODEL, self._single_messages(candidate), 0.3, orjson.dumps(candidate_fields).decode(),
+                      semantic=False)
+    
+    def generate_linkedin_fields_batch(self, candidates: List[Dict], batch_size: int = 8) -> List[Dict]:
+        """
+        Generate LinkedIn fields with one AI call per batch instead of one per candidate
+        
+        Args:
+            candidates: Candidate dictionaries
+            batch_size: Number of candidates per AI call
             
-            # Check if we got valid LinkedIn data
-            if linkedin_data and (linkedin_data.get('response_dict') or linkedin_data.get('data')):
-                # Extract profile data
-                profile = linkedin_data.get('response_dict') or linkedin_data.get('data', {})
-                
-                # Verify if this matches the candidate's email
-                candidate_email = candidate.get('email', '').lower()
-                linkedin_email = profile.get('email', '').lower()
-                
-                if candidate_email and linkedin_email and candidate_email == linkedin_email:
-                    enriched_candidate['linkedin_email'] = profile.get('email', '')
-                    enriched_candidate['linkedin_verified'] = True
-                    enriched_candidate['linkedin_name'] = profile.get('name', '')
-                    enriched_candidate['linkedin_picture'] = profile.get('picture', '')
-                    enriched_candidate['linkedin_source'] = 'api_verified'
-                    print("✅ LinkedIn profile verified via API (email match)")
-                else:
-                    enriched_candidate['linkedin_verified'] = False
-                    enriched_candidate['linkedin_has_profile'] = True
-                    enriched_candidate['linkedin_source'] = 'api_unverified'
-                    print("✅ LinkedIn profile found via API (different account)")
-            else:
-                print("⚠️ LinkedIn API unavailable - will use LLM enrichment only")
-                enriched_candidate['linkedin_source'] = 'llm_fallback'
+        Returns:
+            AI fields per candidate, in input order ({} where generation failed)
+        """
+        results, misses = self._split_cached(candidates)
+        pending = [candidates[i] for i in misses]
+        generated = []
+        
+        for offset in range(0, len(pending), batch_size):
+            batch = pending[offset:offset + batch_size]
+            fields = None
+            
+            if len(batch) > 1:
+                try:
+                    response = self.groq_client.chat.completions.create(**self._batch_request(batch))
+                    fields = self._parse_batch_fields(response.choices[0].message.content, len(batch))
+                    self._cache_batch_fields(batch, fields)
+                except Exception as e:
+                    logger.warning("⚠️ Batch field generation failed (%s), generating individually...", e)
+            
+            if fields is None:
+                fields = [self.generate_linkedin_fields_with_ai(candidate) for candidate in batch]
+            generated.extend(fields)
         
-        # Generate AI-powered LinkedIn fields
-        print("🤖 Generating AI-enhanced LinkedIn fields...")
-        ai_fields = self.generate_linkedin_fields_with_ai(enriched_candidate)
+        for i, fields in zip(misses, generated):
+            results[i] = fields
+        return results
+    
+    async def agenerate_linkedin_fields_batch(self, candidates: List[Dict], batch_size: int = 8) -> List[Dict]:
+        """
+        Async generate_linkedin_fields_batch with batches in flight concurrently
+        
+        At most GROQ_MAX_CONCURRENT requests run at once.
+        """
+        sem = asyncio.Semaphore(GROQ_MAX_CONCURRENT)
+        
+        async def generate(batch: List[Dict]) -> List[Dict]:
+            if len(batch) > 1:
+                try:
+                    async with sem:
+                        response = await self.async_groq_client.chat.completions.create(**self._batch_request(batch))
+                    fields = self._parse_batch_fields(response.choices[0].message.content, len(batch))
+                    self._cache_batch_fields(batch, fields)
+                    return fields
+                except Exception as e:
+                    logger.warning("⚠️ Batch field generation failed (%s), generating individually...", e)
+            
+            async def single(candidate: Dict) -> Dict:
+                async with sem:
+                    return await self.agenerate_linkedin_fields_with_ai(candidate)
+            return list(await asyncio.gather(*(single(c) for c in batch)))
+        
+        results, misses = self._split_cached(candidates)
+        pending = [candidates[i] for i in misses]
+        
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        generated = await asyncio.gather(*(generate(b) for b in batches))
+        for i, fields in zip(misses, (fields for batch_fields in generated for fields in batch_fields)):
+            results[i] = fields
+        return results
+    
+    def _linkedin_fields(self, candidate: Dict, linkedin_data: Dict) -> Dict:
+        """Fields to add to the candidate from a LinkedIn API response"""
+        # Check if we got valid LinkedIn data
+        if linkedin_data and (linkedin_data.get('response_dict') or linkedin_data.get('data')):
+            # Extract profile data
+            profile = linkedin_data.get('response_dict') or linkedin_data.get('data', {})
+            
+            # Verify if this matches the candidate's email
+            candidate_email = candidate.get('email', '').lower()
+            linkedin_email = profile.get('email', '').lower()
+            
+            if candidate_email and linkedin_email and candidate_email == linkedin_email:
+                logger.debug("✅ LinkedIn profile verified via API (email match)")
+                return {
+                    'linkedin_email': profile.get('email', ''),
+                    'linkedin_verified': True,
+                    'linkedin_name': profile.get('name', ''),
+                    'linkedin_picture': profile.get('picture', ''),
+                    'linkedin_source': 'api_verified',
+                }
+            logger.debug("✅ LinkedIn profile found via API (different account)")
+            return {'linkedin_verified': False, 'linkedin_has_profile': True, 'linkedin_source': 'api_unverified'}
         
+        logger.warning("⚠️ LinkedIn API unavailable - will use LLM enrichment only")
+        return {'linkedin_source': 'llm_fallback'}
+    
+    def _apply_ai_fields(self, enriched_candidate: Dict, ai_fields: Dict) -> None:
+        """Merge AI-generated LinkedIn fields into the enriched candidate"""
         if ai_fields:
-            enriched_candidate.update(ai_fields)
-            print("✅ AI LinkedIn fields generated successfully")
+            # Fields derived from the resume or the LinkedIn API win over the LLM's guesses
+            enriched_candidate.update({
+                field: value for field, value in ai_fields.items()
+                if not (field in DERIVED_FIELD_HINTS and enriched_candidate.get(field))
+            })
+            logger.debug("✅ AI LinkedIn fields generated successfully")
         else:
-            print("⚠️ AI field generation failed")
+            logger.warning("⚠️ AI field generation failed")
+    
+    def _stage_linkedin_url(self, candidate: Dict) -> Optional[str]:
+        """Log the stage start; the candidate's LinkedIn profile URL, if it has a usable one"""
+        name = candidate.get('full_name', 'Unknown')
+        logger.info("\n🔗 Enriching LinkedIn profile for: %s", name)
+        
+        linkedin_url = candidate.get('linkedin_url', '')
+        if linkedin_url and _LINKEDIN_PROFILE_RE.search(linkedin_url):
+            logger.debug("📡 Attempting to fetch REAL LinkedIn data via API...")
+            return linkedin_url
+        return None
+    
+    def _fetch_linkedin_or_empty(self, linkedin_url: str) -> Dict:
+        """fetch_real_linkedin_data, with API errors logged and turned into no data"""
+        try:
+            return self.fetch_real_linkedin_data(linkedin_url)
+        except Exception as api_error:
+            logger.warning("⚠️ LinkedIn API error: %s", str(api_error)[:100])
+            logger.debug("   Falling back to LLM enrichment...")
+            return {}
+    
+    def _stage_result(self, candidate: Dict, linkedin_data: Optional[Dict]) -> Dict:
+        """Copy of the candidate with derived fields and any fetched LinkedIn data merged in"""
+        delta = _derive_deterministic_fields(candidate)
+        if linkedin_data is not None:
+            delta.update(self._linkedin_fields(candidate, linkedin_data))
+        
+        # New dict built in one go; the input candidate is never modified
+        return {**candidate, **delta}
+    
+    def _linkedin_stage(self, candidate: Dict) -> Dict:
+        """Copy of the candidate with any LinkedIn API data merged in"""
+        linkedin_url = self._stage_linkedin_url(candidate)
+        linkedin_data = self._fetch_linkedin_or_empty(linkedin_url) if linkedin_url else None
+        return self._stage_result(candidate, linkedin_data)
+    
+    def enrich_candidate_profile(self, candidate: Dict) -> Dict:
+        """Complete LinkedIn enrichment for a single candidate"""
+        # Generate AI-powered LinkedIn fields while the LinkedIn API is queried
+        logger.debug("🤖 Generating AI-enhanced LinkedIn fields...")
+        ai_future = self._ai_pool.submit(self.generate_linkedin_fields_with_ai, candidate)
+        enriched_candidate = self._linkedin_stage(candidate)
+        self._apply_ai_fields(enriched_candidate, ai_future.result())
         
         return enriched_candidate
     
-    def enrich_multiple_candidates(self, candidates: list) -> list:
-        """Enrich multiple candidates with LinkedIn data"""
-        print(f"\n🔗 LINKEDIN ENRICHER: Processing {len(candidates)} candidates")
-        print("=" * 50)
+    async def _alinkedin_stage(self, candidate: Dict) -> Dict:
+        """Async _linkedin_stage (the sync-only Composio call runs in a worker thread)"""
+        linkedin_url = self._stage_linkedin_url(candidate)
+        linkedin_data = None
+        if linkedin_url:
+            linkedin_data = await asyncio.to_thread(self._fetch_linkedin_or_empty, linkedin_url)
+        return self._stage_result(candidate, linkedin_data)
+    
+    async def aenrich_candidate_profile(self, candidate: Dict) -> Dict:
+        """
+        Async variant of enrich_candidate_profile
         
-        enriched_candidates = []
+        The Composio SDK is sync-only, so the LinkedIn API call runs in a worker
+        thread; the LLM call goes through AsyncGroq. Many candidates can then be
+        enriched concurrently from one event loop.
+        """
+        # Generate AI-powered LinkedIn fields while the LinkedIn API is queried
+        logger.debug("🤖 Generating AI-enhanced LinkedIn fields...")
+        enriched_candidate, ai_fields = await asyncio.gather(
+            self._alinkedin_stage(candidate),
+            self.agenerate_linkedin_fields_with_ai(candidate),
+        )
+        self._apply_ai_fields(enriched_candidate, ai_fields)
         
-        for i, candidate in enumerate(candidates, 1):
-            print(f"[{i}/{len(candidates)}] Processing candidate...")
+        return enriched_candidate
+    
+    async def aenrich_candidates(self, candidates: List[Dict], batch_size: int = 8,
+                                 max_concurrency: int = 8, force: bool = False) -> List:
+        """
+        Enrich many candidates: LinkedIn API calls concurrently, AI fields in
+        batched calls running at the same time
+        
+        Args:
+            candidates: Candidate dictionaries
+            batch_size: Candidates per AI call
+            max_concurrency: Max in-flight LinkedIn API calls
+            force: Re-enrich candidates that already carry LinkedIn fields
             
-            try:
-                enriched = self.enrich_candidate_profile(candidate)
-                enriched_candidates.append(enriched)
-                print(f"✅ Successfully enriched")
-            except Exception as e:
-                print(f"❌ Enrichment failed: {str(e)}")
+        Returns:
+            Enriched candidates in input order; an exception in place of any
+            candidate whose LinkedIn stage failed
+        """
+        if not force:
+            todo = [i for i, c in enumerate(candidates) if not c.get(ENRICHED_MARKER)]
+            if len(todo) < len(candidates):
+                logger.info("♻️  %s candidate(s) already enriched, skipping", len(candidates) - len(todo))
+                results = list(candidates)
+                enriched = await self.aenrich_candidates(
+                    [candidates[i] for i in todo], batch_size, max_concurrency, force=True
+                )
+                for i, candidate in zip(todo, enriched):
+                    results[i] = candidate
+                return results
+        
+        logger.info("🤖 Generating AI-enhanced LinkedIn fields for %s candidate(s)...", len(candidates))
+        staged, ai_fields = await asyncio.gather(
+            self._alinkedin_stages(candidates, max_concurrency),
+            self.agenerate_linkedin_fields_batch(candidates, batch_size),
+        )
+        for enriched_candidate, fields in zip(staged, ai_fields):
+            if not isinstance(enriched_candidate, Exception):
+                self._apply_ai_fields(enriched_candidate, fields)
+        
+        return staged
+    
+    async def _alinkedin_stages(self, candidates: List[Dict], max_concurrency: int) -> List:
+        """LinkedIn stage for every candidate, at most max_concurrency at once (exceptions in place)"""
+        sem = asyncio.Semaphore(max_concurrency)
+        
+        async def linkedin_stage(candidate: Dict) -> Dict:
+            async with sem:
+                return await self._alinkedin_stage(candidate)
+        
+        return await asyncio.gather(*(linkedin_stage(c) for c in candidates), return_exceptions=True)
+    
+    def enrich_multiple_candidates_batch(self, candidates: list, max_concurrency: int = 8,
+                                         poll_interval: float = BATCH_POLL_INTERVAL) -> list:
+        """
+        Enrich many candidates with AI fields generated through Groq's Batch API
+        
+        For offline bulk runs: one batch job at batch pricing, blocking until it
+        finishes (up to the 24h window). Candidates the batch didn't answer get
+        realtime calls.
+        """
+        logger.info("\n🔗 LINKEDIN ENRICHER: Processing %s candidates (batch API)", len(candidates))
+        logger.info("=" * 50)
+        
+        staged = run_async(self._alinkedin_stages(candidates, max_concurrency))
+        
+        # Single-candidate prompts, so answers land in the same cache entries as realtime calls
+        bodies = {
+            str(i): self._single_request(enriched)
+            for i, enriched in enumerate(staged) if not isinstance(enriched, Exception)
+        }
+        replies = run_chat_batch(self.batch_client, get_llm_cache(), bodies, semantic=False,
+                                 poll_interval=poll_interval)
+        
+        enriched_candidates = []
+        for i, (candidate, enriched) in enumerate(zip(candidates, staged)):
+            if isinstance(enriched, Exception):
+                logger.error("❌ Enrichment failed: %s", enriched)
                 enriched_candidates.append(candidate)  # Keep original
+                continue
+            
+            reply = replies.get(str(i))
+            try:
+                ai_fields = self._parse_ai_fields(reply) if reply is not None else None
+            except ValueError:
+                ai_fields = None
+            if ai_fields is None:
+                ai_fields = self.generate_linkedin_fields_with_ai(enriched)
+            self._apply_ai_fields(enriched, ai_fields)
+            enriched_candidates.append(enriched)
         
-        print(f"\n✅ LinkedIn enrichment complete: {len(enriched_candidates)} candidates processed")
+        logger.info("\n✅ LinkedIn enrichment complete: %s candidates processed", len(enriched_candidates))
+        return enriched_candidates
+    
+    def enrich_multiple_candidates(self, candidates: list, batch_size: int = 8, force: bool = False) -> list:
+        """
+        Enrich multiple candidates with LinkedIn data (concurrently, AI fields in batches)
+        
+        Candidates already enriched by an earlier run are passed through
+        unless force is set.
+        """
+        logger.info("\n🔗 LINKEDIN ENRICHER: Processing %s candidates", len(candidates))
+        logger.info("=" * 50)
+        
+        results = run_async(self.aenrich_candidates(candidates, batch_size, force=force))
+        
+        enriched_candidates = []
+        for candidate, enriched in zip(candidates, results):
+            if isinstance(enriched, Exception):
+                logger.error("❌ Enrichment failed: %s", enriched)
+                enriched = candidate  # Keep original
+            enriched_candidates.append(enriched)
+        
+        logger.info("\n✅ LinkedIn enrichment complete: %s candidates processed", len(enriched_candidates))
         return enriched_candidates
 
 
 def main():
     """Test the LinkedIn Enricher independently"""
-    print("🔗 TESTING LINKEDIN ENRICHER MODULE")
-    print("=" * 40)
+    configure_logging()
+    
+    logger.info("🔗 TESTING LINKEDIN ENRICHER MODULE")
+    logger.info("=" * 40)
     
     # Test with sample candidate
     test_candidate = {
@@ -257,8 +721,8 @@ def main():
     enricher = LinkedInEnricher()
     result = enricher.enrich_candidate_profile(test_candidate)
     
-    print("\n📊 Enrichment Result:")
-    print(json.dumps(result, indent=2))
+    logger.info("\n📊 Enrichment Result:")
+    logger.info("%s", orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+💾 LLM RESPONSE CACHE MODULE
+Caches Groq chat completions on disk so unchanged prompts skip the LLM call
+
+Two tiers:
+1. Exact: sha256 of (model, messages) → response text, stored in SQLite
+2. Semantic (optional): prompt embedding → nearest cached response when
+   cosine similarity >= threshold. Only for temperature > 0, only when
+   sentence-transformers is installed, and only for clients that opt in.
+
+Recent exact hits are also kept in memory to skip the SQLite read.
+"""
+
+import json
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+DEFAULT_CACHE_PATH = Path("output/.llmcache.sqlite")
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+MEMORY_ENTRIES = 1024  # recent responses kept in process
+
+
+class LLMCache:
+    """Exact + semantic cache for LLM chat completions"""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, similarity_threshold: float = 0.92,
+                 semantic: bool = True):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite file holding cached responses
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            semantic: Enable the embedding tier (needs sentence-transformers)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.similarity_threshold = similarity_threshold
+        self.semantic = semantic and SEMANTIC_CACHE_AVAILABLE
+
+        # Shared across worker threads, so serialize access ourselves
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, model TEXT, response TEXT, embedding BLOB)"
+        )
+        self._db.commit()
+
+        self._memory: OrderedDict = OrderedDict()  # key -> response, LRU
+        self._vectors: Dict[str, list] = {}  # model -> [(key, vector), ...]
+        if self.semantic:
+            self._load_vectors()
+
+    @staticmethod
+    def _key(model: str, messages: List[Dict]) -> str:
+        payload = json.dumps({"model": model, "messages": messages}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _prompt_text(messages: List[Dict]) -> str:
+        return "\n".join(str(m.get("content", "")) for m in messages)
+
+    def _embed(self, messages: List[Dict]):
+        encoder = get_sentence_encoder()
+        return encoder.encode(self._prompt_text(messages), normalize_embeddings=True).astype(np.float32)
+
+    def _load_vectors(self) -> None:
+        rows = self._db.execute(
+            "SELECT key, model, embedding FROM responses WHERE embedding IS NOT NULL"
+        ).fetchall()
+        for key, model, blob in rows:
+            self._vectors.setdefault(model, []).append((key, np.frombuffer(blob, dtype=np.float32)))
+
+    def _remember(self, key: str, response: str) -> None:
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        if len(self._memory) > MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    def get(self, model: str, messages: List[Dict], temperature: float,
+            semantic: bool = True) -> Optional[str]:
+        """Return a cached response for this prompt, or None on a miss"""
+        key = self._key(model, messages)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            row = self._db.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row:
+                self._remember(key, row[0])
+                return row[0]
+
+        # Deterministic calls only ever hit on the exact prompt
+        if not (semantic and self.semantic) or temperature == 0 or not self._vectors.get(model):
+            return None
+
+        query = self._embed(messages)
+        with self._lock:
+            keys, vectors = zip(*self._vectors[model])
+            sims = np.stack(vectors) @ query
+            best = int(np.argmax(sims))
+            if sims[best] < self.similarity_threshold:
+                return None
+            row = self._db.execute("SELECT response FROM responses WHERE key = ?", (keys[best],)).fetchone()
+        return row[0] if row else None
+
+    def set(self, model: str, messages: List[Dict], temperature: float, response: str,
+            semantic: bool = True) -> None:
+        """Store a response for this prompt"""
+        key = self._key(model, messages)
+        vector = self._embed(messages) if semantic and self.semantic and temperature != 0 else None
+        with self._lock:
+            self._remember(key, response)
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, embedding) VALUES (?, ?, ?, ?)",
+                (key, model, response, vector.tobytes() if vector is not None else None)
+            )
+            self._db.commit()
+            if vector is not None:
+                self._vectors.setdefault(model, []).append((key, vector))
+
+
+@lru_cache(maxsize=1)
+def get_sentence_encoder():
+    """Process-wide sentence embedding model, or None without sentence-transformers"""
+    if not SEMANTIC_CACHE_AVAILABLE:
+        return None
+    return SentenceTransformer(EMBEDDING_MODEL)
+
+
+def _cached_response(content: str) -> SimpleNamespace:
+    """Minimal stand-in for a Groq ChatCompletion built from cached text"""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class _CachedCompletions:
+    def __init__(self, client, cache: LLMCache, semantic: bool = True):
+        self._client = client
+        self._cache = cache
+        self._semantic = semantic
+
+    def create(self, *, messages: List[Dict], model: str, temperature: float = 1.0, **kwargs):
+        if kwargs.get("stream"):
+            return self._client.chat.completions.create(
+                messages=messages, model=model, temperature=temperature, **kwargs
+            )
+
+        cached = self._cache.get(model, messages, temperature, self._semantic)
+        if cached is not None:
+            return _cached_response(cached)
+
+        response = self._client.chat.completions.create(
+            messages=messages, model=model, temperature=temperature, **kwargs
+        )
+        self._cache.set(model, messages, temperature, response.choices[0].message.content, self._semantic)
+        return response
+
+
+class _AsyncCachedCompletions(_CachedCompletions):
+    async def create(self, *, messages: List[Dict], model: str, temperature: float = 1.0, **kwargs):
+        if kwargs.get("stream"):
+            return await self._client.chat.completions.create(
+                messages=messages, model=model, temperature=temperature, **kwargs
+            )
+
+        cached = self._cache.get(model, messages, temperature, self._semantic)
+        if cached is not None:
+            return _cached_response(cached)
+
+        response = await self._client.chat.completions.create(
+            messages=messages, model=model, temperature=temperature, **kwargs
+        )
+        self._cache.set(model, messages, temperature, response.choices[0].message.content, self._semantic)
+        return response
+
+
+class CachingGroq:
+    """
+    Drop-in wrapper for a Groq / AsyncGroq client
+
+    Exposes the same `client.chat.completions.create(...)` call, answering
+    from the LLM cache when possible. Pass semantic=False where a merely
+    similar prompt must not reuse an answer (e.g. parsing a specific resume).
+    """
+
+    def __init__(self, client, cache: LLMCache, is_async: bool = False, semantic: bool = True):
+        completions_cls = _AsyncCachedCompletions if is_async else _CachedCompletions
+        self.chat = SimpleNamespace(completions=completions_cls(client, cache, semantic))
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> LLMCache:
+    """Process-wide cache shared by the enricher and scorer"""
+    return LLMCache()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+📝 LOGGING SETUP MODULE
+One place to configure console output for the pipeline and its modules
+
+Every module logs through `logging.getLogger(__name__)`. configure_logging()
+hands records to a background QueueListener thread, so formatting and the
+stdout write happen off the calling thread, and makes sure the console can
+print the emoji used throughout the messages (Windows code pages can't).
+Bulk runs can also buffer records and write them in batches.
+"""
+
+import os
+import sys
+import queue
+import atexit
+import logging
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import Optional, Union
+
+# Loggers owned by this project; third-party libraries stay at WARNING
+APP_LOGGERS = ("src", "ai_recruiter_pipeline", "__main__")
+LOG_FORMAT = "%(message)s"
+# Records held before a batched write (0 = write each one); errors flush at once
+LOG_BUFFER_RECORDS_ENV = "LOG_BUFFER_RECORDS"
+
+_listener = None
+
+
+def _utf8_stream(stream):
+    """Return `stream`, switched to UTF-8 if it can't encode emoji"""
+    try:
+        "✅".encode(getattr(stream, "encoding", None) or "ascii")
+    except (LookupError, UnicodeEncodeError):
+        try:
+            stream.reconfigure(encoding="utf-8", errors="replace")
+        except (AttributeError, ValueError):
+            pass
+    return stream
+
+
+def configure_logging(level: Optional[Union[int, str]] = None, use_queue: bool = True,
+                      buffer_records: Optional[int] = None) -> None:
+    """
+    Route project logging to stdout with message-only formatting
+
+    Safe to call more than once; later calls only adjust the level.
+
+    Args:
+        level: Level for the project's loggers (default: $LOGLEVEL, else INFO)
+        use_queue: Hand records to a background listener thread. Worker
+            processes pass False since the listener lives in the parent.
+        buffer_records: Write output in batches of this many records, for
+            bulk runs where live progress doesn't matter (default:
+            $LOG_BUFFER_RECORDS, else 0 = unbuffered). ERROR records and
+            interpreter exit flush the buffer.
+    """
+    global _listener
+
+    if level is None:
+        level = (os.getenv("LOGLEVEL") or "INFO").upper()  # e.g. LOGLEVEL=DEBUG
+
+    root = logging.getLogger()
+    if use_queue and _listener is not None:
+        for name in APP_LOGGERS:
+            logging.getLogger(name).setLevel(level)
+        return
+
+    if buffer_records is None:
+        buffer_records = int(os.getenv(LOG_BUFFER_RECORDS_ENV) or 0)  # e.g. LOG_BUFFER_RECORDS=1000
+
+    handler = logging.StreamHandler(_utf8_stream(sys.stdout))
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    if buffer_records > 0:
+        handler = MemoryHandler(buffer_records, flushLevel=logging.ERROR, target=handler)
+        atexit.register(handler.close)  # registered first, so runs after the listener drains
+
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+
+    if use_queue:
+        records = queue.SimpleQueue()
+        _listener = QueueListener(records, handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+        root.addHandler(QueueHandler(records))
+    else:
+        root.addHandler(handler)
+
+    root.setLevel(logging.WARNING)
+    for name in APP_LOGGERS:
+        logging.getLogger(name).setLevel(level)
+
+
+def configure_worker_logging() -> None:
+    """ProcessPoolExecutor initializer: log directly from the worker process"""
+    global _listener
+    _listener = None  # a forked copy of the parent's listener isn't running here
+    configure_logging(use_queue=False, buffer_records=0)  # workers may exit without atexit
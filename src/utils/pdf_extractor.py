@@ -5,271 +5,500 @@ Handles PDF and text resume processing with comprehensive data extraction
 """
 
 import os
-import json
+import logging
+import asyncio
+import threading
 import fitz  # PyMuPDF
+import orjson
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
+import httpx
 from groq import Groq
-from ..config.legacy_config import GROQ_API_KEY, GROQ_MODEL
+from .http_pool import get_groq_client
+from .llm_cache import CachingGroq, get_llm_cache
+from .groq_batch import BATCH_POLL_INTERVAL, run_chat_batch
+from .logging_setup import configure_logging, configure_worker_logging
+from ..config.legacy_config import GROQ_API_KEY, GROQ_MODEL, GROQ_MODEL_BACKUP
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_PATTERNS = ['*.pdf', '*.txt', '*.text']
+
+# Staged extraction: bounded hand-off queue and concurrent AI parse workers
+STAGE_QUEUE_SIZE = 32
+PARSE_CONCURRENCY = 4
+
+# PyMuPDF text flags: the defaults minus ligature preservation
+PDF_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+
+# Parsed candidates are appended, one JSON object per line, to a single file
+CANDIDATES_SINK = "candidates.jsonl"
+SINK_BUFFER_BYTES = 1 << 16
+
+# Low-confidence parses from the fast model are re-run on GROQ_MODEL_BACKUP,
+# for at most this share of a directory run's resumes
+ESCALATION_SHARE = 0.10
+
+# Output budget for one parsed resume (JSON mode, so no prose around it)
+RESUME_MAX_TOKENS = 1500
+
+# Fixed instructions go in the system message and only the resume text varies,
+# so every parse shares one byte-identical prefix (cacheable by the provider)
+RESUME_SYSTEM_PROMPT = """\
+You are an expert resume parser. Extract ALL available information from this resume.
+
+Return a single JSON object matching this schema:
+{
+    "full_name": "Full candidate name",
+    "email": "email@domain.com",
+    "phone": "Phone number with country code",
+    "location": "City, State/Country",
+    "current_role": "Most recent job title",
+    "company": "Current/most recent company",
+    "summary": "Professional summary if present",
+    "years_of_experience": "Total years or estimate",
+    "skills": ["technical skills", "languages", "frameworks", "tools", "certifications"],
+    "experience": [
+        {
+            "title": "Job Title",
+            "company": "Company Name",
+            "duration": "Start - End dates",
+            "location": "City, State",
+            "description": "Key responsibilities and achievements",
+            "achievements": ["Quantified achievement 1", "Achievement 2"]
+        }
+    ],
+    "education": [
+        {
+            "degree": "Full degree name",
+            "field": "Field of study",
+            "institution": "University/College name",
+            "year": "Graduation year",
+            "gpa": "GPA if mentioned",
+            "location": "City, State"
+        }
+    ],
+    "certifications": ["Certification 1", "License 1"],
+    "projects": [
+        {
+            "name": "Project Name",
+            "description": "Brief description",
+            "technologies": ["tech1", "tech2"],
+            "duration": "Project timeframe"
+        }
+    ],
+    "languages": ["Language (proficiency)"],
+    "linkedin_url": "LinkedIn URL if found",
+    "github_url": "GitHub URL if found",
+    "portfolio_url": "Portfolio URL if found",
+    "awards": ["Award 1", "Achievement 1"],
+    "publications": ["Publication 1"],
+    "volunteer_experience": ["Organization - Role"],
+    "salary_expectation": "Salary info if mentioned",
+    "availability": "Start date if mentioned",
+    "visa_status": "Work authorization if mentioned",
+    "preferred_roles": ["Preferred role types"],
+    "industry_preference": "Preferred industry"
+}
+
+EXTRACTION RULES:
+1. Extract ALL contact info (email, phone, LinkedIn, GitHub, portfolio)
+2. Get complete work history with quantified achievements
+3. Extract ALL skills (technical + soft skills + tools)
+4. Get full education (degree, school, GPA, honors)
+5. Find certifications, licenses, courses
+6. Extract projects with technologies
+7. Look for awards, publications, volunteer work
+8. Find salary expectations, availability, visa status
+9. If info missing, use empty string or empty array
+10. BE THOROUGH - this is for detailed recruiter screening
+"""
+
+def _low_confidence(candidate_data) -> bool:
+    """A parse worth a second opinion: nothing usable, no name, no way to contact, or no substance"""
+    if not isinstance(candidate_data, dict) or not candidate_data.get('full_name'):
+        return True
+    if not (candidate_data.get('email') or candidate_data.get('phone')):
+        return True
+    return not (candidate_data.get('skills') or candidate_data.get('experience'))
+
+
+def extract_one(file_path: Path) -> Dict:
+    """
+    Extract raw text from a single resume file
+
+    Pure function of the path so it can run in a worker process; only the
+    path goes in and only plain text comes back.
+
+    Returns:
+        Dict with 'path' and 'text' ('' if unsupported or extraction failed)
+    """
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+    if suffix == '.pdf':
+        text = PDFExtractor.extract_text_from_pdf(file_path)
+    elif suffix in ['.txt', '.text']:
+        text = PDFExtractor.extract_text_from_txt(file_path)
+    else:
+        logger.error("❌ Unsupported file type: %s", file_path.suffix)
+        text = ""
+    return {"path": str(file_path), "text": text}
 
 
 class PDFExtractor:
     """PDF and Text Resume Processing Service"""
     
-    def __init__(self):
-        self.groq_client = Groq(api_key=GROQ_API_KEY)
+    def __init__(self, http_client: httpx.Client = None):
+        self.batch_client = Groq(api_key=GROQ_API_KEY, http_client=http_client) if http_client else get_groq_client(GROQ_API_KEY)
+        # Exact-prompt hits only: a similar resume must never reuse another's parse
+        self.groq_client = CachingGroq(self.batch_client, get_llm_cache(), semantic=False)
         self.input_dir = Path("./incoming_resumes")
         self.output_dir = Path("./processed_candidates")
         self.output_dir.mkdir(exist_ok=True)
-        print("📄 PDF Extractor initialized")
+        # Parse workers run in threads, so whole lines are written under a lock
+        self._sink_lock = threading.Lock()
+        self._sink = open(self.output_dir / CANDIDATES_SINK, "ab", buffering=SINK_BUFFER_BYTES)
+        # Backup-model re-parses left in the current directory run (None = no cap)
+        self._escalation_lock = threading.Lock()
+        self._escalations_left: Optional[int] = None
+        logger.info("📄 PDF Extractor initialized")
     
-    def extract_text_from_pdf(self, pdf_path: Path) -> str:
+    @staticmethod
+    def extract_text_from_pdf(pdf_path: Path) -> str:
         """Extract text from PDF using PyMuPDF"""
         try:
-            print(f"📖 Extracting text from PDF: {pdf_path.name}")
-            doc = fitz.open(pdf_path)
-            text = ""
-            page_count = doc.page_count
+            logger.debug("📖 Extracting text from PDF: %s", pdf_path.name)
+            # One pass over the pages, joined once (form feed between pages).
+            # Ligatures are expanded, so "ﬁ" comes out as "fi"
+            with fitz.open(pdf_path) as doc:
+                page_count = doc.page_count
+                text = "\f".join(page.get_text("text", flags=PDF_TEXT_FLAGS) for page in doc)
             
-            for page_num in range(page_count):
-                page = doc.load_page(page_num)
-                page_text = page.get_text()
-                text += page_text
-                
-            doc.close()
-            
-            print(f"✅ Extracted {len(text)} characters from {page_count} pages")
+            logger.debug("✅ Extracted %s characters from %s pages", len(text), page_count)
             return text.strip()
             
         except Exception as e:
-            print(f"❌ PDF extraction error for {pdf_path}: {str(e)}")
+            logger.error("❌ PDF extraction error for %s: %s", pdf_path, e)
             return ""
     
-    def extract_text_from_txt(self, txt_path: Path) -> str:
+    @staticmethod
+    def extract_text_from_txt(txt_path: Path) -> str:
         """Extract text from TXT file"""
         try:
-            print(f"📝 Reading text file: {txt_path.name}")
+            logger.debug("📝 Reading text file: %s", txt_path.name)
             with open(txt_path, 'r', encoding='utf-8') as f:
                 text = f.read().strip()
             
-            print(f"✅ Extracted {len(text)} characters")
+            logger.debug("✅ Extracted %s characters", len(text))
             return text
             
         except Exception as e:
-            print(f"❌ TXT extraction error for {txt_path}: {str(e)}")
+            logger.error("❌ TXT extraction error for %s: %s", txt_path, e)
             return ""
     
-    def parse_resume_with_ai(self, text: str, filename: str) -> Optional[Dict]:
+    @staticmethod
+    def _resume_request(text: str, model: str = GROQ_MODEL) -> Dict:
+        return {
+            "messages": [
+                {"role": "system", "content": RESUME_SYSTEM_PROMPT},
+                {"role": "user", "content": f"Resume Text:\n{text}"},
+            ],
+            "model": model,
+            "temperature": 0.1,
+            "max_tokens": RESUME_MAX_TOKENS,
+            "response_format": {"type": "json_object"},
+        }
+    
+    def parse_resume_with_ai(self, text: str, filename: str, model: str = GROQ_MODEL) -> Optional[Dict]:
         """Parse resume text using advanced AI prompting for comprehensive extraction"""
         try:
-            print(f"🤖 Processing with AI: {filename}")
-            
-            prompt = f"""
-            You are an expert resume parser. Extract ALL available information from this resume and return ONLY a JSON object.
-            
-            REQUIRED JSON STRUCTURE:
-            {{
-                "full_name": "Full candidate name",
-                "email": "email@domain.com",
-                "phone": "Phone number with country code",
-                "location": "City, State/Country",
-                "current_role": "Most recent job title",
-                "company": "Current/most recent company",
-                "summary": "Professional summary if present",
-                "years_of_experience": "Total years or estimate",
-                "skills": ["technical skills", "languages", "frameworks", "tools", "certifications"],
-                "experience": [
-                    {{
-                        "title": "Job Title",
-                        "company": "Company Name", 
-                        "duration": "Start - End dates",
-                        "location": "City, State",
-                        "description": "Key responsibilities and achievements",
-                        "achievements": ["Quantified achievement 1", "Achievement 2"]
-                    }}
-                ],
-                "education": [
-                    {{
-                        "degree": "Full degree name",
-                        "field": "Field of study",
-                        "institution": "University/College name",
-                        "year": "Graduation year",
-                        "gpa": "GPA if mentioned",
-                        "location": "City, State"
-                    }}
-                ],
-                "certifications": ["Certification 1", "License 1"],
-                "projects": [
-                    {{
-                        "name": "Project Name",
-                        "description": "Brief description",
-                        "technologies": ["tech1", "tech2"],
-                        "duration": "Project timeframe"
-                    }}
-                ],
-                "languages": ["Language (proficiency)"],
-                "linkedin_url": "LinkedIn URL if found",
-                "github_url": "GitHub URL if found", 
-                "portfolio_url": "Portfolio URL if found",
-                "awards": ["Award 1", "Achievement 1"],
-                "publications": ["Publication 1"],
-                "volunteer_experience": ["Organization - Role"],
-                "salary_expectation": "Salary info if mentioned",
-                "availability": "Start date if mentioned",
-                "visa_status": "Work authorization if mentioned",
-                "preferred_roles": ["Preferred role types"],
-                "industry_preference": "Preferred industry"
-            }}
+            logger.debug("🤖 Processing with AI: %s", filename)
             
-            EXTRACTION RULES:
-            1. Extract ALL contact info (email, phone, LinkedIn, GitHub, portfolio)
-            2. Get complete work history with quantified achievements  
-            3. Extract ALL skills (technical + soft skills + tools)
-            4. Get full education (degree, school, GPA, honors)
-            5. Find certifications, licenses, courses
-            6. Extract projects with technologies
-            7. Look for awards, publications, volunteer work
-            8. Find salary expectations, availability, visa status
-            9. If info missing, use empty string or empty array
-            10. BE THOROUGH - this is for detailed recruiter screening
-            
-            Resume Text:
-            {text}
-            """
-            
-            response = self.groq_client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=GROQ_MODEL,
-                temperature=0.1,
-                max_tokens=2500
-            )
+            response = self.groq_client.chat.completions.create(**self._resume_request(text, model))
             
             ai_text = response.choices[0].message.content.strip()
-            print(f"🧠 AI response received ({len(ai_text)} characters)")
+            logger.debug("🧠 AI response received (%s characters)", len(ai_text))
             
-            # Parse JSON response
-            try:
-                parsed_data = json.loads(ai_text)
-                print("✅ JSON parsed successfully")
-                return parsed_data
-            except json.JSONDecodeError:
-                # Try to extract JSON from code block
-                if "```json" in ai_text:
-                    json_start = ai_text.find("```json") + 7
-                    json_end = ai_text.find("```", json_start)
-                    json_text = ai_text[json_start:json_end].strip()
-                    parsed_data = json.loads(json_text)
-                    print("✅ JSON extracted from code block")
-                    return parsed_data
-                else:
-                    print("❌ Failed to parse AI response as JSON")
-                    return None
+            # JSON mode guarantees a single JSON object
+            parsed_data = orjson.loads(ai_text)
+            logger.debug("✅ JSON parsed successfully")
+            return parsed_data
                     
         except Exception as e:
-            print(f"❌ AI parsing error for {filename}: {str(e)}")
+            logger.error("❌ AI parsing error for %s: %s", filename, e)
             return None
     
-    def process_single_file(self, file_path: Path) -> Optional[Dict]:
-        """Process a single resume file (PDF or TXT)"""
-        print(f"\n📄 Processing: {file_path.name}")
-        print("-" * 40)
+    def process_single_file(self, file_path: Path, text: Optional[str] = None) -> Optional[Dict]:
+        """
+        Process a single resume file (PDF or TXT)
+        
+        Args:
+            file_path: Resume file
+            text: Already-extracted text (skips extraction when given)
+        """
+        logger.debug("\n📄 Processing: %s", file_path.name)
+        logger.debug("-" * 40)
         
         try:
             # Extract text based on file type
-            if file_path.suffix.lower() == '.pdf':
-                text = self.extract_text_from_pdf(file_path)
-            elif file_path.suffix.lower() in ['.txt', '.text']:
-                text = self.extract_text_from_txt(file_path)
-            else:
-                print(f"❌ Unsupported file type: {file_path.suffix}")
-                return None
+            if text is None:
+                text = extract_one(file_path)["text"]
             
             if not text:
-                print(f"❌ No text extracted from {file_path.name}")
+                logger.error("❌ No text extracted from %s", file_path.name)
                 return None
             
-            # Parse with AI
-            candidate_data = self.parse_resume_with_ai(text, file_path.name)
+            # Parse with AI (fast model first, backup model if the result looks weak)
+            candidate_data = self._verify(text, file_path.name, self.parse_resume_with_ai(text, file_path.name))
             
             if not candidate_data:
-                print(f"❌ Failed to parse {file_path.name}")
+                logger.error("❌ Failed to parse %s", file_path.name)
                 return None
             
-            # Add metadata
-            candidate_data['source'] = 'pdf_resume'
-            candidate_data['source_file'] = str(file_path.name)
-            candidate_data['extraction_timestamp'] = str(Path().resolve())
+            return self._save_candidate(file_path, candidate_data)
             
-            # Save individual candidate file
-            timestamp = Path().resolve().name.split('_')[-1] if '_' in str(Path().resolve()) else "unknown"
-            output_file = self.output_dir / f"{file_path.stem}_{timestamp}.json"
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(candidate_data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            logger.error("❌ Processing error for %s: %s", file_path.name, e)
+            return None
+    
+    def _take_escalation(self) -> bool:
+        with self._escalation_lock:
+            if self._escalations_left is None:
+                return True
+            if self._escalations_left <= 0:
+                return False
+            self._escalations_left -= 1
+            return True
+    
+    def _verify(self, text: str, filename: str, candidate_data) -> Optional[Dict]:
+        """Re-parse a low-confidence result on the backup model, within the run's budget"""
+        if _low_confidence(candidate_data) and self._take_escalation():
+            logger.info("🔁 Low-confidence parse for %s, re-running on %s", filename, GROQ_MODEL_BACKUP)
+            candidate_data = self.parse_resume_with_ai(text, filename, model=GROQ_MODEL_BACKUP) or candidate_data
+        return candidate_data if isinstance(candidate_data, dict) else None
+    
+    def _save_candidate(self, file_path: Path, candidate_data: Dict) -> Dict:
+        """Add source metadata to a parsed candidate and append it to the sink"""
+        candidate_data['source'] = 'pdf_resume'
+        candidate_data['source_file'] = str(file_path.name)
+        candidate_data['extraction_timestamp'] = str(Path().resolve())
+        
+        line = orjson.dumps(candidate_data, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        with self._sink_lock:
+            self._sink.write(line)
+        
+        name = candidate_data.get('full_name', 'Unknown')
+        email = candidate_data.get('email', 'No email')
+        logger.info("✅ Successfully processed: %s (%s)", name, email)
+        logger.debug("💾 Saved to: %s", self._sink.name)
+        
+        return candidate_data
+    
+    async def _extract_staged(self, files: List[Path], workers: int) -> List[Optional[Dict]]:
+        """
+        Run extraction and AI parsing as two overlapped stages
+        
+        Texts flow from a process pool into a bounded queue as soon as each
+        file finishes, and parse workers drain it concurrently, so the LLM is
+        already busy while later PDFs are still being read.
+        
+        Returns:
+            Parsed candidate (or None) per file, in input order
+        """
+        loop = asyncio.get_running_loop()
+        text_q: asyncio.Queue = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+        results: List[Optional[Dict]] = [None] * len(files)
+        
+        async def extract_stage(executor: ProcessPoolExecutor):
+            async def extract(idx: int, file_path: Path):
+                extracted = await loop.run_in_executor(executor, extract_one, file_path)
+                await text_q.put((idx, file_path, extracted["text"]))
             
-            name = candidate_data.get('full_name', 'Unknown')
-            email = candidate_data.get('email', 'No email')
-            print(f"✅ Successfully processed: {name} ({email})")
-            print(f"💾 Saved to: {output_file}")
+            await asyncio.gather(*(extract(i, f) for i, f in enumerate(files)))
+            for _ in range(PARSE_CONCURRENCY):
+                await text_q.put(None)
+        
+        async def parse_worker():
+            while True:
+                item = await text_q.get()
+                if item is None:
+                    return
+                idx, file_path, text = item
+                logger.info("\n[%s/%s] Processing file...", idx + 1, len(files))
+                results[idx] = await asyncio.to_thread(self.process_single_file, file_path, text)
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=configure_worker_logging) as executor:
+            await asyncio.gather(extract_stage(executor), *(parse_worker() for _ in range(PARSE_CONCURRENCY)))
+        
+        return results
+    
+    def extract_from_directory(self, input_dir: Path = None, workers: Optional[int] = None) -> List[Dict]:
+        """
+        Process all PDF and TXT files from input directory
+        
+        Args:
+            input_dir: Folder to scan (defaults to incoming_resumes)
+            workers: Processes for text extraction (defaults to CPU count, 1 = serial)
+        """
+        return asyncio.run(self.aextract_from_directory(input_dir, workers))
+    
+    async def aextract_from_directory(self, input_dir: Path = None, workers: Optional[int] = None) -> List[Dict]:
+        """Async version of extract_from_directory for callers already inside an event loop"""
+        supported_files = self._find_files(input_dir)
+        if not supported_files:
+            return []
+        self._escalations_left = max(1, int(len(supported_files) * ESCALATION_SHARE))
+        
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(supported_files) > 1:
+            # Overlap CPU-bound text extraction with network-bound AI parsing
+            workers = min(workers, len(supported_files))
+            logger.info("⚡ Extracting text with %s worker processes", workers)
+            results = await self._extract_staged(supported_files, workers)
+        else:
+            # No worker processes: files are read and parsed in threads, a few at a time
+            sem = asyncio.Semaphore(PARSE_CONCURRENCY)
             
-            return candidate_data
+            async def process(i: int, file_path: Path) -> Optional[Dict]:
+                async with sem:
+                    logger.info("\n[%s/%s] Processing file...", i, len(supported_files))
+                    return await asyncio.to_thread(self.process_single_file, file_path)
             
-        except Exception as e:
-            print(f"❌ Processing error for {file_path.name}: {str(e)}")
-            return None
+            results = await asyncio.gather(*(process(i, f) for i, f in enumerate(supported_files, 1)))
+        
+        self.flush()
+        self._escalations_left = None
+        
+        return self._collect(supported_files, results)
     
-    def extract_from_directory(self, input_dir: Path = None) -> List[Dict]:
-        """Process all PDF and TXT files from input directory"""
+    def extract_from_directory_batch(self, input_dir: Path = None, workers: Optional[int] = None,
+                                     poll_interval: float = BATCH_POLL_INTERVAL) -> List[Dict]:
+        """
+        Process all files from the input directory through Groq's Batch API
+        
+        For offline bulk runs: every resume goes up in one batch job at batch
+        pricing and this blocks until it finishes (up to the 24h window).
+        Resumes the batch didn't answer are parsed with realtime calls.
+        
+        Args:
+            input_dir: Folder to scan (defaults to incoming_resumes)
+            workers: Processes for text extraction (defaults to CPU count, 1 = serial)
+            poll_interval: Seconds between batch status checks
+        """
+        supported_files = self._find_files(input_dir)
+        if not supported_files:
+            return []
+        self._escalations_left = max(1, int(len(supported_files) * ESCALATION_SHARE))
+        
+        workers = min(workers or os.cpu_count() or 1, len(supported_files))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=configure_worker_logging) as executor:
+                texts = [extracted["text"] for extracted in executor.map(extract_one, supported_files)]
+        else:
+            texts = [extract_one(file_path)["text"] for file_path in supported_files]
+        
+        bodies = {
+            file_path.name: self._resume_request(text)
+            for file_path, text in zip(supported_files, texts) if text
+        }
+        replies = run_chat_batch(self.batch_client, get_llm_cache(), bodies, semantic=False,
+                                 poll_interval=poll_interval)
+        
+        results = []
+        for file_path, text in zip(supported_files, texts):
+            reply = replies.get(file_path.name)
+            candidate_data = None
+            if reply is not None:
+                try:
+                    parsed = orjson.loads(reply)
+                except orjson.JSONDecodeError as e:
+                    logger.error("❌ AI parsing error for %s: %s", file_path.name, e)
+                    parsed = None
+                parsed = self._verify(text, file_path.name, parsed)
+                candidate_data = self._save_candidate(file_path, parsed) if parsed else None
+            elif text:
+                candidate_data = self.process_single_file(file_path, text)
+            else:
+                logger.error("❌ No text extracted from %s", file_path.name)
+            results.append(candidate_data)
+        
+        self.flush()
+        self._escalations_left = None
+        return self._collect(supported_files, results)
+    
+    def _find_files(self, input_dir: Optional[Path]) -> List[Path]:
+        """Supported resume files in input_dir (defaults to incoming_resumes)"""
         if input_dir is None:
             input_dir = self.input_dir
             
-        print(f"\n📄 PDF EXTRACTOR: Processing files from {input_dir}")
-        print("=" * 55)
+        logger.info("\n📄 PDF EXTRACTOR: Processing files from %s", input_dir)
+        logger.info("=" * 55)
         
         if not input_dir.exists():
-            print(f"❌ Directory {input_dir} not found")
+            logger.error("❌ Directory %s not found", input_dir)
             return []
         
         # Find all supported files
         supported_files = []
-        for ext in ['*.pdf', '*.txt', '*.text']:
+        for ext in SUPPORTED_PATTERNS:
             supported_files.extend(list(input_dir.glob(ext)))
         
         if not supported_files:
-            print(f"❌ No PDF or TXT files found in {input_dir}")
+            logger.error("❌ No PDF or TXT files found in %s", input_dir)
             return []
         
-        print(f"📋 Found {len(supported_files)} files to process")
-        
+        logger.info("📋 Found %s files to process", len(supported_files))
+        return supported_files
+    
+    @staticmethod
+    def _collect(files: List[Path], results: List[Optional[Dict]]) -> List[Dict]:
+        """Parsed candidates in file order, logging the files that failed"""
         processed_candidates = []
-        
-        for i, file_path in enumerate(supported_files, 1):
-            print(f"\n[{i}/{len(supported_files)}] Processing file...")
-            
-            candidate_data = self.process_single_file(file_path)
-            
+        for file_path, candidate_data in zip(files, results):
             if candidate_data:
                 processed_candidates.append(candidate_data)
             else:
-                print(f"⚠️ Skipped {file_path.name} due to processing errors")
+                logger.warning("⚠️ Skipped %s due to processing errors", file_path.name)
         
-        print(f"\n✅ PDF extraction complete: {len(processed_candidates)}/{len(supported_files)} files processed successfully")
+        logger.info("\n✅ PDF extraction complete: %s/%s files processed successfully", len(processed_candidates), len(files))
         
         return processed_candidates
     
+    def flush(self) -> None:
+        """Push buffered candidate lines out to the sink file"""
+        with self._sink_lock:
+            self._sink.flush()
+    
+    def close(self) -> None:
+        """Flush and close the candidates sink"""
+        with self._sink_lock:
+            self._sink.close()
+    
     def get_processing_summary(self, candidates: List[Dict]) -> Dict:
         """Generate processing summary statistics"""
         if not candidates:
             return {"total": 0, "with_email": 0, "with_linkedin": 0, "with_skills": 0}
         
+        # One pass over the candidates, counting every field at once
+        email = linkedin = skills = experience = education = skill_total = 0
+        for c in candidates:
+            email += bool(c.get('email'))
+            linkedin += bool(c.get('linkedin_url'))
+            candidate_skills = c.get('skills') or ()
+            skills += bool(candidate_skills)
+            skill_total += len(candidate_skills)
+            experience += bool(c.get('experience'))
+            education += bool(c.get('education'))
+        
         summary = {
             "total": len(candidates),
-            "with_email": len([c for c in candidates if c.get('email')]),
-            "with_linkedin": len([c for c in candidates if c.get('linkedin_url')]),
-            "with_skills": len([c for c in candidates if c.get('skills')]),
-            "with_experience": len([c for c in candidates if c.get('experience')]),
-            "with_education": len([c for c in candidates if c.get('education')]),
-            "avg_skills_per_candidate": sum(len(c.get('skills', [])) for c in candidates) / len(candidates)
+            "with_email": email,
+            "with_linkedin": linkedin,
+            "with_skills": skills,
+            "with_experience": experience,
+            "with_education": education,
+            "avg_skills_per_candidate": skill_total / len(candidates)
         }
         
         return summary
@@ -277,8 +506,10 @@ class PDFExtractor:
 
 def main():
     """Test the PDF Extractor independently"""
-    print("📄 TESTING PDF EXTRACTOR MODULE")
-    print("=" * 40)
+    configure_logging()
+    
+    logger.info("📄 TESTING PDF EXTRACTOR MODULE")
+    logger.info("=" * 40)
     
     extractor = PDFExtractor()
     
@@ -287,19 +518,19 @@ def main():
     
     # Show summary
     summary = extractor.get_processing_summary(candidates)
-    print(f"\n📊 PROCESSING SUMMARY:")
-    print(f"   Total candidates: {summary['total']}")
-    print(f"   With email: {summary['with_email']}")
-    print(f"   With LinkedIn: {summary['with_linkedin']}")
-    print(f"   With skills: {summary['with_skills']}")
-    print(f"   Avg skills per candidate: {summary['avg_skills_per_candidate']:.1f}")
+    logger.info("\n📊 PROCESSING SUMMARY:")
+    logger.info("   Total candidates: %s", summary['total'])
+    logger.info("   With email: %s", summary['with_email'])
+    logger.info("   With LinkedIn: %s", summary['with_linkedin'])
+    logger.info("   With skills: %s", summary['with_skills'])
+    logger.info("   Avg skills per candidate: %.1f", summary['avg_skills_per_candidate'])
     
     if candidates:
-        print(f"\n📋 Sample candidate:")
+        logger.info("\n📋 Sample candidate:")
         sample = candidates[0]
-        print(f"   Name: {sample.get('full_name')}")
-        print(f"   Email: {sample.get('email')}")
-        print(f"   Skills: {len(sample.get('skills', []))} extracted")
+        logger.info("   Name: %s", sample.get('full_name'))
+        logger.info("   Email: %s", sample.get('email'))
+        logger.info("   Skills: %s extracted", len(sample.get('skills', [])))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+🔁 RETRY MODULE
+Exponential backoff with jitter for rate-limited Composio / Google API calls
+
+A transient failure shows up either as a raised error (Composio HTTPError
+with a status code, a dropped connection, a timeout) or as a tool result of
+{"successful": False, "error": "... 429 / rateLimitExceeded ..."}. Both are
+retried; anything else is returned or raised straight away.
+
+CircuitBreaker covers the other side: a service that keeps failing is
+skipped for a while instead of costing every caller a full round of retries.
+"""
+
+import time
+import random
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+DEFAULT_RETRIES = 6
+DEFAULT_BASE_DELAY = 0.4  # seconds; doubled each attempt
+MAX_DELAY = 30.0
+
+# How Google's throttling / backend errors read inside a Composio tool result
+_RETRYABLE_MARKERS = (
+    "429", "too many requests", "rate limit", "ratelimitexceeded", "userratelimitexceeded",
+    "quota exceeded", "backenderror", "backend error", "service unavailable",
+)
+
+
+def _status_of(exc: BaseException) -> Optional[int]:
+    status = getattr(exc, "status_code", None) or getattr(exc, "status", None)
+    response = getattr(exc, "response", None)
+    if status is None and response is not None:
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _is_retryable_error(exc: BaseException) -> bool:
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout, TimeoutError)):
+        return True
+    if type(exc).__name__ == "SDKTimeoutError":  # composio's, without importing composio
+        return True
+    return _status_of(exc) in RETRYABLE_STATUS
+
+
+def _is_retryable_result(result: Any) -> bool:
+    if not isinstance(result, dict) or result.get("successful", True):
+        return False
+    error = str(result.get("error") or "").lower()
+    return any(marker in error for marker in _RETRYABLE_MARKERS)
+
+
+def _delay(attempt: int, base: float, exc: Optional[BaseException] = None) -> float:
+    """Backoff for this attempt, or the server's Retry-After when it sent one"""
+    response = getattr(exc, "response", None)
+    retry_after = getattr(response, "headers", {}).get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_DELAY)
+        except ValueError:
+            pass
+    return min(base * 2 ** attempt + random.random() * base, MAX_DELAY)
+
+
+def call_with_retry(fn: Callable, *args, retries: int = DEFAULT_RETRIES,
+                    base: float = DEFAULT_BASE_DELAY, **kwargs) -> Any:
+    """
+    Call `fn`, retrying throttled / transient failures with exponential backoff
+
+    Args:
+        fn: Callable to invoke, e.g. toolset.execute_action
+        retries: Maximum number of attempts
+        base: Initial backoff in seconds
+
+    Returns:
+        fn's result (the last one, if every attempt came back throttled)
+    """
+    for attempt in range(retries):
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == retries - 1 or not _is_retryable_error(e):
+                raise
+            delay = _delay(attempt, base, e)
+            logger.warning("⚠️ Transient API error (%s), retrying in %.1fs...", e, delay)
+        else:
+            if attempt == retries - 1 or not _is_retryable_result(result):
+                return result
+            delay = _delay(attempt, base)
+            logger.warning("⚠️ Rate limited (%s), retrying in %.1fs...", result.get("error"), delay)
+        time.sleep(delay)
+
+
+async def acall_with_retry(fn: Callable, *args, retries: int = DEFAULT_RETRIES,
+                           base: float = DEFAULT_BASE_DELAY, **kwargs) -> Any:
+    """
+    Async call_with_retry that backs off without blocking the loop
+
+    A coroutine function is awaited directly; a blocking `fn` runs in a thread.
+    """
+    for attempt in range(retries):
+        try:
+            if asyncio.iscoroutinefunction(fn):
+                result = await fn(*args, **kwargs)
+            else:
+                result = await asyncio.to_thread(fn, *args, **kwargs)
+        except Exception as e:
+            if attempt == retries - 1 or not _is_retryable_error(e):
+                raise
+            delay = _delay(attempt, base, e)
+            logger.warning("⚠️ Transient API error (%s), retrying in %.1fs...", e, delay)
+        else:
+            if attempt == retries - 1 or not _is_retryable_result(result):
+                return result
+            delay = _delay(attempt, base)
+            logger.warning("⚠️ Rate limited (%s), retrying in %.1fs...", result.get("error"), delay)
+        await asyncio.sleep(delay)
+
+
+class CircuitBreaker:
+    """
+    Skip calls to a service after repeated consecutive failures
+
+    After fail_max failures in a row the breaker opens and allow() returns
+    False for reset_timeout seconds. Then a single trial call is let through:
+    success closes the breaker, another failure keeps it open.
+    """
+
+    def __init__(self, name: str, fail_max: int = 5, reset_timeout: float = 60.0):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call should be attempted now"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._opened_at = time.monotonic()  # let this one trial through, hold the rest
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures < self.fail_max:
+                return
+            if self._opened_at is None:
+                logger.warning("⚠️ %s failed %s times in a row, skipping it for %.0fs",
+                               self.name, self._failures, self.reset_timeout)
+            self._opened_at = time.monotonic()